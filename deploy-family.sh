@@ -1,5 +1,5 @@
 #!/bin/bash
-# deploy-family.sh — Encrypt family pages and deploy to Netlify
+# deploy-family.sh — Encrypt changed family pages, build dist/ and deploy to Netlify
 #
 # Usage:
 #   STATICRYPT_PASSWORD="your-password" ./deploy-family.sh
@@ -10,48 +10,35 @@
 
 set -e
 
-FAMILY_FILES="family/index.html family/stories-mom-told.html family/stories-mom-wrote.html family/family-history.html family/family-tree.html family/memorial-video.html"
-
 if [ -z "$STATICRYPT_PASSWORD" ]; then
     echo "Error: STATICRYPT_PASSWORD environment variable is not set."
     echo "Usage: STATICRYPT_PASSWORD=your-password ./deploy-family.sh"
     exit 1
 fi
 
-# Strip surrounding quotes if present (some shells pass them as part of the value)
-STATICRYPT_PASSWORD="${STATICRYPT_PASSWORD#\'}"
-STATICRYPT_PASSWORD="${STATICRYPT_PASSWORD%\'}"
-STATICRYPT_PASSWORD="${STATICRYPT_PASSWORD#\"}"
-STATICRYPT_PASSWORD="${STATICRYPT_PASSWORD%\"}"
-
-echo "Encrypting family pages..."
+echo "Encrypting changed family pages..."
 echo "Password length: ${#STATICRYPT_PASSWORD} characters"
-npx staticrypt $FAMILY_FILES -p "$STATICRYPT_PASSWORD" --remember 30 -t family/password-template.html --template-title 'Horn Family' --template-button 'Enter' --template-instructions 'This area is for family members.' --template-error 'Incorrect password. Please try again.' --template-placeholder 'Family password' -d family --short
-
-echo ""
-echo "Verifying encryption..."
-if npx staticrypt --decrypt family/index.html -p "$STATICRYPT_PASSWORD" -d /tmp/staticrypt-verify > /dev/null 2>&1; then
-    echo "Verification passed — password decrypts correctly."
-    rm -rf /tmp/staticrypt-verify
-else
-    echo "ERROR: Verification FAILED — encrypted file cannot be decrypted with the given password!"
+# Re-encrypts only pages whose source changed (and verifies them); unchanged
+# pages reuse their cached ciphertext, so the deploy uploads nothing for them
+if ! python3 scripts/encrypt_family.py --no-install; then
     echo "Aborting deploy."
     exit 1
 fi
 
 echo ""
-echo "Deploying to Netlify..."
-netlify deploy --prod --dir=.
+echo "Updating the service worker..."
+# Precaches the current liturgical season, so rebuild it for every deploy
+python3 scripts/build_service_worker.py
 
 echo ""
-echo "Restoring source HTML files..."
-# Try git checkout first (works if files are committed), fall back to decrypt
-if git checkout -- $FAMILY_FILES 2>/dev/null; then
-    echo "Restored from git."
-else
-    npx staticrypt --decrypt $FAMILY_FILES -p "$STATICRYPT_PASSWORD" -d family
-    echo "Restored via decryption."
-fi
+echo "Building dist/..."
+# Family pages go into dist/ encrypted (from the cache encrypt_family.py
+# keeps); the pages in the tree stay plaintext
+python3 scripts/build_dist.py
+
+echo ""
+echo "Deploying to Netlify..."
+netlify deploy --prod --dir=dist
 
 echo ""
 echo "Done! Family pages are encrypted and deployed."
@@ -0,0 +1,148 @@
+// Offline reading: sw.js (built by scripts/build_service_worker.py) sits at
+// the site root next to this script. Not on localhost, where the preview
+// server should always show the current build
+if ('serviceWorker' in navigator && document.currentScript
+        && !['localhost', '127.0.0.1'].includes(location.hostname)) {
+    const workerUrl = new URL('sw.js', document.currentScript.src);
+    window.addEventListener('load', () => {
+        navigator.serviceWorker.register(workerUrl).catch(() => {});
+    });
+}
+
+// Year listings (chronological.html, by-year.html) hold only the newest
+// year's meditations; every other year has a placeholder linking to the
+// year's page (listings/YYYY.html), whose list is fetched when the
+// placeholder nears the viewport or its year is picked in the year navigation
+function loadShard(placeholder) {
+    if (!placeholder.shardRequest) {
+        const url = new URL(placeholder.dataset.shard, location.href);
+        placeholder.shardRequest = fetch(url)
+            .then(response => {
+                if (!response.ok) throw new Error(response.status);
+                return response.text();
+            })
+            .then(html => {
+                const list = new DOMParser().parseFromString(html, 'text/html').querySelector('.meditation-list');
+                if (!list) throw new Error('no meditation list');
+                // The year page's links lead up out of listings/
+                list.querySelectorAll('a[href]').forEach(link => {
+                    link.href = new URL(link.getAttribute('href'), url).href;
+                });
+                shardObserver.unobserve(placeholder);
+                placeholder.replaceWith(list);
+                observeNextShard();
+            })
+            .catch(() => {
+                placeholder.shardRequest = null;
+                showShardRetry(placeholder);
+            });
+    }
+    return placeholder.shardRequest;
+}
+
+// A year list that failed to load: say so and offer to try again, next to
+// the link to the year's page
+function showShardRetry(placeholder) {
+    const status = placeholder.querySelector('.year-shard-status');
+    if (!status || status.querySelector('.year-shard-retry')) return;
+    const retry = document.createElement('button');
+    retry.type = 'button';
+    retry.className = 'year-shard-retry';
+    retry.textContent = 'Try again';
+    const note = document.createElement('span');
+    note.append(' could not be loaded. ', retry);
+    retry.addEventListener('click', () => {
+        note.remove();
+        loadShard(placeholder);
+    });
+    status.append(note);
+}
+
+// Load the year list in or under an element, if it has not been loaded yet
+function loadShardIn(element) {
+    const placeholder = element.matches('[data-shard]') ? element : element.querySelector('[data-shard]');
+    return placeholder ? loadShard(placeholder) : Promise.resolve();
+}
+
+const shardObserver = new IntersectionObserver((entries) => {
+    entries.forEach(entry => {
+        if (entry.isIntersecting) loadShard(entry.target);
+    });
+}, { rootMargin: '800px 0px 800px 0px' });
+
+// Only the first year still to load is watched, and the next once it is in:
+// a placeholder is a line tall, so early in a year many of them start
+// within the margin, and they load one at a time rather than all at once
+function observeNextShard() {
+    const next = document.querySelector('[data-shard]');
+    if (next) shardObserver.observe(next);
+}
+
+observeNextShard();
+
+// Smooth scroll behavior for all links
+document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+    anchor.addEventListener('click', function (e) {
+        e.preventDefault();
+        const target = document.querySelector(this.getAttribute('href'));
+        if (target) {
+            if (target.querySelector('[data-shard]')) {
+                // Jump straight there, so the years passed over are not loaded too
+                loadShardIn(target).then(() => target.scrollIntoView({ block: 'start' }));
+                return;
+            }
+            target.scrollIntoView({
+                behavior: 'smooth',
+                block: 'start'
+            });
+        }
+    });
+});
+
+// A link into a year that is not loaded yet (by-year.html#2012)
+if (location.hash.length > 1) {
+    const target = document.getElementById(decodeURIComponent(location.hash.slice(1)));
+    if (target && target.querySelector('[data-shard]')) {
+        loadShardIn(target).then(() => target.scrollIntoView({ block: 'start' }));
+    }
+}
+
+// Add fade-in animation on scroll for elements
+const observerOptions = {
+    threshold: 0,
+    rootMargin: '0px 0px 500px 0px'  // Trigger 500px before element enters viewport
+};
+
+const observer = new IntersectionObserver((entries) => {
+    entries.forEach(entry => {
+        if (entry.isIntersecting) {
+            entry.target.style.opacity = '1';
+            entry.target.style.transform = 'translateY(0)';
+        }
+    });
+}, observerOptions);
+
+// Check if element is in or near viewport (with large buffer for upcoming sections)
+function isNearViewport(rect) {
+    const buffer = 800;  // Show sections that are within 800px of viewport
+    return rect.top < window.innerHeight + buffer && rect.bottom > -buffer;
+}
+
+// Observe sections for fade-in on scroll
+document.addEventListener('DOMContentLoaded', () => {
+    const sections = Array.from(document.querySelectorAll('section'));
+    // Measure every section before styling any, so layout runs once
+    const rects = sections.map(section => section.getBoundingClientRect());
+    sections.forEach((section, i) => {
+        // If section is already in or near viewport, show it immediately
+        if (isNearViewport(rects[i])) {
+            section.style.opacity = '1';
+            section.style.transform = 'translateY(0)';
+        } else {
+            section.style.opacity = '0';
+            section.style.transform = 'translateY(20px)';
+            section.style.transition = 'opacity 0.4s ease, transform 0.4s ease';
+            observer.observe(section);
+        }
+    });
+});
@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+"""
+Inline critical CSS and prune unused selectors, per page type.
+
+Every page blocked rendering on the whole of styles.css plus listing.css or
+meditation.css, and many listing pages carry large inline <style> blocks of
+their own. This stage:
+
+1. Indexes the classes, ids and elements used across all pages - in the
+   markup and in the pages' scripts, which add classes as they run.
+2. Drops the selectors no page uses from the shared stylesheets, and each
+   page's inline <style> rules that the page itself never uses.
+3. Groups pages by type - the stylesheets they link:
+       base        styles.css
+       listing     styles.css + listing.css
+       meditation  styles.css + meditation.css
+       search      styles.css + listing.css + meditation.css
+   and writes one pruned, minified bundle per type: css/<type>-page.<hash>.css
+4. Takes the rules matching the first FOLD_ELEMENTS elements on any page
+   of the type - roughly what is on screen before scrolling - and inlines
+   them in each page's head. The full bundle is loaded without blocking
+   rendering, at the position of the original <link>s so the cascade
+   order is unchanged.
+
+The result sits between <!-- critical-css --> markers in each page, and is
+replaced on every run. Run after regenerating pages, after
+fingerprint_assets.py and build_fonts.py.
+
+Usage:
+    python build_css.py [--dry-run]
+"""
+
+import re
+import hashlib
+import argparse
+from pathlib import Path
+from collections import defaultdict
+
+from fingerprint_assets import PAGE_GLOBS, HASH_LENGTH
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+
+CSS_DIR = PROJECT_ROOT / 'css'
+
+# Stylesheets for each page type, in link order
+PAGE_TYPES = {
+    'base': ['styles.css'],
+    'listing': ['styles.css', 'listing.css'],
+    'meditation': ['styles.css', 'meditation.css'],
+    'search': ['styles.css', 'listing.css', 'meditation.css'],
+}
+
+# Scripts whose class names count as used everywhere (search-worker.js
+# builds the highlighted snippets search.html shows)
+SHARED_SCRIPTS = ['script.js', 'search-worker.js']
+
+# Elements from the start of <body> counted as above the fold
+FOLD_ELEMENTS = 20
+
+BLOCK_START = '<!-- critical-css -->'
+BLOCK_END = '<!-- /critical-css -->'
+BLOCK_PATTERN = re.compile(
+    r'^([ \t]*)' + re.escape(BLOCK_START) + r'.*?' + re.escape(BLOCK_END) + r'\n',
+    re.DOTALL | re.MULTILINE,
+)
+# A run of <link>s to the shared stylesheets, plain or fingerprinted
+SHEET_LINK = r'<link rel="stylesheet" href="(?:\.\./)*(styles|listing|meditation)(?:\.[0-9a-f]{%d})?\.css">' % HASH_LENGTH
+LINKS_PATTERN = re.compile(r'^([ \t]*)' + SHEET_LINK + r'\n(?:[ \t]*' + SHEET_LINK + r'\n)*', re.MULTILINE)
+BUNDLE_TYPE_PATTERN = re.compile(r'href="(?:\.\./)*css/(\w+)-page\.[0-9a-f]+\.css"')
+
+STYLE_PATTERN = re.compile(r'(<style>)(.*?)(</style>)', re.DOTALL)
+SCRIPT_PATTERN = re.compile(r'<script[^>]*>(.*?)</script>', re.DOTALL)
+TAG_PATTERN = re.compile(r'<([a-zA-Z][\w-]*)')
+CLASS_ATTR_PATTERN = re.compile(r'\bclass="([^"]*)"')
+ID_ATTR_PATTERN = re.compile(r'\bid="([^"]*)"')
+TOKEN_PATTERN = re.compile(r'[A-Za-z_][\w-]*')
+
+
+# ============================================================================
+# CSS PARSING
+# ============================================================================
+
+class Rule:
+    """A style rule, or an at-rule with a block of nested rules (@media) or declarations."""
+
+    def __init__(self, prelude, body, start, end, children=None, prelude_start=None):
+        self.prelude = prelude      # selector list, or '@media ...'
+        self.body = body            # declarations (None for @media)
+        self.start = start          # span in the source, with the comments and
+        self.end = end              # whitespace before the rule
+        self.children = children
+        self.prelude_start = start if prelude_start is None else prelude_start
+
+    @property
+    def is_at_rule(self):
+        return self.prelude.startswith('@')
+
+
+def strip_comments(css):
+    """Comments blanked to spaces, so offsets still line up with the source."""
+    return re.sub(r'/\*.*?\*/', lambda m: ' ' * len(m.group(0)), css, flags=re.DOTALL)
+
+
+def matching_brace(css, i):
+    """Index of the brace closing the one at css[i], skipping strings."""
+    depth = 0
+    while i < len(css):
+        c = css[i]
+        if c in '"\'':
+            i = css.index(c, i + 1)
+        elif c == '{':
+            depth += 1
+        elif c == '}':
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    raise ValueError('unbalanced braces in CSS')
+
+
+def parse_css(css, offset=0):
+    """Top-level rules of a stylesheet; @media and @supports blocks are parsed recursively."""
+    clean = strip_comments(css)
+    rules = []
+    i = 0
+    while i < len(clean):
+        brace = clean.find('{', i)
+        semicolon = clean.find(';', i)
+        if brace == -1:
+            break
+        if clean[i:brace].strip().startswith('@') and semicolon != -1 and semicolon < brace:
+            # Statement at-rule: @import, @charset
+            rules.append(Rule(clean[i:semicolon].strip(), None, offset + i, offset + semicolon + 1))
+            i = semicolon + 1
+            continue
+        close = matching_brace(clean, brace)
+        prelude = clean[i:brace].strip()
+        prelude_start = offset + i + len(clean[i:brace]) - len(clean[i:brace].lstrip())
+        inner = css[brace + 1:close]
+        if prelude.startswith(('@media', '@supports')):
+            rules.append(Rule(prelude, None, offset + i, offset + close + 1,
+                              parse_css(inner, offset + brace + 1), prelude_start))
+        else:
+            rules.append(Rule(prelude, strip_comments(inner).strip(), offset + i, offset + close + 1,
+                              prelude_start=prelude_start))
+        i = close + 1
+    return rules
+
+
+def minify_declarations(body):
+    """Declarations with insignificant whitespace removed (strings left alone)."""
+    parts = re.split(r'("[^"]*"|\'[^\']*\')', body)
+    for n in range(0, len(parts), 2):
+        text = re.sub(r'\s+', ' ', parts[n])
+        parts[n] = re.sub(r'\s*([:;,>{}])\s*', r'\1', text)
+    return ''.join(parts).strip().rstrip(';')
+
+
+def minify(rules):
+    """Rules as compact CSS."""
+    out = []
+    for rule in rules:
+        prelude = re.sub(r'\s+', ' ', rule.prelude)
+        if rule.children is not None:
+            out.append(f"{prelude}{{{minify(rule.children)}}}")
+        elif rule.body is None:
+            out.append(prelude + ';')
+        elif rule.is_at_rule:
+            out.append(f"{prelude}{{{minify_declarations(rule.body)}}}")
+        else:
+            selectors = ','.join(s.strip() for s in prelude.split(','))
+            out.append(f"{selectors}{{{minify_declarations(rule.body)}}}")
+    return ''.join(out)
+
+
+# ============================================================================
+# SELECTOR USAGE
+# ============================================================================
+
+class Usage:
+    """Classes, ids and element names present in some markup."""
+
+    def __init__(self):
+        self.classes = set()
+        self.ids = set()
+        self.tags = {'html', 'body'}
+
+    def update(self, other):
+        self.classes |= other.classes
+        self.ids |= other.ids
+        self.tags |= other.tags
+
+    def add_markup(self, markup):
+        self.tags.update(t.lower() for t in TAG_PATTERN.findall(markup))
+        for value in CLASS_ATTR_PATTERN.findall(markup):
+            self.classes.update(value.split())
+        self.ids.update(ID_ATTR_PATTERN.findall(markup))
+
+    def add_script(self, script):
+        """Any word in a script may be a class, id or element it creates (HTML strings, createElement, D3)."""
+        tokens = set(TOKEN_PATTERN.findall(script))
+        self.classes |= tokens
+        self.ids |= tokens
+        self.tags.update(t.lower() for t in tokens)
+
+
+def compound_matches(compound, usage):
+    tag = re.match(r'[a-zA-Z][\w-]*', compound)
+    if tag and tag.group(0).lower() not in usage.tags:
+        return False
+    return (all(c in usage.classes for c in re.findall(r'\.([\w-]+)', compound))
+            and all(i in usage.ids for i in re.findall(r'#([\w-]+)', compound)))
+
+
+def selector_matches(selector, usage):
+    """Whether every part of a selector is present; pseudo-classes and attributes are ignored."""
+    bare = re.sub(r'::?[\w-]+(?:\([^)]*\))?', '', selector)
+    bare = re.sub(r'\[[^\]]*\]', '', bare)
+    return all(compound_matches(c, usage) for c in re.split(r'\s*[>+~]\s*|\s+', bare.strip()) if c)
+
+
+def prune(rules, usage, keep_at_rules=True):
+    """
+    Rules with the selectors usage does not match removed. Returns new
+    Rule objects; @keyframes and other declaration at-rules are kept.
+    """
+    kept = []
+    for rule in rules:
+        if rule.children is not None:
+            children = prune(rule.children, usage, keep_at_rules)
+            if children:
+                kept.append(Rule(rule.prelude, None, rule.start, rule.end, children, rule.prelude_start))
+        elif rule.is_at_rule:
+            if keep_at_rules:
+                kept.append(rule)
+        else:
+            selectors = [s.strip() for s in rule.prelude.split(',')]
+            used = [s for s in selectors if selector_matches(s, usage)]
+            if used:
+                prelude = rule.prelude if len(used) == len(selectors) else ', '.join(used)
+                kept.append(Rule(prelude, rule.body, rule.start, rule.end, prelude_start=rule.prelude_start))
+    return kept
+
+
+def flatten(rules):
+    for rule in rules:
+        if rule.children is not None:
+            yield from flatten(rule.children)
+        else:
+            yield rule
+
+
+def critical_rules(rules, usage):
+    """Rules matching the above-the-fold usage, with the @keyframes they animate."""
+    critical = prune(rules, usage, keep_at_rules=False)
+    declarations = ' '.join(r.body for r in flatten(critical) if r.body)
+    keyframes = [r for r in rules if r.prelude.startswith('@keyframes')
+                 and re.search(r'\b' + re.escape(r.prelude.split()[-1]) + r'\b', declarations)]
+    return critical + keyframes
+
+
+def prune_source(css, rules, kept, start=0, end=None):
+    """
+    css[start:end] with pruned rules cut out and shortened selector lists
+    rewritten, keeping the original formatting of everything else.
+    """
+    end = len(css) if end is None else end
+    kept_by_start = {r.start: r for r in kept}
+    pieces = []
+    position = start
+    for rule in rules:
+        pieces.append(css[position:rule.start])
+        position = rule.end
+        survivor = kept_by_start.get(rule.start)
+        if survivor is None:
+            # Dropped along with the comments and whitespace before it
+            continue
+        brace = css.index('{', rule.prelude_start) if rule.body is not None or rule.children is not None else None
+        if rule.children is not None:
+            pieces += [css[rule.start:brace + 1],
+                       prune_source(css, rule.children, survivor.children, brace + 1, rule.end - 1), '}']
+        elif survivor.prelude != rule.prelude:
+            pieces += [css[rule.start:rule.prelude_start], survivor.prelude + ' ', css[brace:rule.end]]
+        else:
+            pieces.append(css[rule.start:rule.end])
+    pieces.append(css[position:end])
+    return ''.join(pieces)
+
+
+# ============================================================================
+# PAGES
+# ============================================================================
+
+def page_type(content):
+    """The page's type from its stylesheet links (or the bundle it already uses), or None."""
+    bundle = BUNDLE_TYPE_PATTERN.search(content)
+    if bundle:
+        return bundle.group(1)
+    match = LINKS_PATTERN.search(content)
+    if not match:
+        return None
+    sheets = [f'{name}.css' for name in re.findall(SHEET_LINK, match.group(0))]
+    for name, type_sheets in PAGE_TYPES.items():
+        if sheets == type_sheets:
+            return name
+    return None
+
+
+def page_usage(content, fold=None):
+    """Usage in a page's body (its first fold elements, if given) and scripts."""
+    usage = Usage()
+    body = content[content.find('<body'):] if '<body' in content else content
+    scripts = SCRIPT_PATTERN.findall(body)
+    markup = STYLE_PATTERN.sub('', SCRIPT_PATTERN.sub('', body))
+    if fold:
+        # <body> itself, then fold elements
+        tags = list(TAG_PATTERN.finditer(markup))
+        if len(tags) > fold + 1:
+            markup = markup[:tags[fold + 1].start()]
+    usage.add_markup(markup)
+    if fold is None:
+        for script in scripts:
+            usage.add_script(script)
+    return usage
+
+
+def render_block(indent, critical, bundle_href):
+    return (f'{indent}{BLOCK_START}\n'
+            f'{indent}<style>{critical}</style>\n'
+            f'{indent}<link rel="preload" href="{bundle_href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+            f'{indent}<noscript><link rel="stylesheet" href="{bundle_href}"></noscript>\n'
+            f'{indent}{BLOCK_END}\n')
+
+
+def replace_links(content, block):
+    """Swap a page's stylesheet links (or its previous block) for a new block."""
+    pattern = BLOCK_PATTERN if BLOCK_START in content else LINKS_PATTERN
+    return pattern.sub(lambda m: block(m.group(1)), content, count=1)
+
+
+def prune_inline_styles(content, usage):
+    """A page's inline <style> blocks with the rules it never uses removed."""
+    def prune_block(match):
+        css = match.group(2)
+        rules = parse_css(css)
+        return match.group(1) + prune_source(css, rules, prune(rules, usage)) + match.group(3)
+    head_end = content.find('</head>')
+    return STYLE_PATTERN.sub(prune_block, content[:head_end]) + content[head_end:]
+
+
+def page_prefix(page):
+    return '../' * (len(page.relative_to(PROJECT_ROOT).parts) - 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inline critical CSS and prune unused selectors')
+    parser.add_argument('--dry-run', '-n', action='store_true',
+                        help='Report the savings without writing files')
+    args = parser.parse_args()
+
+    sheets = {name: (PROJECT_ROOT / name).read_text(encoding='utf-8')
+              for name in sorted({s for type_sheets in PAGE_TYPES.values() for s in type_sheets})}
+    sheet_rules = {name: parse_css(css) for name, css in sheets.items()}
+
+    # Selector usage index: every page, all of it
+    pages = sorted(p for pattern in PAGE_GLOBS for p in PROJECT_ROOT.glob(pattern))
+    contents = {page: page.read_text(encoding='utf-8') for page in pages}
+    types = {page: page_type(content) for page, content in contents.items()}
+    shared = Usage()
+    for name in SHARED_SCRIPTS:
+        shared.add_script((PROJECT_ROOT / name).read_text(encoding='utf-8'))
+
+    site_usage = Usage()
+    site_usage.update(shared)
+    usages = {}
+    fold_usage = defaultdict(Usage)
+    for page, content in contents.items():
+        usages[page] = page_usage(content)
+        usages[page].update(shared)
+        site_usage.update(usages[page])
+        if types[page]:
+            fold_usage[types[page]].update(page_usage(content, FOLD_ELEMENTS))
+
+    pruned = {name: prune(rules, site_usage) for name, rules in sheet_rules.items()}
+    removed = sum(len(list(flatten(sheet_rules[n]))) - len(list(flatten(pruned[n]))) for n in sheets)
+    print(f"{'DRY RUN - ' if args.dry_run else ''}Indexed {len(pages)} pages: "
+          f"{len(site_usage.classes)} class names, {len(site_usage.tags)} elements")
+    print(f"  Shared stylesheets: {removed} unused rules dropped")
+
+    bundles = {}
+    criticals = {}
+    for name, type_sheets in PAGE_TYPES.items():
+        bundle = ''.join(minify(pruned[s]) for s in type_sheets).encode('utf-8')
+        bundle_name = f"{name}-page.{hashlib.sha256(bundle).hexdigest()[:HASH_LENGTH]}.css"
+        bundles[name] = (bundle_name, bundle)
+        criticals[name] = ''.join(minify(critical_rules(pruned[s], fold_usage[name])) for s in type_sheets)
+
+    before = defaultdict(list)
+    after = defaultdict(list)
+    updated = 0
+    for page, content in contents.items():
+        kind = types[page]
+        if kind is None:
+            continue
+        inline_before = sum(len(m.group(2)) for m in STYLE_PATTERN.finditer(content[:content.find('</head>')]))
+        if BLOCK_START not in content:
+            before[kind].append(sum(len(sheets[s]) for s in PAGE_TYPES[kind]) + inline_before)
+
+        bundle_href = page_prefix(page) + 'css/' + bundles[kind][0]
+        new_content = replace_links(content, lambda indent: render_block(indent, criticals[kind], bundle_href))
+        new_content = prune_inline_styles(new_content, usages[page])
+        after[kind].append(sum(len(m.group(2)) for m in
+                               STYLE_PATTERN.finditer(new_content[:new_content.find('</head>')])))
+        if new_content != content:
+            updated += 1
+            if not args.dry_run:
+                page.write_text(new_content, encoding='utf-8')
+
+    for kind in PAGE_TYPES:
+        if not after[kind]:
+            continue
+        average_after = sum(after[kind]) // len(after[kind])
+        summary = f"  {kind}: {len(after[kind])} pages, bundle {len(bundles[kind][1]):,} bytes, " \
+                  f"render-blocking CSS {average_after:,} bytes per page"
+        if before[kind]:
+            summary += f" (was {sum(before[kind]) // len(before[kind]):,})"
+        print(summary)
+    print(f"  {'Would update' if args.dry_run else 'Updated'} {updated} of {len(pages)} pages")
+    if args.dry_run:
+        return
+
+    CSS_DIR.mkdir(exist_ok=True)
+    current = {name for name, _ in bundles.values()}
+    for name, data in bundles.values():
+        if not (CSS_DIR / name).exists():
+            (CSS_DIR / name).write_bytes(data)
+    for path in CSS_DIR.glob('*-page.*.css'):
+        if path.name not in current:
+            path.unlink()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Build the deployable copy of the site in dist/: minified and precompressed.
+
+The generated pages are written with generous indentation - the big
+indexes (scripture-index.html, by-year.html, chronological.html) are mostly
+whitespace. The pages in the tree stay readable, since the build scripts
+edit them in place; this final stage writes the published copy:
+
+1. Every page is minified: comments dropped, runs of whitespace collapsed
+   to one space, and removed altogether next to block-level tags. <pre>,
+   <textarea>, <script> and <style> contents and the tags themselves are
+   left exactly as they are, so inline text renders the same.
+2. Every other site file is copied unchanged.
+3. Text files get .gz and (with the brotli module) .br siblings, which
+   preview_server.py and hosts that serve precompressed files send as-is.
+
+Files are processed in parallel across all cores, and only files whose
+output changed are rewritten and recompressed, so this never holds up the
+page generators. Development files (scripts, backups, this README) are
+left out, and so is anything git ignores: the files published are the ones
+git lists as tracked or new.
+
+Family pages are taken only in encrypted form: from the staticrypt cache
+that encrypt_family.py keeps, when it matches the current page, or as-is
+if the page in the tree is already encrypted. A page with neither is left
+out, so dist/ never holds a plaintext family page.
+
+Usage:
+    python build_dist.py [--jobs N] [--dry-run]
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import subprocess
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+from build_fragments import brotli, compressed_variants
+from encrypt_family import (CACHE_DIR, FAMILY_DIR, FAMILY_PAGES, is_encrypted,
+                            MANIFEST as ENCRYPTION_MANIFEST, sha256)
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+
+DIST_DIR = PROJECT_ROOT / 'dist'
+
+# Top-level entries that are not part of the site
+EXCLUDE = {
+    'Text', 'backups', 'dist', 'node_modules', 'scripts', 'threads-of-grace-website',
+    'README.md', 'deploy-family.sh', 'package.json', 'package-lock.json', 'requests.jsonl',
+}
+EXCLUDE_DIRS = [Path('fonts') / 'source']
+COMPRESSED_SUFFIXES = ('.gz', '.br')
+
+COMPRESSIBLE = {'.html', '.css', '.js', '.json', '.txt', '.svg', '.xml', '.md', '.ged'}
+# Smaller files gain little from compression
+MIN_COMPRESS_SIZE = 1024
+
+PRESERVE_PATTERN = re.compile(r'<(pre|textarea|script|style)\b[^>]*>.*?</\1>', re.DOTALL | re.IGNORECASE)
+COMMENT_PATTERN = re.compile(r'<!--(?!\[if).*?-->', re.DOTALL)
+TAG_SPLIT_PATTERN = re.compile(r'(<[^>]*>)')
+
+# Elements rendered as blocks (or not at all) by default, so whitespace
+# next to their tags never shows
+BLOCK_TAGS = [
+    'html', 'head', 'body', 'title', 'meta', 'link', 'base', 'noscript',
+    'header', 'footer', 'main', 'nav', 'section', 'article', 'aside',
+    'p', 'h[1-6]', 'ul', 'ol', 'dl', 'dt', 'dd', 'blockquote', 'figure', 'figcaption',
+    'table', 'thead', 'tbody', 'tfoot', 'tr', 'hr', 'br', 'form', 'fieldset',
+]
+BLOCK_EDGE_PATTERN = re.compile(r'\s*(</?(?:%s)\b[^>]*>)\s*' % '|'.join(BLOCK_TAGS), re.IGNORECASE)
+
+
+# ============================================================================
+# MINIFICATION
+# ============================================================================
+
+def minify_markup(markup):
+    """Markup outside preserved elements: comments gone, text whitespace collapsed."""
+    markup = COMMENT_PATTERN.sub('', markup)
+    parts = TAG_SPLIT_PATTERN.split(markup)
+    # Even indexes are text between tags; tags are kept as written
+    for i in range(0, len(parts), 2):
+        parts[i] = re.sub(r'\s+', ' ', parts[i])
+    return BLOCK_EDGE_PATTERN.sub(r'\1', ''.join(parts))
+
+
+def minify_html(html):
+    """Minified page; <pre>, <textarea>, <script> and <style> elements are kept verbatim."""
+    pieces = []
+    position = 0
+    for match in PRESERVE_PATTERN.finditer(html):
+        before = minify_markup(html[position:match.start()])
+        if match.group(1).lower() != 'textarea':
+            # The other preserved elements are blocks or invisible
+            before = before.rstrip()
+        pieces += [before, match.group(0)]
+        position = match.end()
+        if match.group(1).lower() != 'textarea':
+            while position < len(html) and html[position].isspace():
+                position += 1
+    pieces.append(minify_markup(html[position:]))
+    return ''.join(pieces).strip() + '\n'
+
+
+# ============================================================================
+# BUILD
+# ============================================================================
+
+def candidate_files():
+    """
+    Every file git would commit: tracked, or new and not ignored - so build
+    outputs not yet committed are published, and local artifacts that
+    .gitignore covers (all_meditations.pack, dist/) never are.
+    """
+    result = subprocess.run(['git', 'ls-files', '-z', '--cached', '--others', '--exclude-standard'],
+                            cwd=PROJECT_ROOT, capture_output=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.decode('utf-8', 'replace').strip() or 'git ls-files failed')
+    names = {name for name in result.stdout.decode('utf-8').split('\0') if name}
+    return [PROJECT_ROOT / name for name in sorted(names)]
+
+
+def site_files():
+    """[(relative path, source path)] of everything to publish, except family pages."""
+    files = []
+    for path in candidate_files():
+        rel = path.relative_to(PROJECT_ROOT)
+        if (not path.is_file() or rel.parts[0] in EXCLUDE
+                or any(part.startswith('.') for part in rel.parts)
+                or any(d in rel.parents for d in EXCLUDE_DIRS)
+                or path.suffix in COMPRESSED_SUFFIXES
+                or (rel.parent == Path('family') and path.suffix == '.html')):
+            continue
+        files.append((rel, path))
+    return files
+
+
+def family_files():
+    """
+    [(relative path, source path)] of the encrypted family pages, and the
+    pages left out because no encrypted copy matches them.
+    """
+    pages = {}
+    if ENCRYPTION_MANIFEST.exists():
+        with open(ENCRYPTION_MANIFEST, 'r', encoding='utf-8') as f:
+            pages = json.load(f).get('pages', {})
+
+    files = []
+    missing = []
+    for page in FAMILY_PAGES:
+        source = FAMILY_DIR / page
+        data = source.read_bytes()
+        cached = CACHE_DIR / page
+        if is_encrypted(data):
+            files.append((Path('family') / page, source))
+        elif pages.get(page) == sha256(data) and cached.exists():
+            files.append((Path('family') / page, cached))
+        else:
+            missing.append(page)
+    return files, missing
+
+
+def build_file(rel, source):
+    """
+    Write one file to dist/ (minified if a page) and its compressed
+    siblings, if its output changed. Returns (rel, source bytes, output
+    bytes, {suffix: compressed bytes}, changed).
+    """
+    data = source.read_bytes()
+    source_size = len(data)
+    if source.suffix == '.html':
+        data = minify_html(data.decode('utf-8')).encode('utf-8')
+
+    dest = DIST_DIR / rel
+    changed = not dest.exists() or dest.read_bytes() != data
+    if changed:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_bytes(data)
+
+    compressed = {}
+    if source.suffix in COMPRESSIBLE and len(data) >= MIN_COMPRESS_SIZE:
+        siblings = {suffix: dest.with_name(dest.name + suffix) for suffix in COMPRESSED_SUFFIXES}
+        expected = COMPRESSED_SUFFIXES if brotli is not None else COMPRESSED_SUFFIXES[:1]
+        if changed or not all(siblings[s].exists() for s in expected):
+            for suffix, variant in compressed_variants(data):
+                siblings[suffix].write_bytes(variant)
+        compressed = {s: siblings[s].stat().st_size for s in expected}
+    return rel, source_size, len(data), compressed, changed
+
+
+def build_file_task(task):
+    return build_file(*task)
+
+
+def remove_stale(expected):
+    """Delete files in dist/ that are no longer part of the site. Returns how many."""
+    removed = 0
+    for path in sorted(DIST_DIR.rglob('*'), reverse=True):
+        if path.is_file():
+            rel = path.relative_to(DIST_DIR)
+            base = rel.with_suffix('') if path.suffix in COMPRESSED_SUFFIXES else rel
+            if base not in expected:
+                path.unlink()
+                removed += 1
+        elif path.is_dir() and not any(path.iterdir()):
+            path.rmdir()
+    return removed
+
+
+def megabytes(n):
+    return f"{n / 1_000_000:,.2f} MB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the minified, precompressed site in dist/')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count(),
+                        help='Worker processes (default: one per core)')
+    parser.add_argument('--dry-run', '-n', action='store_true',
+                        help='List what would be published without writing files')
+    args = parser.parse_args()
+
+    try:
+        files = site_files()
+    except (OSError, RuntimeError) as e:
+        print(f"Error: cannot list the site files with git ({e}); run from a git checkout")
+        sys.exit(1)
+    family, missing = family_files()
+    files += family
+    print(f"{'DRY RUN - ' if args.dry_run else ''}Publishing {len(files)} files to {DIST_DIR.name}/ "
+          f"with {args.jobs} workers...")
+    for page in missing:
+        print(f"  Skipped family/{page}: no encrypted copy (run encrypt_family.py)")
+    if brotli is None:
+        print("  brotli not installed - writing .gz variants only (pip install brotli)")
+    if args.dry_run:
+        return
+
+    DIST_DIR.mkdir(exist_ok=True)
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        results = list(pool.map(build_file_task, files, chunksize=32))
+    removed = remove_stale({rel for rel, _ in files})
+
+    totals = {}
+    for rel, source_size, size, compressed, changed in results:
+        kind = 'pages' if rel.suffix == '.html' else 'other'
+        total = totals.setdefault(kind, {'count': 0, 'source': 0, 'size': 0, '.gz': 0, '.br': 0, 'changed': 0})
+        total['count'] += 1
+        total['source'] += source_size
+        total['size'] += size
+        total['changed'] += changed
+        for suffix in COMPRESSED_SUFFIXES:
+            total[suffix] += compressed.get(suffix, size)
+
+    for kind, total in totals.items():
+        line = (f"  {kind.capitalize()}: {total['count']} files, {megabytes(total['source'])}"
+                + (f" -> {megabytes(total['size'])} minified" if kind == 'pages' else '')
+                + f" -> {megabytes(total['.gz'])} gzip")
+        if brotli is not None:
+            line += f", {megabytes(total['.br'])} brotli"
+        print(line + f" ({total['changed']} updated)")
+
+    largest = sorted((r for r in results if r[0].suffix == '.html'), key=lambda r: -r[1])[:3]
+    for rel, source_size, size, compressed, _ in largest:
+        best = min(compressed.values()) if compressed else size
+        print(f"    {rel}: {source_size // 1024:,} KB -> {size // 1024:,} KB -> {best // 1024:,} KB compressed")
+    if removed:
+        print(f"  Removed {removed} stale files")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Build self-hosted, subsetted web fonts for the site.
+
+Every page loaded Crimson Pro and Cormorant Garamond from Google Fonts: two
+extra connections and a render-blocking stylesheet before first paint. This
+builds the same faces from the font files vendored in fonts/source/:
+
+1. Scan every page and script for the characters the site actually uses
+   (plus printable ASCII, so new text rarely needs a rebuild).
+2. Subset each face in FACES to those characters as WOFF2, named by
+   content hash: fonts/crimson-pro-400.1c9e2b7a40.woff2
+3. Write fonts/fonts.<hash>.css with an @font-face rule for each.
+4. Record the new names in asset-manifest.json and point every page's font
+   <link>s at them, preloading the faces used above the fold.
+
+Until the fonts have been built, font_links() - which the page generators
+use - keeps the Google Fonts links, so pages work either way.
+
+Source files are static instances of each family's Google Fonts variable
+font (SIL Open Font License, texts alongside), one per face, e.g.
+fonts/source/CrimsonPro-Light.ttf.
+
+Requires fontTools and brotli:
+    pip install fonttools brotli
+
+Usage:
+    python build_fonts.py [--dry-run]
+"""
+
+import io
+import re
+import sys
+import json
+import html
+import hashlib
+import argparse
+from pathlib import Path
+
+from fingerprint_assets import MANIFEST_NAME, PAGE_GLOBS, asset_names
+
+try:
+    from fontTools import subset
+except ImportError:
+    subset = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+
+FONTS_DIR = PROJECT_ROOT / 'fonts'
+SOURCE_DIR = FONTS_DIR / 'source'
+
+# (family, style, weight, source file) - the faces the Google Fonts link requested
+FACES = [
+    ('Cormorant Garamond', 'normal', 300, 'CormorantGaramond-Light.ttf'),
+    ('Cormorant Garamond', 'normal', 400, 'CormorantGaramond-Regular.ttf'),
+    ('Cormorant Garamond', 'normal', 600, 'CormorantGaramond-SemiBold.ttf'),
+    ('Cormorant Garamond', 'italic', 300, 'CormorantGaramond-LightItalic.ttf'),
+    ('Cormorant Garamond', 'italic', 400, 'CormorantGaramond-Italic.ttf'),
+    ('Crimson Pro', 'normal', 300, 'CrimsonPro-Light.ttf'),
+    ('Crimson Pro', 'normal', 400, 'CrimsonPro-Regular.ttf'),
+    ('Crimson Pro', 'normal', 600, 'CrimsonPro-SemiBold.ttf'),
+    ('Crimson Pro', 'italic', 300, 'CrimsonPro-LightItalic.ttf'),
+    ('Crimson Pro', 'italic', 400, 'CrimsonPro-Italic.ttf'),
+]
+
+# Where each family's static instances are downloaded (the zip's static/ folder)
+SOURCE_PAGES = {
+    'Cormorant Garamond': 'https://fonts.google.com/specimen/Cormorant+Garamond',
+    'Crimson Pro': 'https://fonts.google.com/specimen/Crimson+Pro',
+}
+
+# Faces every page paints first: body text and the display headings
+PRELOAD = [('Crimson Pro', 'normal', 400), ('Cormorant Garamond', 'normal', 300)]
+
+# Scanned for characters besides the pages
+SCRIPT_FILES = ['script.js', 'search-worker.js']
+
+FONTS_CSS = 'fonts.css'
+HASH_LENGTH = 10
+
+GOOGLE_FONT_LINKS = [
+    '<link rel="preconnect" href="https://fonts.googleapis.com">',
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>',
+    '<link href="https://fonts.googleapis.com/css2?family=Crimson+Pro:ital,wght@0,300;0,400;0,600;1,300;1,400'
+    '&family=Cormorant+Garamond:ital,wght@0,300;0,400;0,600;1,300;1,400&display=swap" rel="stylesheet">',
+]
+
+# A run of font <link> lines in a page head: Google Fonts or our own
+FONT_BLOCK_PATTERN = re.compile(
+    r'^([ \t]*)<link[^>]*(?:fonts\.googleapis\.com|fonts\.gstatic\.com|href="(?:\.\./)*fonts/)[^>]*>\n'
+    r'(?:[ \t]*<link[^>]*(?:fonts\.googleapis\.com|fonts\.gstatic\.com|href="(?:\.\./)*fonts/)[^>]*>\n)*',
+    re.MULTILINE,
+)
+
+
+# ============================================================================
+# LINKS
+# ============================================================================
+
+def face_key(family, style, weight):
+    """Manifest key of a face: fonts/crimson-pro-400.woff2, fonts/crimson-pro-300i.woff2."""
+    slug = family.lower().replace(' ', '-')
+    return f"fonts/{slug}-{weight}{'i' if style == 'italic' else ''}.woff2"
+
+
+def font_links(names, prefix='', indent='    '):
+    """
+    The font <link> tags for a page head (first line unindented): preloads
+    and the @font-face stylesheet once the fonts are built, the Google
+    Fonts links until then. prefix leads back to the site root ('../').
+    """
+    if FONTS_CSS not in names:
+        return f'\n{indent}'.join(GOOGLE_FONT_LINKS)
+    lines = [
+        f'<link rel="preload" href="{prefix}{names[face_key(*face)]}" as="font" type="font/woff2" crossorigin>'
+        for face in PRELOAD if face_key(*face) in names
+    ]
+    lines.append(f'<link rel="stylesheet" href="{prefix}{names[FONTS_CSS]}">')
+    return f'\n{indent}'.join(lines)
+
+
+def rewrite_font_links(text, names, prefix):
+    """Replace a page's font <link> block with the current one."""
+    return FONT_BLOCK_PATTERN.sub(
+        lambda m: m.group(1) + font_links(names, prefix, m.group(1)) + '\n', text, count=1)
+
+
+# ============================================================================
+# BUILD
+# ============================================================================
+
+def used_characters(pages):
+    """Every character in the pages and scripts, plus printable ASCII."""
+    chars = set(chr(c) for c in range(0x20, 0x7f))
+    for path in pages + [PROJECT_ROOT / name for name in SCRIPT_FILES]:
+        chars.update(html.unescape(path.read_text(encoding='utf-8')))
+    return sorted(c for c in chars if c.isprintable())
+
+
+def hashed_name(stem, ext, data):
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}.{ext}"
+
+
+def subset_face(source, chars):
+    """WOFF2 bytes of a font file cut down to the given characters."""
+    options = subset.Options()
+    options.flavor = 'woff2'
+    options.layout_features = ['*']
+    options.name_IDs = ['*']
+    options.notdef_outline = True
+    font = subset.load_font(str(source), options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=[ord(c) for c in chars])
+    subsetter.subset(font)
+    buffer = io.BytesIO()
+    subset.save_font(font, buffer, options)
+    return buffer.getvalue()
+
+
+def render_css(faces):
+    """@font-face rules for [(family, style, weight, file name)]."""
+    rules = ['/* Generated by scripts/build_fonts.py - do not edit */']
+    for family, style, weight, name in faces:
+        rules.append(f'''
+@font-face {{
+    font-family: '{family}';
+    font-style: {style};
+    font-weight: {weight};
+    font-display: swap;
+    src: url({name}) format('woff2');
+}}''')
+    return '\n'.join(rules) + '\n'
+
+
+def page_prefix(page):
+    """Relative path from a page back to the site root."""
+    return '../' * (len(page.relative_to(PROJECT_ROOT).parts) - 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build self-hosted, subsetted web fonts')
+    parser.add_argument('--dry-run', '-n', action='store_true',
+                        help='Report what would be built without writing files')
+    args = parser.parse_args()
+
+    if subset is None or brotli is None:
+        print("Error: fontTools and brotli are required (pip install fonttools brotli)")
+        sys.exit(1)
+    missing = [(family, f) for family, _, _, f in FACES if not (SOURCE_DIR / f).exists()]
+    if missing:
+        print(f"Error: font files missing from {SOURCE_DIR}:")
+        for _, name in missing:
+            print(f"  {name}")
+        print("Download the families and copy these files from their static/ folders:")
+        for family in dict.fromkeys(family for family, _ in missing):
+            print(f"  {family}: {SOURCE_PAGES[family]}")
+        sys.exit(1)
+
+    pages = sorted(p for pattern in PAGE_GLOBS for p in PROJECT_ROOT.glob(pattern))
+    chars = used_characters(pages)
+    print(f"{'DRY RUN - ' if args.dry_run else ''}Subsetting {len(FACES)} faces "
+          f"to {len(chars)} characters used across {len(pages)} pages...")
+
+    outputs = {}
+    faces = []
+    source_bytes = 0
+    for family, style, weight, filename in FACES:
+        source = SOURCE_DIR / filename
+        data = subset_face(source, chars)
+        key = face_key(family, style, weight)
+        name = hashed_name(Path(key).name[:-len('.woff2')], 'woff2', data)
+        outputs[name] = data
+        faces.append((family, style, weight, name))
+        source_bytes += source.stat().st_size
+        print(f"  {name}: {source.stat().st_size // 1024} KB -> {len(data) // 1024} KB")
+
+    css = render_css(faces).encode('utf-8')
+    css_name = hashed_name('fonts', 'css', css)
+    outputs[css_name] = css
+    print(f"  {css_name}; {source_bytes // 1024} KB of fonts -> "
+          f"{sum(len(d) for d in outputs.values()) // 1024} KB")
+    if args.dry_run:
+        return
+
+    for name, data in outputs.items():
+        path = FONTS_DIR / name
+        if not path.exists():
+            path.write_bytes(data)
+    # Output from earlier builds
+    for path in FONTS_DIR.iterdir():
+        if path.is_file() and path.name not in outputs:
+            path.unlink()
+
+    manifest_path = PROJECT_ROOT / MANIFEST_NAME
+    manifest = {}
+    if manifest_path.exists():
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    manifest = {k: v for k, v in manifest.items() if not k.startswith('fonts')}
+    manifest[FONTS_CSS] = f'fonts/{css_name}'
+    for family, style, weight, name in faces:
+        manifest[face_key(family, style, weight)] = f'fonts/{name}'
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+        f.write('\n')
+
+    names = asset_names()
+    updated = 0
+    for page in pages:
+        text = page.read_text(encoding='utf-8')
+        new_text = rewrite_font_links(text, names, page_prefix(page))
+        if new_text != text:
+            page.write_text(new_text, encoding='utf-8')
+            updated += 1
+    print(f"Updated font links in {updated} of {len(pages)} pages")
+
+
+if __name__ == '__main__':
+    main()
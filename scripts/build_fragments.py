@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Build a reading-panel fragment for every meditation page.
+
+search.html used to fetch each full meditation page (head, header, footer
+and all) and run it through DOMParser just to lift out the header and the
+paragraphs. This writes that part alone, next to each page:
+
+    meditations/YYYY-MM-DD.json
+    {"displayDate", "title", "occasion", "readings", "paragraphs": [html, ...]}
+
+Header fields are plain text; paragraphs keep their inline markup. Each
+fragment also gets precompressed siblings - .json.gz always, .json.br when
+the brotli module is installed - which preview_server.py (and any host that
+serves precompressed files) sends as-is.
+
+Fragments whose content has not changed are left untouched.
+
+Usage:
+    python build_fragments.py [--dry-run]
+"""
+
+import sys
+import gzip
+import json
+import argparse
+from pathlib import Path
+
+from meditation_corpus import Corpus, CONTENT_MARKER, PARAGRAPH_PATTERN
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+
+# The paragraphs end at the first of these
+CONTENT_END_MARKERS = ('<div class="meditation-author"', '<!-- related-meditations -->', '<nav')
+
+
+def content_paragraphs(content):
+    """Inner HTML of each non-empty paragraph in a page's meditation-content."""
+    start = content.find(CONTENT_MARKER)
+    if start == -1:
+        return []
+    body = content[start:]
+    for marker in CONTENT_END_MARKERS:
+        end = body.find(marker)
+        if end != -1:
+            body = body[:end]
+    return [p.strip() for p in PARAGRAPH_PATTERN.findall(body) if p.strip()]
+
+
+def build_fragment(med):
+    """Fragment for one meditation, as compact UTF-8 JSON bytes."""
+    with open(med.path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    fragment = {
+        'displayDate': med.date_display,
+        'title': med.title,
+        'occasion': med.occasion_full,
+        'readings': med.readings,
+        'paragraphs': content_paragraphs(content),
+    }
+    return json.dumps(fragment, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def compressed_variants(data):
+    """(suffix, bytes) for each precompressed sibling."""
+    # mtime=0 keeps the .gz output identical across rebuilds
+    variants = [('.gz', gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append(('.br', brotli.compress(data, quality=11)))
+    return variants
+
+
+def write_fragment(path, data):
+    """Write a fragment and its compressed siblings if anything changed. Returns True if written."""
+    siblings = [path.with_name(path.name + suffix) for suffix in ('.gz', '.br')]
+    expected = siblings if brotli is not None else siblings[:1]
+    if path.exists() and path.read_bytes() == data and all(s.exists() for s in expected):
+        return False
+
+    path.write_bytes(data)
+    for suffix, compressed in compressed_variants(data):
+        path.with_name(path.name + suffix).write_bytes(compressed)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build reading-panel fragments for search.html')
+    parser.add_argument('--dry-run', '-n', action='store_true',
+                        help='Report what would change without writing files')
+    args = parser.parse_args()
+
+    meditations_dir = PROJECT_ROOT / 'meditations'
+    if not meditations_dir.exists():
+        print(f"Error: meditations directory not found: {meditations_dir}")
+        sys.exit(1)
+
+    corpus = Corpus.load(meditations_dir)
+    meditations = [m for m in corpus if m.date]
+    print(f"{'DRY RUN - ' if args.dry_run else ''}Building fragments for {len(meditations)} meditations...")
+    if brotli is None:
+        print("  brotli not installed - writing .gz variants only (pip install brotli)")
+
+    updated = 0
+    page_bytes = 0
+    fragment_bytes = 0
+    gzip_bytes = 0
+    for med in meditations:
+        data = build_fragment(med)
+        path = med.path.with_suffix('.json')
+        page_bytes += med.path.stat().st_size
+        fragment_bytes += len(data)
+        gzip_bytes += len(compressed_variants(data)[0][1])
+
+        if args.dry_run:
+            changed = not path.exists() or path.read_bytes() != data
+        else:
+            changed = write_fragment(path, data)
+        updated += changed
+
+    print(f"  {'Would update' if args.dry_run else 'Updated'}: {updated} fragments")
+    print(f"  Average size: {fragment_bytes // len(meditations):,} bytes "
+          f"({gzip_bytes // len(meditations):,} gzipped) vs {page_bytes // len(meditations):,} bytes per page")
+
+
+if __name__ == '__main__':
+    main()
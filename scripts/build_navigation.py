@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Build previous/next navigation for every meditation page.
+
+Meditation pages are generated with an empty meditation-nav (just the link
+back to chronological.html), so reading on meant returning to a listing
+page between meditations. This fills in three trails through the corpus:
+
+- by date: the meditation-nav itself, previous and next meditation
+- by season: the previous and next meditation of the same season, across
+  years (Advent 2012 leads on to Advent 2013)
+- by occasion: the same Sunday or feast in other years
+
+The season and occasion trails go in a <nav class="meditation-paths"> just
+below the meditation-nav. Each page also gets a <link rel="prefetch"> for
+the next meditation by date, so reading straight through loads instantly.
+
+regenerate_all_indexes.py runs this after writing the index pages; new
+pages from process_meditations_complete.py get their links then. Pages
+whose links have not changed are left untouched.
+
+Usage:
+    python build_navigation.py [--dry-run]
+"""
+
+import re
+import sys
+import argparse
+from pathlib import Path
+
+from meditation_corpus import Corpus
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+
+# The meditation-nav and, once built, the paths nav after it
+NAV_PATTERN = re.compile(
+    r'[ \t]*<nav class="meditation-nav">.*?</nav>\n'
+    r'(?:[ \t]*<nav class="meditation-paths"[^>]*>.*?</nav>\n)?',
+    re.DOTALL,
+)
+PREFETCH_PATTERN = re.compile(r'[ \t]*<link rel="prefetch"[^>]*>\n')
+HEAD_END = '</head>'
+
+
+def escape_html(text):
+    """Escape HTML special characters."""
+    return (text
+        .replace('&', '&amp;')
+        .replace('<', '&lt;')
+        .replace('>', '&gt;')
+        .replace('"', '&quot;'))
+
+
+def sequence_neighbors(meditations):
+    """{date: (previous, next)} along meditations, oldest first; either may be None."""
+    neighbors = {}
+    for i, med in enumerate(meditations):
+        prev_med = meditations[i - 1] if i > 0 else None
+        next_med = meditations[i + 1] if i + 1 < len(meditations) else None
+        neighbors[med.date] = (prev_med, next_med)
+    return neighbors
+
+
+def nav_link(med, direction, rel=True):
+    """A prev/next link to a meditation, or an empty placeholder."""
+    if med is None:
+        return '<span></span>'
+    title = escape_html(med.title)
+    text = f'← {title}' if direction == 'prev' else f'{title} →'
+    rel_attr = f' rel="{direction}"' if rel else ''
+    return (f'<a href="{med.filename}" class="{direction}"{rel_attr}'
+            f' title="{escape_html(med.date_display)}">{text}</a>')
+
+
+def render_nav(by_date, paths):
+    """
+    The meditation-nav for a page, plus the paths nav for season and
+    occasion neighbors that differ from the date ones.
+    paths is [(label, (previous, next))].
+    """
+    prev_med, next_med = by_date
+    html = f'''        <nav class="meditation-nav">
+            {nav_link(prev_med, 'prev')}
+            <a href="../chronological.html" class="back-to-list">All Meditations</a>
+            {nav_link(next_med, 'next')}
+        </nav>
+'''
+    paths = [(label, pair) for label, pair in paths if (pair[0] or pair[1]) and pair != by_date]
+    if not paths:
+        return html
+    html += '''        <nav class="meditation-paths" aria-label="Continue reading">
+'''
+    for label, (prev_med, next_med) in paths:
+        html += f'''            <div class="meditation-path">
+                {nav_link(prev_med, 'prev', rel=False)}
+                <span class="path-label">{escape_html(label)}</span>
+                {nav_link(next_med, 'next', rel=False)}
+            </div>
+'''
+    html += '''        </nav>
+'''
+    return html
+
+
+def inject_nav(content, nav, prefetch):
+    """Replace a page's navigation and prefetch hint. Returns new content or None."""
+    if not NAV_PATTERN.search(content):
+        return None
+    updated = NAV_PATTERN.sub(lambda m: nav, content, count=1)
+    updated = PREFETCH_PATTERN.sub('', updated)
+    if prefetch is not None:
+        updated = updated.replace(HEAD_END, f'    <link rel="prefetch" href="{prefetch.filename}">\n{HEAD_END}', 1)
+    return updated if updated != content else None
+
+
+def update_navigation(corpus, dry_run=False):
+    """Write the navigation into every meditation page. Returns the number of pages changed."""
+    meditations = [m for m in corpus if m.date]
+    by_date = sequence_neighbors(meditations)
+    by_season = {}
+    for season in corpus.by_season:
+        by_season.update(sequence_neighbors(corpus.season(season)))
+    by_occasion = {}
+    for occasion in corpus.by_occasion:
+        by_occasion.update(sequence_neighbors(corpus.occasion(occasion)))
+
+    updated = 0
+    for med in meditations:
+        paths = []
+        if med.season and med.date in by_season:
+            paths.append((f'More from {med.season}', by_season[med.date]))
+        if med.occasion and med.date in by_occasion:
+            paths.append((f'{med.occasion} in other years', by_occasion[med.date]))
+        nav = render_nav(by_date[med.date], paths)
+
+        with open(med.path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        new_content = inject_nav(content, nav, by_date[med.date][1])
+        if new_content is None:
+            continue
+        updated += 1
+        if not dry_run:
+            with open(med.path, 'w', encoding='utf-8') as f:
+                f.write(new_content)
+    return updated
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build previous/next navigation for meditation pages')
+    parser.add_argument('--dry-run', '-n', action='store_true',
+                        help='Report what would change without writing files')
+    args = parser.parse_args()
+
+    meditations_dir = PROJECT_ROOT / 'meditations'
+    if not meditations_dir.exists():
+        print(f"Error: meditations directory not found: {meditations_dir}")
+        sys.exit(1)
+
+    corpus = Corpus.load(meditations_dir)
+    print(f"{'DRY RUN - ' if args.dry_run else ''}Building navigation for {len(corpus)} pages...")
+    updated = update_navigation(corpus, args.dry_run)
+    print(f"  {'Would update' if args.dry_run else 'Updated'}: {updated} pages")
+
+
+if __name__ == '__main__':
+    main()
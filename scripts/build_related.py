@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Build "Related Meditations" links for every meditation page.
+
+Each meditation body is normalized with search_tokenizer (folding, stop
+words, stemming) and turned into a TF-IDF vector (a sparse SciPy matrix
+with one row per meditation). Cosine similarity for every pair is computed
+with batched sparse matrix products, and the top-k neighbors of every row
+are picked with argpartition - no Python loop over pairs - so this stays
+fast at tens of thousands of meditations.
+
+Outputs:
+- related-meditations.json: {date: [{date, title, score}, ...]}
+- A <aside class="related-meditations"> block in each meditation page,
+  between the content and the navigation. Pages whose related list has not
+  changed are left untouched.
+
+Usage:
+    python build_related.py [--top 5] [--dry-run]
+"""
+
+import re
+import sys
+import json
+import math
+import argparse
+from pathlib import Path
+from collections import Counter
+
+import numpy as np
+from scipy import sparse
+
+from meditation_corpus import Corpus
+from search_tokenizer import index_terms
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+
+SIDECAR = 'related-meditations.json'
+
+# Rows of the similarity matrix computed per batch (bounds peak memory)
+BATCH_SIZE = 1024
+
+# Pairs at least this similar are reprinted meditations, not related ones
+DUPLICATE_THRESHOLD = 0.95
+
+# Ignore terms in fewer than MIN_DF meditations or more than MAX_DF of them
+MIN_DF = 2
+MAX_DF = 0.5
+
+BLOCK_START = '<!-- related-meditations -->'
+BLOCK_END = '<!-- /related-meditations -->'
+BLOCK_PATTERN = re.compile(
+    r'\n?[ \t]*' + re.escape(BLOCK_START) + r'.*?' + re.escape(BLOCK_END) + r'\n', re.DOTALL
+)
+NAV_MARKER = '        <nav class="meditation-nav">'
+
+
+def build_tfidf(documents, min_df=MIN_DF):
+    """
+    Build an L2-normalised TF-IDF matrix (CSR, float32) from token lists.
+
+    Term frequency is sublinear (1 + log tf); IDF is smoothed.
+    Returns (matrix, vocab, idf) where vocab maps term -> column.
+    """
+    n_docs = len(documents)
+    counts = [Counter(doc) for doc in documents]
+
+    df = Counter()
+    for c in counts:
+        df.update(c.keys())
+    max_df = MAX_DF * n_docs
+    vocab = {term: i for i, term in enumerate(
+        sorted(t for t, d in df.items() if min_df <= d <= max_df))}
+
+    indptr = [0]
+    indices = []
+    data = []
+    for c in counts:
+        for term, tf in c.items():
+            col = vocab.get(term)
+            if col is not None:
+                indices.append(col)
+                data.append(1.0 + math.log(tf))
+        indptr.append(len(indices))
+
+    matrix = sparse.csr_matrix(
+        (np.asarray(data, dtype=np.float32), np.asarray(indices, dtype=np.int32), np.asarray(indptr)),
+        shape=(n_docs, len(vocab)),
+    )
+
+    idf = np.zeros(len(vocab), dtype=np.float32)
+    for term, col in vocab.items():
+        idf[col] = math.log((1 + n_docs) / (1 + df[term])) + 1.0
+    matrix = matrix @ sparse.diags(idf)
+
+    norms = np.sqrt(matrix.multiply(matrix).sum(axis=1)).A1
+    norms[norms == 0] = 1.0
+    matrix = sparse.diags(1.0 / norms).astype(np.float32) @ matrix
+
+    return sparse.csr_matrix(matrix, dtype=np.float32), vocab, idf
+
+
+def top_k_neighbors(matrix, k):
+    """
+    Return (indices, scores), each shaped (n_docs, k), of the k most similar
+    other rows for every row, best first. Rows are assumed L2-normalised.
+    """
+    n_docs = matrix.shape[0]
+    k = min(k, max(n_docs - 1, 0))
+    all_indices = np.zeros((n_docs, k), dtype=np.int32)
+    all_scores = np.zeros((n_docs, k), dtype=np.float32)
+    if k == 0:
+        return all_indices, all_scores
+
+    transposed = matrix.T.tocsc()
+    for start in range(0, n_docs, BATCH_SIZE):
+        stop = min(start + BATCH_SIZE, n_docs)
+        block = (matrix[start:stop] @ transposed).toarray()
+
+        rows = np.arange(stop - start)
+        block[rows, rows + start] = -np.inf
+        block[block >= DUPLICATE_THRESHOLD] = -np.inf
+
+        candidates = np.argpartition(-block, k - 1, axis=1)[:, :k]
+        candidate_scores = np.take_along_axis(block, candidates, axis=1)
+        order = np.argsort(-candidate_scores, axis=1)
+
+        all_indices[start:stop] = np.take_along_axis(candidates, order, axis=1)
+        all_scores[start:stop] = np.take_along_axis(candidate_scores, order, axis=1)
+
+    return all_indices, all_scores
+
+
+def escape_html(text):
+    """Escape HTML special characters."""
+    return (text
+        .replace('&', '&amp;')
+        .replace('<', '&lt;')
+        .replace('>', '&gt;')
+        .replace('"', '&quot;'))
+
+
+def render_block(related):
+    """Render the related-meditations aside for one page."""
+    items = '\n'.join(
+        f'                <li><a href="{r["date"]}.html">{escape_html(r["title"])}</a>'
+        f' <span class="related-date">{escape_html(r["date_display"])}</span></li>'
+        for r in related
+    )
+    return f'''
+        {BLOCK_START}
+        <aside class="related-meditations">
+            <h2>Related Meditations</h2>
+            <ul>
+{items}
+            </ul>
+        </aside>
+        {BLOCK_END}
+'''
+
+
+def inject_block(content, block):
+    """Replace (or insert before the nav) the related block. Returns new content or None."""
+    if BLOCK_START in content:
+        updated = BLOCK_PATTERN.sub(lambda m: block, content, count=1)
+    elif NAV_MARKER in content:
+        updated = content.replace(NAV_MARKER, block.lstrip('\n') + '\n' + NAV_MARKER, 1)
+    else:
+        return None
+    return updated if updated != content else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build related-meditation links')
+    parser.add_argument('--top', '-k', type=int, default=5,
+                        help='Related meditations per page (default: 5)')
+    parser.add_argument('--dry-run', '-n', action='store_true',
+                        help='Compute and report without writing files')
+    args = parser.parse_args()
+
+    meditations_dir = PROJECT_ROOT / 'meditations'
+    if not meditations_dir.exists():
+        print(f"Error: meditations directory not found: {meditations_dir}")
+        sys.exit(1)
+
+    corpus = Corpus.load(meditations_dir)
+    meditations = [m for m in corpus if m.date]
+    print(f"{'DRY RUN - ' if args.dry_run else ''}Building related meditations for {len(meditations)} pages...")
+
+    documents = []
+    for med in meditations:
+        documents.append(index_terms(med.title + ' ' + ' '.join(med.paragraphs)))
+        med.unload()
+
+    matrix, vocab, _ = build_tfidf(documents)
+    print(f"  TF-IDF matrix: {matrix.shape[0]} x {matrix.shape[1]} ({matrix.nnz:,} non-zeros)")
+
+    indices, scores = top_k_neighbors(matrix, args.top)
+
+    related = {}
+    for row, med in enumerate(meditations):
+        related[med.date] = [
+            {
+                'date': meditations[col].date,
+                'title': meditations[col].title,
+                'date_display': meditations[col].date_display,
+                'score': round(float(score), 4),
+            }
+            for col, score in zip(indices[row], scores[row])
+            if np.isfinite(score) and score > 0
+        ]
+
+    updated = 0
+    for med in meditations:
+        with open(med.path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        new_content = inject_block(content, render_block(related[med.date]))
+        if new_content is None:
+            continue
+        updated += 1
+        if not args.dry_run:
+            with open(med.path, 'w', encoding='utf-8') as f:
+                f.write(new_content)
+
+    sidecar = {
+        date: [{k: r[k] for k in ('date', 'title', 'score')} for r in items]
+        for date, items in related.items()
+    }
+    if not args.dry_run:
+        with open(PROJECT_ROOT / SIDECAR, 'w', encoding='utf-8') as f:
+            json.dump(sidecar, f, ensure_ascii=False, separators=(',', ':'))
+
+    print(f"  {'Would update' if args.dry_run else 'Updated'}: {updated} pages")
+    if not args.dry_run:
+        print(f"  Wrote: {SIDECAR}")
+
+
+if __name__ == '__main__':
+    main()
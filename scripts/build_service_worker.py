@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Build the service worker (sw.js) that lets readers keep reading offline.
+
+Readers on retreat often have a poor connection, and nothing beyond normal
+HTTP caching kept the site available. This writes sw.js at the site root
+with a precache manifest embedded - {file: content hash} for:
+
+- the shell: the home, search and listing pages, script.js, the search
+  worker and the data a search needs - the index, BM25 postings, spelling
+  dictionary and typeahead table - (by their fingerprinted names), the
+  css/ bundles the pages link, fonts and year pages
+- the meditations of a season - by default the current liturgical season -
+  most recent first, up to --max-pages, and that season's listing page
+
+The worker stores each file under its hash, so when a deploy changes the
+manifest, browsers fetch only the files whose hash changed and drop the
+rest. Everything else is cached as it is visited: pages network-first
+(falling back to the cached copy offline), fingerprinted assets
+cache-first.
+
+script.js registers sw.js on every page (except on localhost, so the
+preview server always shows the current build). Run after build_css.py,
+before build_dist.py; sw.js is rewritten only when the manifest changes.
+
+Usage:
+    python build_service_worker.py [--season NAME ...] [--max-pages N] [--dry-run]
+"""
+
+import sys
+import json
+import hashlib
+import argparse
+from pathlib import Path
+from datetime import date, timedelta
+
+from fingerprint_assets import HASH_LENGTH, asset_names, write_if_changed
+from meditation_corpus import Corpus
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+
+SW_NAME = 'sw.js'
+
+SHELL_PAGES = ['index.html', 'search.html', 'chronological.html', 'by-year.html', 'by-season.html', 'title-index.html']
+# Linked by their fingerprinted names (asset-manifest.json). Pages link the
+# css/ bundles rather than the shared stylesheets, and the search worker
+# needs the BM25 postings alongside the index to answer any query
+SHELL_ASSETS = [
+    'script.js',
+    'search-index.json',
+    'search-bm25.json',
+    'search-spell.json',
+    'search-suggest.json',
+    'search-worker.js',
+]
+SHELL_GLOBS = ['css/*.css', 'fonts/*.css', 'fonts/*.woff2', 'listings/*.html']
+
+SEASON_PAGES = {
+    'Advent': 'advent.html',
+    'Christmas': 'christmas.html',
+    'Epiphany': 'epiphany.html',
+    'Lent': 'lent.html',
+    'Easter': 'easter.html',
+    'Ordinary Time': 'ordinary-time.html',
+    'Special': 'special.html',
+}
+
+# Meditation pages precached per season (about 12 KB each)
+MAX_PAGES = 60
+
+# Runtime cache entries kept, oldest dropped first
+MAX_RUNTIME_ENTRIES = 300
+
+WORKER_TEMPLATE = r'''// Generated by scripts/build_service_worker.py - do not edit
+// Hash of the precache manifest
+const VERSION = '/* VERSION */';
+const PRECACHE = /* PRECACHE */;
+const PRECACHE_NAME = 'threads-of-grace-precache';
+const RUNTIME_NAME = 'threads-of-grace-runtime';
+const MAX_RUNTIME_ENTRIES = /* MAX_RUNTIME_ENTRIES */;
+
+// Content-hashed names (styles.2f4bf8cbc6.css, css/, fonts/) never change
+const HASHED = /\.[0-9a-f]{/* HASH_LENGTH */}\.\w+$/;
+
+const scope = new URL(self.registration.scope);
+
+// Each precached file is stored under its hash, so a new manifest only
+// fetches the files that changed
+function cacheKey(path, revision) {
+    return new URL(`${path}?rev=${revision}`, scope).href;
+}
+
+self.addEventListener('install', event => {
+    event.waitUntil(caches.open(PRECACHE_NAME).then(cache =>
+        Promise.all(Object.entries(PRECACHE).map(([path, revision]) => {
+            const key = cacheKey(path, revision);
+            return cache.match(key).then(hit => hit || fetch(new URL(path, scope), { cache: 'reload' })
+                .then(response => {
+                    if (!response.ok) throw new Error(`${path}: ${response.status}`);
+                    return cache.put(key, response);
+                }));
+        }))
+    ).then(() => self.skipWaiting()));
+});
+
+self.addEventListener('activate', event => {
+    const current = new Set(Object.entries(PRECACHE).map(([path, revision]) => cacheKey(path, revision)));
+    event.waitUntil(caches.open(PRECACHE_NAME)
+        .then(cache => cache.keys().then(requests => Promise.all(
+            requests.filter(request => !current.has(request.url)).map(request => cache.delete(request))
+        )))
+        .then(() => self.clients.claim()));
+});
+
+function trimRuntime(cache) {
+    return cache.keys().then(requests => Promise.all(
+        requests.slice(0, Math.max(requests.length - MAX_RUNTIME_ENTRIES, 0)).map(request => cache.delete(request))
+    ));
+}
+
+function storeRuntime(request, response) {
+    // Partial (range) and error responses cannot be replayed
+    if (response.status !== 200) return;
+    const copy = response.clone();
+    caches.open(RUNTIME_NAME).then(cache => cache.put(request, copy).then(() => trimRuntime(cache)));
+}
+
+function offlineResponse(request) {
+    if (request.mode !== 'navigate') return Response.error();
+    return new Response(
+        '<!DOCTYPE html><meta charset="utf-8"><meta name="viewport" content="width=device-width, initial-scale=1">' +
+        '<title>Offline | Threads of Grace</title>' +
+        '<p style="font-family: serif; text-align: center; margin: 4rem 1rem">' +
+        'This page has not been saved for offline reading. ' +
+        `<a href="${new URL('index.html', scope).href}">Return to Home</a></p>`,
+        { status: 503, headers: { 'Content-Type': 'text/html; charset=utf-8' } }
+    );
+}
+
+function cacheFirst(request) {
+    return caches.open(RUNTIME_NAME).then(cache => cache.match(request)).then(hit => hit || fetch(request)
+        .then(response => {
+            storeRuntime(request, response);
+            return response;
+        })
+        .catch(() => offlineResponse(request)));
+}
+
+function networkFirst(request) {
+    return fetch(request)
+        .then(response => {
+            storeRuntime(request, response);
+            return response;
+        })
+        .catch(() => caches.open(RUNTIME_NAME)
+            .then(cache => cache.match(request))
+            .then(hit => hit || offlineResponse(request)));
+}
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    const url = new URL(request.url);
+    if (request.method !== 'GET' || url.origin !== scope.origin || !url.pathname.startsWith(scope.pathname)) return;
+    if (request.headers.has('range')) return;
+
+    let path = decodeURIComponent(url.pathname.slice(scope.pathname.length));
+    if (path === '' || path.endsWith('/')) path += 'index.html';
+
+    const revision = PRECACHE[path];
+    if (revision) {
+        event.respondWith(caches.open(PRECACHE_NAME)
+            .then(cache => cache.match(cacheKey(path, revision)))
+            .then(hit => hit || networkFirst(request)));
+    } else if (HASHED.test(path)) {
+        event.respondWith(cacheFirst(request));
+    } else {
+        event.respondWith(networkFirst(request));
+    }
+});
+'''
+
+
+# ============================================================================
+# LITURGICAL CALENDAR
+# ============================================================================
+
+def easter(year):
+    """Easter Sunday (Western) - the anonymous Gregorian algorithm."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    g = (8 * b + 13) // 25
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def advent_sunday(year):
+    """First Sunday of Advent: the fourth Sunday before Christmas."""
+    christmas = date(year, 12, 25)
+    fourth_sunday = christmas - timedelta(days=(christmas.weekday() + 1) % 7 or 7)
+    return fourth_sunday - timedelta(weeks=3)
+
+
+def liturgical_season(day):
+    """The season a date falls in, as the meditation pages name it."""
+    if day >= date(day.year, 12, 25) or day <= date(day.year, 1, 5):
+        return 'Christmas'
+    if day >= advent_sunday(day.year):
+        return 'Advent'
+    easter_day = easter(day.year)
+    if day < easter_day - timedelta(days=46):
+        return 'Epiphany'
+    if day < easter_day:
+        return 'Lent'
+    # The site files the Day of Pentecost under Ordinary Time
+    if day < easter_day + timedelta(days=49):
+        return 'Easter'
+    return 'Ordinary Time'
+
+
+# ============================================================================
+# BUILD
+# ============================================================================
+
+def revision(path):
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:HASH_LENGTH]
+
+
+def precache_files(seasons, max_pages):
+    """Site-relative paths to precache, in order, without repeats."""
+    names = asset_names()
+    files = list(SHELL_PAGES) + [names[asset] for asset in SHELL_ASSETS]
+    for pattern in SHELL_GLOBS:
+        files += sorted(p.relative_to(PROJECT_ROOT).as_posix() for p in PROJECT_ROOT.glob(pattern))
+
+    corpus = Corpus.load(PROJECT_ROOT / 'meditations')
+    for season in seasons:
+        if season in SEASON_PAGES:
+            files.append(SEASON_PAGES[season])
+        meditations = corpus.season(season)
+        files += [f'meditations/{med.filename}' for med in reversed(meditations[-max_pages:])]
+    return list(dict.fromkeys(files))
+
+
+def render_worker(manifest):
+    """sw.js for a {file: revision} precache manifest."""
+    version = hashlib.sha256(json.dumps(manifest, sort_keys=True).encode('utf-8')).hexdigest()[:HASH_LENGTH]
+    return (WORKER_TEMPLATE
+            .replace('/* VERSION */', version)
+            .replace('/* PRECACHE */', json.dumps(manifest, indent=4))
+            .replace('/* MAX_RUNTIME_ENTRIES */', str(MAX_RUNTIME_ENTRIES))
+            .replace('/* HASH_LENGTH */', str(HASH_LENGTH))), version
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the offline-reading service worker')
+    parser.add_argument('--season', action='append', choices=sorted(SEASON_PAGES),
+                        help='Season whose meditations to precache (repeatable; default: the current season)')
+    parser.add_argument('--max-pages', type=int, default=MAX_PAGES,
+                        help=f'Most recent meditations precached per season (default: {MAX_PAGES})')
+    parser.add_argument('--dry-run', '-n', action='store_true',
+                        help='Report the precache manifest without writing sw.js')
+    args = parser.parse_args()
+
+    seasons = args.season or [liturgical_season(date.today())]
+    files = precache_files(seasons, args.max_pages)
+    missing = [f for f in files if not (PROJECT_ROOT / f).exists()]
+    if missing:
+        print(f"Error: files to precache not found: {', '.join(missing)}")
+        sys.exit(1)
+
+    manifest = {f: revision(PROJECT_ROOT / f) for f in files}
+    worker, version = render_worker(manifest)
+    size = sum((PROJECT_ROOT / f).stat().st_size for f in files)
+    print(f"{'DRY RUN - ' if args.dry_run else ''}Precaching {len(files)} files "
+          f"({size / 1_000_000:,.2f} MB) for {', '.join(seasons)}, version {version}")
+
+    changed = write_if_changed(PROJECT_ROOT / SW_NAME, worker.encode('utf-8'), args.dry_run)
+    if changed:
+        print(f"  {'Would update' if args.dry_run else 'Updated'} {SW_NAME}")
+    else:
+        print(f"  {SW_NAME} is up to date")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,700 @@
+#!/usr/bin/env python3
+"""
+Build searchable transcript pages for the family oral-history recordings.
+
+Every recording folder under family/media/ that holds a .txt transcript
+becomes one page, family/transcript-<folder>.html:
+
+1. The transcript is split into speaker turns. A turn starts with a line
+   holding only the speaker's name ("Mom", "Tom", "Audrey 2"), followed by
+   what they said; trailing take numbers are dropped from names.
+2. Turns are grouped into stories. A new story starts where someone other
+   than the main narrator asks a question, once the current story has run
+   for at least MIN_STORY_WORDS words; the question becomes its heading.
+3. Every turn is indexed with search_tokenizer (folding, stop words,
+   stemming) into a positional inverted index, embedded in the page with
+   the stem table for the transcript's vocabulary. The page searches it as
+   the reader types - words, prefixes and "quoted phrases" - and jumps to
+   the matching turn.
+
+The index is embedded rather than written alongside, so deploy-family.sh
+encrypts it together with the page. The family home page gets a link to
+each transcript, between <!-- transcripts --> markers.
+
+To add a recording, drop its transcript into a new folder under
+family/media/ and rerun.
+
+Usage:
+    python build_transcripts.py [--dry-run]
+"""
+
+import re
+import sys
+import json
+import html
+import argparse
+from pathlib import Path
+from datetime import date
+from collections import Counter, defaultdict
+
+from search_tokenizer import STOP_WORDS, positional_terms, stem_table, words
+from fingerprint_assets import asset_names
+from build_fonts import font_links
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+
+FAMILY_DIR = PROJECT_ROOT / 'family'
+MEDIA_DIR = FAMILY_DIR / 'media'
+FAMILY_INDEX = FAMILY_DIR / 'index.html'
+
+# A line holding only a name (up to three capitalized words or numbers)
+SPEAKER_PATTERN = re.compile(r"^[A-Z][\w'.-]*(?: [A-Z0-9][\w'.-]*){0,2}$")
+TAKE_NUMBER_PATTERN = re.compile(r'\s+\d+$')
+FOLDER_DATE_PATTERN = re.compile(r'^(\d{4})-(\d{2})(\d{2})-(.+)$')
+SMALL_WORDS = {'a', 'an', 'and', 'at', 'by', 'for', 'in', 'of', 'on', 'or', 'the', 'to', 'with'}
+
+# A story runs at least this many words before a question may start the next
+MIN_STORY_WORDS = 400
+TITLE_LENGTH = 70
+
+BLOCK_START = '<!-- transcripts -->'
+BLOCK_END = '<!-- /transcripts -->'
+BLOCK_PATTERN = re.compile(
+    r'[ \t]*' + re.escape(BLOCK_START) + r'.*?' + re.escape(BLOCK_END) + r'\n', re.DOTALL
+)
+NAV_OPTIONS_END = '            </div>\n        </section>\n\n        <section class="about-pat">'
+
+
+# ============================================================================
+# PARSING
+# ============================================================================
+
+def parse_turns(text):
+    """[{speaker, text}] from a transcript; unlabeled blocks continue the previous turn."""
+    turns = []
+    for block in re.split(r'\n\s*\n', text.strip()):
+        lines = [line.strip() for line in block.strip().splitlines() if line.strip()]
+        if not lines:
+            continue
+        if len(lines) > 1 and SPEAKER_PATTERN.match(lines[0]):
+            speaker = TAKE_NUMBER_PATTERN.sub('', lines[0])
+            body = ' '.join(lines[1:])
+        elif turns:
+            speaker = turns[-1]['speaker']
+            body = ' '.join(lines)
+        else:
+            speaker = ''
+            body = ' '.join(lines)
+
+        body = re.sub(r'^-\s+', '', body)
+        if turns and turns[-1]['speaker'] == speaker:
+            turns[-1]['text'] += ' ' + body
+        else:
+            turns.append({'speaker': speaker, 'text': body})
+    return turns
+
+
+def shorten(text, length=TITLE_LENGTH):
+    """Text cut at a word boundary, with an ellipsis if anything was dropped."""
+    if len(text) <= length:
+        return text
+    return text[:length].rsplit(' ', 1)[0].rstrip(',;:') + '…'
+
+
+def first_sentence(text):
+    match = re.match(r'.+?[.?!](?=\s|$)', text)
+    return match.group(0) if match else text
+
+
+def segment_stories(turns):
+    """
+    Group turns into stories. Returns (narrator, [{title, start, end}])
+    where start/end are turn indexes (end exclusive).
+    """
+    spoken = Counter()
+    for turn in turns:
+        spoken[turn['speaker']] += len(turn['text'].split())
+    narrator = spoken.most_common(1)[0][0] if spoken else ''
+
+    stories = []
+    start = 0
+    length = 0
+    for i, turn in enumerate(turns):
+        is_question = turn['speaker'] != narrator and turn['text'].rstrip().endswith('?')
+        if is_question and length >= MIN_STORY_WORDS:
+            stories.append({'start': start, 'end': i})
+            start = i
+            length = 0
+        length += len(turn['text'].split())
+    if start < len(turns):
+        stories.append({'start': start, 'end': len(turns)})
+
+    for story in stories:
+        opening = turns[story['start']]
+        story['title'] = shorten(first_sentence(opening['text']) if opening['speaker'] == narrator
+                                 else opening['text'])
+    return narrator, stories
+
+
+# ============================================================================
+# INDEXING
+# ============================================================================
+
+def build_index(turns):
+    """
+    Positional inverted index over turns.
+
+    terms are sorted stems; postings[i] is a flat list for terms[i]:
+    [turn delta, position count, position delta, ...] per turn containing it.
+    Positions count every word of the turn, stop words included.
+    """
+    occurrences = defaultdict(lambda: defaultdict(list))
+    vocabulary = set()
+    for t, turn in enumerate(turns):
+        for term, position in positional_terms(turn['text']):
+            occurrences[term][t].append(position)
+        vocabulary.update(words(turn['text']))
+
+    terms = sorted(occurrences)
+    postings = []
+    for term in terms:
+        flat = []
+        previous_turn = 0
+        for t in sorted(occurrences[term]):
+            positions = occurrences[term][t]
+            flat += [t - previous_turn, len(positions)]
+            flat += [p - q for p, q in zip(positions, [0] + positions[:-1])]
+            previous_turn = t
+        postings.append(flat)
+
+    return {
+        'terms': terms,
+        'postings': postings,
+        'stems': stem_table(vocabulary),
+        'stopWords': sorted(STOP_WORDS),
+    }
+
+
+# ============================================================================
+# RENDERING
+# ============================================================================
+
+def title_case(slug):
+    words = slug.split('-')
+    return ' '.join(w if i and w in SMALL_WORDS else w.capitalize() for i, w in enumerate(words))
+
+
+def recording_info(folder):
+    """(title, display date) from a folder name like 2024-1029-stories-with-audrey-and-tom."""
+    match = FOLDER_DATE_PATTERN.match(folder.name)
+    if not match:
+        return title_case(folder.name), ''
+    year, month, day, rest = match.groups()
+    title = title_case(rest)
+    when = date(int(year), int(month), int(day))
+    return title, f"{when:%B} {when.day}, {when.year}"
+
+
+def render_story(n, story, turns, narrator):
+    paragraphs = []
+    for t in range(story['start'], story['end']):
+        turn = turns[t]
+        role = 'turn-narrator' if turn['speaker'] == narrator else 'turn-listener'
+        paragraphs.append(
+            f'            <p class="turn {role}" id="t-{t}">'
+            f'<span class="speaker">{html.escape(turn["speaker"])}</span> '
+            f'<span class="turn-text">{html.escape(turn["text"])}</span></p>'
+        )
+    body = '\n'.join(paragraphs)
+    return f'''        <section class="story" id="story-{n}" data-start="{story['start']}">
+            <h2 class="story-title">{html.escape(story['title'])}</h2>
+{body}
+        </section>'''
+
+
+def render_page(title, when, source, turns, narrator, stories, index):
+    toc = '\n'.join(
+        f'                <li><a href="#story-{n}">{html.escape(story["title"])}</a></li>'
+        for n, story in enumerate(stories, 1)
+    )
+    sections = '\n\n'.join(render_story(n, story, turns, narrator) for n, story in enumerate(stories, 1))
+    # '</' cannot appear inside the script element
+    index_json = json.dumps(index, ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
+    assets = asset_names()
+    subtitle = f'Transcript of a recorded conversation, {when}' if when else 'Transcript of a recorded conversation'
+
+    return f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{html.escape(title)} — Threads of Grace</title>
+    {font_links(assets, '../')}
+    <link rel="stylesheet" href="../{assets['styles.css']}">
+    <link rel="stylesheet" href="../{assets['meditation.css']}">
+    <link rel="stylesheet" href="family.css">
+    <style>
+        /* Generated by scripts/build_transcripts.py */
+        .stories-header {{
+            text-align: center;
+            padding: var(--spacing-2xl) var(--spacing-md) var(--spacing-lg);
+            border-bottom: 1px solid var(--soft-gray);
+        }}
+
+        .stories-header .back-link {{
+            display: inline-block;
+            font-size: 0.95rem;
+            color: var(--accent-sage);
+            text-decoration: none;
+            letter-spacing: 0.05em;
+            margin-bottom: var(--spacing-md);
+        }}
+
+        .stories-title {{
+            font-family: var(--font-display);
+            font-size: 3rem;
+            font-weight: 300;
+            letter-spacing: 0.05em;
+            color: var(--deep-brown);
+            margin-bottom: var(--spacing-sm);
+        }}
+
+        .stories-subtitle {{
+            font-size: 1.125rem;
+            font-weight: 300;
+            font-style: italic;
+            color: var(--medium-gray);
+        }}
+
+        /* Search */
+        .transcript-search {{
+            max-width: 650px;
+            margin: var(--spacing-xl) auto var(--spacing-md);
+        }}
+
+        .transcript-search input {{
+            width: 100%;
+            font-family: var(--font-body);
+            font-size: 1.125rem;
+            padding: 0.75rem 1rem;
+            border: 1px solid var(--soft-gray);
+            background: var(--warm-white);
+        }}
+
+        .transcript-search .search-status {{
+            font-size: 0.9rem;
+            color: var(--medium-gray);
+            margin: var(--spacing-xs) 0;
+        }}
+
+        #transcript-results {{
+            list-style: none;
+            max-height: 24rem;
+            overflow-y: auto;
+        }}
+
+        #transcript-results li a {{
+            display: block;
+            padding: 0.5rem 0;
+            border-bottom: 1px solid var(--soft-gray);
+            color: var(--dark-gray);
+            text-decoration: none;
+        }}
+
+        #transcript-results .result-story {{
+            display: block;
+            font-size: 0.85rem;
+            color: var(--accent-sage);
+        }}
+
+        /* Table of contents */
+        .toc {{
+            max-width: 650px;
+            margin: var(--spacing-lg) auto;
+        }}
+
+        .toc h2 {{
+            font-family: var(--font-display);
+            font-size: 1.5rem;
+            font-weight: 400;
+            color: var(--accent-gold);
+            letter-spacing: 0.1em;
+            text-transform: uppercase;
+            margin-bottom: var(--spacing-md);
+        }}
+
+        .toc li {{
+            margin-bottom: 0.5rem;
+        }}
+
+        .toc li a {{
+            color: var(--dark-gray);
+            text-decoration: none;
+        }}
+
+        .toc li a:hover {{
+            color: var(--accent-sage);
+        }}
+
+        /* Stories and turns */
+        .story {{
+            max-width: 650px;
+            margin: 0 auto;
+            padding: var(--spacing-xl) 0;
+            border-bottom: 1px solid var(--soft-gray);
+        }}
+
+        .story-title {{
+            font-family: var(--font-display);
+            font-size: 1.75rem;
+            font-weight: 400;
+            color: var(--deep-brown);
+            margin-bottom: var(--spacing-md);
+            line-height: 1.3;
+        }}
+
+        .turn {{
+            margin-bottom: var(--spacing-sm);
+            scroll-margin-top: 2rem;
+        }}
+
+        .turn-listener {{
+            color: var(--medium-gray);
+            font-style: italic;
+        }}
+
+        .turn .speaker {{
+            font-family: var(--font-display);
+            font-style: normal;
+            font-weight: 600;
+            color: var(--accent-gold);
+            margin-right: 0.25rem;
+        }}
+
+        .turn.turn-hit {{
+            background: var(--warm-white);
+            outline: 1px solid var(--accent-gold);
+            outline-offset: 0.5rem;
+        }}
+
+        .story[id] {{
+            scroll-margin-top: 2rem;
+        }}
+
+        .stories-footer {{
+            text-align: center;
+            padding: var(--spacing-xl) var(--spacing-md);
+            font-size: 0.95rem;
+            color: var(--medium-gray);
+        }}
+    </style>
+</head>
+<body>
+    <div class="grain-overlay"></div>
+
+    <header class="stories-header">
+        <a href="index.html" class="back-link">&larr; Family Home</a>
+        <h1 class="stories-title">{html.escape(title)}</h1>
+        <p class="stories-subtitle">{html.escape(subtitle)}</p>
+    </header>
+
+    <div class="container">
+        <div class="transcript-search">
+            <input type="search" id="transcript-query" placeholder="Search the transcript" autocomplete="off" aria-label="Search the transcript">
+            <p class="search-status" id="search-status"></p>
+            <ol id="transcript-results"></ol>
+        </div>
+
+        <nav class="toc">
+            <h2>Contents</h2>
+            <ol>
+{toc}
+            </ol>
+        </nav>
+
+{sections}
+    </div>
+
+    <footer class="stories-footer">
+        <p>Source: <a href="media/{html.escape(source)}">{html.escape(Path(source).name)}</a></p>
+        <p class="copyright">&copy; The Horn Family</p>
+    </footer>
+
+    <script type="application/json" id="transcript-index">{index_json}</script>
+    <script>
+    (function() {{
+        'use strict';
+
+        var MAX_RESULTS = 50;
+        var PREFIX_LIMIT = 30;
+        var SNIPPET_WORDS = 12;
+
+        var index = JSON.parse(document.getElementById('transcript-index').textContent);
+        var termIds = {{}};
+        index.terms.forEach(function(term, i) {{ termIds[term] = i; }});
+        var stopWords = {{}};
+        index.stopWords.forEach(function(word) {{ stopWords[word] = true; }});
+
+        // word -> stem, expanded from {{stem: "suffix suffix =word"}}
+        var stems = {{}};
+        Object.keys(index.stems).forEach(function(stem) {{
+            index.stems[stem].split(' ').forEach(function(entry) {{
+                stems[entry.charAt(0) === '=' ? entry.slice(1) : stem + entry] = stem;
+            }});
+        }});
+
+        // Same folding and word splitting as scripts/search_tokenizer.py
+        function foldedWords(text) {{
+            var folded = text
+                .replace(/[‘’‛′]/g, "'").replace(/[“”]/g, '"').replace(/[–—]/g, '-')
+                .replace(/æ/g, 'ae').replace(/œ/g, 'oe').replace(/ß/g, 'ss')
+                .normalize('NFKD').replace(/[\\u0300-\\u036f]/g, '')
+                .toLowerCase();
+            return (folded.match(/[a-z0-9]+(?:'[a-z]+)?/g) || []).map(function(word) {{
+                return word.replace(/'s$/, '').replace(/'/g, '');
+            }});
+        }}
+
+        function stem(word) {{ return stems[word] || word; }}
+
+        // Query terms with their word offsets (stop words counted, not kept)
+        function queryTerms(text) {{
+            var result = [];
+            foldedWords(text).forEach(function(word, offset) {{
+                if ((word.length > 1 || /\\d/.test(word)) && !stopWords[word]) {{
+                    result.push({{term: stem(word), offset: offset}});
+                }}
+            }});
+            return result;
+        }}
+
+        // turn -> positions for one index term, decoded on first use
+        var decoded = {{}};
+        function termPostings(id) {{
+            if (decoded[id]) return decoded[id];
+            var flat = index.postings[id], map = {{}};
+            for (var i = 0, turn = 0; i < flat.length;) {{
+                turn += flat[i++];
+                var count = flat[i++], positions = [];
+                for (var j = 0, pos = 0; j < count; j++) {{
+                    pos += flat[i++];
+                    positions.push(pos);
+                }}
+                map[turn] = positions;
+            }}
+            decoded[id] = map;
+            return map;
+        }}
+
+        // Index term ids for a query term: exact, or (for the word being typed) every term it begins
+        function matchingIds(term, prefix) {{
+            if (termIds[term] !== undefined) return [termIds[term]];
+            if (!prefix) return [];
+            var lo = 0, hi = index.terms.length;
+            while (lo < hi) {{
+                var mid = (lo + hi) >> 1;
+                if (index.terms[mid] < term) lo = mid + 1; else hi = mid;
+            }}
+            var ids = [];
+            for (var i = lo; i < index.terms.length && index.terms[i].indexOf(term) === 0 && ids.length < PREFIX_LIMIT; i++) {{
+                ids.push(i);
+            }}
+            return ids;
+        }}
+
+        // turn -> positions of any of a query term's matching index terms
+        function occurrences(term, prefix) {{
+            var merged = {{}};
+            matchingIds(term, prefix).forEach(function(id) {{
+                var map = termPostings(id);
+                Object.keys(map).forEach(function(turn) {{
+                    merged[turn] = (merged[turn] || []).concat(map[turn]);
+                }});
+            }});
+            return merged;
+        }}
+
+        // Turns containing every term - at their relative offsets, for a quoted phrase
+        function search(query) {{
+            var phrase = /^\\s*".*"\\s*$/.test(query);
+            var terms = queryTerms(query);
+            if (!terms.length) return {{turns: [], terms: []}};
+
+            var lists = terms.map(function(t, i) {{
+                return occurrences(t.term, !phrase && i === terms.length - 1 && !/\\s$/.test(query));
+            }});
+            var turns = Object.keys(lists[0]).map(Number).filter(function(turn) {{
+                return lists.every(function(list) {{ return list[turn]; }});
+            }});
+            if (phrase) {{
+                turns = turns.filter(function(turn) {{
+                    return lists[0][turn].some(function(pos) {{
+                        var start = pos - terms[0].offset;
+                        return terms.every(function(t, i) {{
+                            return lists[i][turn].indexOf(start + t.offset) >= 0;
+                        }});
+                    }});
+                }});
+            }}
+            turns.sort(function(a, b) {{ return a - b; }});
+            return {{turns: turns, terms: terms.map(function(t) {{ return t.term; }}), first: lists[0]}};
+        }}
+
+        function escapeHtml(text) {{
+            return text.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;');
+        }}
+
+        // Wrap words whose stem begins with a query term in <mark>
+        function highlight(text, terms) {{
+            return escapeHtml(text).replace(/[\\p{{L}}\\p{{N}}'’]+/gu, function(word) {{
+                var s = stem(foldedWords(word)[0] || '');
+                var hit = s && terms.some(function(term) {{ return s.indexOf(term) === 0; }});
+                return hit ? '<mark>' + word + '</mark>' : word;
+            }});
+        }}
+
+        // A few words either side of a word position
+        function snippet(text, position) {{
+            var all = text.split(/\\s+/);
+            var start = Math.max(0, position - SNIPPET_WORDS / 2);
+            var words = all.slice(start, start + SNIPPET_WORDS).join(' ');
+            return (start > 0 ? '…' : '') + words + (start + SNIPPET_WORDS < all.length ? '…' : '');
+        }}
+
+        var stories = Array.prototype.slice.call(document.querySelectorAll('.story'));
+        function storyTitle(turn) {{
+            var title = '';
+            stories.forEach(function(story) {{
+                if (Number(story.getAttribute('data-start')) <= turn) title = story.querySelector('.story-title').textContent;
+            }});
+            return title;
+        }}
+
+        var marked = [];
+        function clearMarks() {{
+            marked.forEach(function(el) {{
+                el.innerHTML = escapeHtml(el.textContent);
+                el.parentNode.classList.remove('turn-hit');
+            }});
+            marked = [];
+        }}
+
+        // Jump to a turn and mark the matching words in it
+        function jumpTo(turn, terms) {{
+            clearMarks();
+            var el = document.getElementById('t-' + turn);
+            if (!el) return;
+            var text = el.querySelector('.turn-text');
+            text.innerHTML = highlight(text.textContent, terms);
+            el.classList.add('turn-hit');
+            marked.push(text);
+            el.scrollIntoView({{behavior: 'smooth', block: 'center'}});
+        }}
+
+        var input = document.getElementById('transcript-query');
+        var results = document.getElementById('transcript-results');
+        var status = document.getElementById('search-status');
+
+        input.addEventListener('input', function() {{
+            var found = search(input.value);
+            if (!input.value.trim()) {{
+                results.innerHTML = '';
+                status.textContent = '';
+                return;
+            }}
+            status.textContent = found.turns.length + ' passage' + (found.turns.length === 1 ? '' : 's') + ' found' +
+                (found.turns.length > MAX_RESULTS ? ' (showing first ' + MAX_RESULTS + ')' : '');
+            results.innerHTML = found.turns.slice(0, MAX_RESULTS).map(function(turn) {{
+                var text = document.querySelector('#t-' + turn + ' .turn-text').textContent;
+                return '<li><a href="#t-' + turn + '" data-turn="' + turn + '">' +
+                    '<span class="result-story">' + escapeHtml(storyTitle(turn)) + '</span>' +
+                    highlight(snippet(text, found.first[turn][0]), found.terms) + '</a></li>';
+            }}).join('');
+            results.onclick = function(e) {{
+                var link = e.target.closest('a[data-turn]');
+                if (!link) return;
+                e.preventDefault();
+                jumpTo(Number(link.getAttribute('data-turn')), found.terms);
+                history.replaceState(null, '', '#t-' + link.getAttribute('data-turn'));
+            }};
+        }});
+    }})();
+    </script>
+</body>
+</html>
+'''
+
+
+# ============================================================================
+# FAMILY HOME LINKS
+# ============================================================================
+
+def render_links(pages):
+    cards = '\n\n'.join(
+        f'''                <a href="{page}" class="nav-card">
+                    <h3>{html.escape(title)}</h3>
+                    <p>Searchable transcript of the recorded conversation{f", {when}" if when else ""}, in {count} stories.</p>
+                </a>'''
+        for page, title, when, count in pages
+    )
+    return f'''                {BLOCK_START}
+{cards}
+                {BLOCK_END}
+'''
+
+
+def inject_links(content, block):
+    """Replace (or add at the end of the page cards) the transcript links. Returns new content or None."""
+    if BLOCK_START in content:
+        updated = BLOCK_PATTERN.sub(lambda m: block, content, count=1)
+    elif NAV_OPTIONS_END in content:
+        updated = content.replace(NAV_OPTIONS_END, '\n' + block + NAV_OPTIONS_END, 1)
+    else:
+        return None
+    return updated if updated != content else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build searchable family transcript pages')
+    parser.add_argument('--dry-run', '-n', action='store_true',
+                        help='Parse and report without writing files')
+    args = parser.parse_args()
+
+    transcripts = sorted(MEDIA_DIR.glob('*/*.txt'))
+    if not transcripts:
+        print(f"No transcripts found in {MEDIA_DIR}")
+        sys.exit(1)
+
+    print(f"{'DRY RUN - ' if args.dry_run else ''}Building {len(transcripts)} transcript page(s)...")
+    pages = []
+    for path in transcripts:
+        folder = path.parent
+        title, when = recording_info(folder)
+        turns = parse_turns(path.read_text(encoding='utf-8'))
+        narrator, stories = segment_stories(turns)
+        index = build_index(turns)
+
+        page = f'transcript-{folder.name}.html'
+        content = render_page(title, when, str(path.relative_to(MEDIA_DIR)), turns, narrator, stories, index)
+        pages.append((page, title, when, len(stories)))
+
+        speakers = sorted({t['speaker'] for t in turns})
+        print(f"  {page}: {len(turns)} turns ({', '.join(speakers)}), {len(stories)} stories, "
+              f"{len(index['terms'])} terms, {len(content.encode('utf-8')) // 1024} KB")
+        if not args.dry_run:
+            with open(FAMILY_DIR / page, 'w', encoding='utf-8') as f:
+                f.write(content)
+
+    with open(FAMILY_INDEX, 'r', encoding='utf-8') as f:
+        home = f.read()
+    updated = inject_links(home, render_links(pages))
+    if updated is not None:
+        print(f"  {'Would update' if args.dry_run else 'Updated'} links in family/index.html")
+        if not args.dry_run:
+            with open(FAMILY_INDEX, 'w', encoding='utf-8') as f:
+                f.write(updated)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Compile a GEDCOM file into the JSON the family tree page loads.
+
+family/family-tree.html used to fetch the raw .ged file and parse it line
+by line in the browser on every visit. This parses it once, at build time,
+into a normalized person/family graph:
+
+- people: display-ready records (name, nickname, lifespan, birth, death,
+  burial, occupation, notes), already in sidebar order
+- families: husband, wife and children as indexes into people
+- depth: generation depth of each person (0 = no known parents)
+- parents / children: ancestor and descendant adjacency, one list per person
+- layout: node and link positions of the chart centred on the default
+  person, so the first view needs no layout pass in the browser
+
+Usage:
+    python compile_gedcom.py [--root I19] [--dry-run]
+    python compile_gedcom.py path/to/tree.ged --output path/to/tree.json
+"""
+
+import re
+import sys
+import json
+import argparse
+from pathlib import Path
+from collections import deque
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+
+DEFAULT_GEDCOM = PROJECT_ROOT / 'family' / 'media' / 'omalley_family.ged'
+DEFAULT_ROOT = 'I19'
+
+LINE_PATTERN = re.compile(r'^(\d+)\s+(?:@([^@]+)@\s+)?(\w+)(?:\s(.*))?$')
+YEAR_PATTERN = re.compile(r'(\d{4})')
+
+# Chart geometry - must match family-tree.html
+NODE_WIDTH = 190
+NODE_HEIGHT = 56
+H_GAP = 30
+V_GAP = 70
+COUPLE_GAP = 10
+ROOT_X = 400
+ROOT_Y = 300
+
+
+# ============================================================================
+# PARSING
+# ============================================================================
+
+def _pointer(value):
+    return value.strip().strip('@')
+
+
+def parse_gedcom(text):
+    """
+    Parse GEDCOM text into (individuals, families), dicts keyed by xref id.
+
+    Only the tags the family tree page shows are kept. CONT and CONC lines
+    are joined onto the value they continue.
+    """
+    individuals = {}
+    families = {}
+    record = None
+    event = None
+    last = None  # (dict, key) of the most recent text value, for CONT/CONC
+
+    for raw in text.splitlines():
+        match = LINE_PATTERN.match(raw.strip())
+        if not match:
+            continue
+        level, xref, tag, value = int(match.group(1)), match.group(2), match.group(3), match.group(4) or ''
+
+        if level == 0:
+            event = None
+            last = None
+            if tag == 'INDI':
+                record = {'id': xref, 'names': [], 'sex': '', 'birth': {}, 'death': {}, 'burial': {},
+                          'notes': [], 'fams': [], 'famc': None, 'occupation': ''}
+                individuals[xref] = record
+            elif tag == 'FAM':
+                record = {'id': xref, 'husband': None, 'wife': None, 'children': [],
+                          'marriage': {}, 'notes': []}
+                families[xref] = record
+            else:
+                record = None
+            continue
+
+        if record is None:
+            continue
+
+        if tag in ('CONT', 'CONC') and last is not None:
+            target, key = last
+            target[key] += ('\n' if tag == 'CONT' else '') + value
+            continue
+
+        if level == 1:
+            event = tag
+            last = None
+            if 'names' in record:
+                if tag == 'NAME':
+                    record['names'].append({'full': ' '.join(value.replace('/', ' ').split()), 'type': None})
+                elif tag == 'SEX':
+                    record['sex'] = value
+                elif tag in ('BIRT', 'DEAT', 'BURI'):
+                    record[{'BIRT': 'birth', 'DEAT': 'death', 'BURI': 'burial'}[tag]] = {}
+                elif tag == 'NOTE':
+                    record['notes'].append(value)
+                    last = (record['notes'], len(record['notes']) - 1)
+                elif tag == 'FAMS':
+                    record['fams'].append(_pointer(value))
+                elif tag == 'FAMC':
+                    record['famc'] = _pointer(value)
+                elif tag == 'OCCU':
+                    record['occupation'] = value
+            else:
+                if tag == 'HUSB':
+                    record['husband'] = _pointer(value)
+                elif tag == 'WIFE':
+                    record['wife'] = _pointer(value)
+                elif tag == 'CHIL':
+                    record['children'].append(_pointer(value))
+                elif tag == 'MARR':
+                    record['marriage'] = {}
+                elif tag == 'NOTE':
+                    record['notes'].append(value)
+                    last = (record['notes'], len(record['notes']) - 1)
+
+        elif level == 2:
+            target = {'BIRT': 'birth', 'DEAT': 'death', 'BURI': 'burial', 'MARR': 'marriage'}.get(event)
+            if target and tag in ('DATE', 'PLAC'):
+                record[target]['date' if tag == 'DATE' else 'place'] = value
+            elif event == 'DEAT' and tag == 'NOTE':
+                record['notes'].append(value)
+                last = (record['notes'], len(record['notes']) - 1)
+            elif event == 'NAME' and tag == 'TYPE' and record.get('names'):
+                record['names'][-1]['type'] = value
+
+    return individuals, families
+
+
+# ============================================================================
+# NORMALIZING
+# ============================================================================
+
+def display_name(indi):
+    if not indi['names']:
+        return 'Unknown'
+    primary = next((n for n in indi['names'] if not n['type']), indi['names'][0])
+    return primary['full']
+
+
+def nickname(indi):
+    return next((n['full'] for n in indi['names'] if n['type'] == 'nickname'), None)
+
+
+def display_date(event):
+    date = event.get('date', '')
+    return re.sub(r'^ABT\s*', 'c. ', date, flags=re.IGNORECASE)
+
+
+def lifespan(indi):
+    born, died = display_date(indi['birth']), display_date(indi['death'])
+    if born and died:
+        return f'{born} – {died}'
+    if born:
+        return f'b. {born}'
+    if died:
+        return f'd. {died}'
+    return ''
+
+
+def sort_key(indi):
+    """Birth year (unknown last), then name - the sidebar order."""
+    match = YEAR_PATTERN.search(indi['birth'].get('date', ''))
+    return (match.group(1) if match else '9999') + display_name(indi).lower()
+
+
+def _event(event, date=True):
+    """An event with empty fields dropped; dates made display-ready."""
+    result = {}
+    if date and event.get('date'):
+        result['date'] = display_date(event)
+    if event.get('place'):
+        result['place'] = event['place']
+    return result
+
+
+def generation_depths(parents):
+    """
+    Generation depth of every person: 0 without known parents, otherwise one
+    more than the deepest parent. Computed in topological order, so it
+    handles any number of generations without recursion.
+    """
+    count = len(parents)
+    children = [[] for _ in range(count)]
+    waiting = [len(p) for p in parents]
+    for child, ps in enumerate(parents):
+        for parent in ps:
+            children[parent].append(child)
+
+    depth = [0] * count
+    queue = deque(i for i in range(count) if waiting[i] == 0)
+    while queue:
+        person = queue.popleft()
+        for child in children[person]:
+            depth[child] = max(depth[child], depth[person] + 1)
+            waiting[child] -= 1
+            if waiting[child] == 0:
+                queue.append(child)
+    return depth
+
+
+def normalize(individuals, families):
+    """Build the indexed graph: people, families, depth, parents and children."""
+    order = sorted(individuals, key=lambda xref: sort_key(individuals[xref]))
+    person_index = {xref: i for i, xref in enumerate(order)}
+    family_order = list(families)
+    family_index = {xref: i for i, xref in enumerate(family_order)}
+
+    def person(xref):
+        return person_index.get(xref) if xref else None
+
+    compiled_families = []
+    for xref in family_order:
+        fam = families[xref]
+        entry = {
+            'id': xref,
+            'husband': person(fam['husband']),
+            'wife': person(fam['wife']),
+            'children': [person_index[c] for c in fam['children'] if c in person_index],
+        }
+        if _event(fam['marriage']):
+            entry['marriage'] = _event(fam['marriage'])
+        if fam['notes']:
+            entry['notes'] = fam['notes']
+        compiled_families.append(entry)
+
+    people = []
+    parents = []
+    for xref in order:
+        indi = individuals[xref]
+        entry = {'id': xref, 'name': display_name(indi), 'sex': indi['sex'], 'lifespan': lifespan(indi)}
+        if nickname(indi):
+            entry['nick'] = nickname(indi)
+        for key in ('birth', 'death'):
+            if _event(indi[key]):
+                entry[key] = _event(indi[key])
+        if _event(indi['burial'], date=False):
+            entry['burial'] = _event(indi['burial'], date=False)
+        if indi['occupation']:
+            entry['occupation'] = indi['occupation']
+        if indi['notes']:
+            entry['notes'] = indi['notes']
+        entry['families'] = [family_index[f] for f in indi['fams'] if f in family_index]
+        entry['parentFamily'] = family_index.get(indi['famc'])
+        people.append(entry)
+
+        fam = compiled_families[entry['parentFamily']] if entry['parentFamily'] is not None else None
+        parents.append([p for p in (fam['husband'], fam['wife']) if p is not None] if fam else [])
+
+    children = [[] for _ in people]
+    for child, ps in enumerate(parents):
+        for parent in ps:
+            children[parent].append(child)
+
+    return {
+        'people': people,
+        'families': compiled_families,
+        'depth': generation_depths(parents),
+        'parents': parents,
+        'children': children,
+    }
+
+
+# ============================================================================
+# LAYOUT
+# ============================================================================
+
+def layout_chart(graph, root):
+    """
+    Positions for the chart centred on one person: ancestors above,
+    descendants and spouses below and beside. Same algorithm as drawChart()
+    in family-tree.html, which lays out any other person the reader selects.
+    """
+    people = graph['people']
+    families = graph['families']
+    nodes, links, marriages = [], [], []
+    placed = {}
+
+    def place(i, x, y):
+        placed[i] = (x, y)
+        nodes.append([i, x, y])
+
+    def ancestors(i, x, y):
+        if i in placed:
+            return
+        place(i, x, y)
+        fam_index = people[i]['parentFamily']
+        if fam_index is None:
+            return
+        fam = families[fam_index]
+        py = y - NODE_HEIGHT - V_GAP
+        husband, wife = fam['husband'], fam['wife']
+        if husband is not None and husband not in placed:
+            ancestors(husband, x, py)
+        if wife is not None and wife not in placed:
+            wx = x + NODE_WIDTH + COUPLE_GAP
+            ancestors(wife, wx, py)
+            marriages.append([x + NODE_WIDTH, py + NODE_HEIGHT / 2, wx, py + NODE_HEIGHT / 2])
+            links.append([x + NODE_WIDTH + COUPLE_GAP / 2, py + NODE_HEIGHT, x + NODE_WIDTH / 2, y])
+        elif husband is not None and husband in placed:
+            hx, hy = placed[husband]
+            links.append([hx + NODE_WIDTH / 2, hy + NODE_HEIGHT, x + NODE_WIDTH / 2, y])
+
+    def descendants(i, x, y):
+        if i not in placed:
+            place(i, x, y)
+        total = NODE_WIDTH
+        for fam_index in people[i]['families']:
+            fam = families[fam_index]
+            spouse = fam['wife'] if fam['husband'] == i else fam['husband']
+            if spouse is not None and spouse not in placed:
+                sx = x + NODE_WIDTH + COUPLE_GAP
+                place(spouse, sx, y)
+                marriages.append([x + NODE_WIDTH, y + NODE_HEIGHT / 2, sx, y + NODE_HEIGHT / 2])
+                total = NODE_WIDTH * 2 + COUPLE_GAP
+            if fam['children']:
+                cy = y + NODE_HEIGHT + V_GAP
+                cx = x
+                pcx = x + total / 2
+                for child in fam['children']:
+                    if child in placed:
+                        continue
+                    width = descendants(child, cx, cy)
+                    links.append([pcx, y + NODE_HEIGHT, cx + NODE_WIDTH / 2, cy])
+                    cx += width + H_GAP
+        return max(total, NODE_WIDTH)
+
+    ancestors(root, ROOT_X, ROOT_Y)
+    descendants(root, *placed[root])
+    return {'root': root, 'nodes': nodes, 'links': links, 'marriages': marriages}
+
+
+def compile_gedcom(text, root_id=DEFAULT_ROOT):
+    """Parse, normalize and lay out a GEDCOM file. Returns the JSON-ready dict."""
+    individuals, families = parse_gedcom(text)
+    graph = normalize(individuals, families)
+    ids = {p['id']: i for i, p in enumerate(graph['people'])}
+    root = ids.get(root_id, 0 if graph['people'] else None)
+    graph['layout'] = layout_chart(graph, root) if root is not None else None
+    return graph
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compile a GEDCOM file for family-tree.html')
+    parser.add_argument('gedcom', nargs='?', default=str(DEFAULT_GEDCOM),
+                        help='GEDCOM file (default: family/media/omalley_family.ged)')
+    parser.add_argument('--output', '-o', help='Output JSON (default: next to the GEDCOM file)')
+    parser.add_argument('--root', default=DEFAULT_ROOT,
+                        help=f'Person shown first, by GEDCOM id (default: {DEFAULT_ROOT})')
+    parser.add_argument('--dry-run', '-n', action='store_true',
+                        help='Compile and report without writing')
+    args = parser.parse_args()
+
+    gedcom = Path(args.gedcom)
+    if not gedcom.exists():
+        print(f"Error: GEDCOM file not found: {gedcom}")
+        sys.exit(1)
+    output = Path(args.output) if args.output else gedcom.with_suffix('.json')
+
+    graph = compile_gedcom(gedcom.read_text(encoding='utf-8'), args.root)
+    data = json.dumps(graph, ensure_ascii=False, separators=(',', ':'))
+
+    print(f"Compiled {gedcom.name}: {len(graph['people'])} people, {len(graph['families'])} families, "
+          f"{max(graph['depth'], default=-1) + 1} generations")
+    if graph['layout']:
+        print(f"  Initial chart: {graph['people'][graph['layout']['root']]['name']} "
+              f"({len(graph['layout']['nodes'])} nodes)")
+    if args.dry_run:
+        print(f"  Would write {output.name} ({len(data):,} bytes)")
+        return
+
+    output.write_text(data, encoding='utf-8')
+    print(f"  Wrote {output.name} ({len(data):,} bytes)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Encrypt the family pages with staticrypt - only the ones that changed.
+
+staticrypt picks a fresh random IV every time it runs, so re-encrypting an
+unchanged page still changes every byte of it and the host uploads it
+again. This keeps the last ciphertext of each page in family/.encrypted/
+along with a manifest of what it was built from:
+
+- the SHA-256 of the plaintext page
+- the SHA-256 of the staticrypt options and password template
+- a PBKDF2 check value of the password (salted, so it reveals no more
+  than the encrypted pages themselves)
+
+Pages whose inputs all match reuse their cached ciphertext; the rest are
+encrypted in a single staticrypt run. Nothing is encrypted, and Node is
+never started, when no page changed. The encrypted pages are then copied
+over the plaintext ones, unless --no-install is given: deploy-family.sh
+passes it, leaving family/ in plaintext, and build_dist.py takes the pages
+from the cache.
+
+Usage:
+    STATICRYPT_PASSWORD=... python encrypt_family.py [--force] [--dry-run] [--no-install]
+"""
+
+import os
+import re
+import sys
+import json
+import shutil
+import hashlib
+import argparse
+import secrets
+import subprocess
+import tempfile
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+
+FAMILY_DIR = PROJECT_ROOT / 'family'
+CACHE_DIR = FAMILY_DIR / '.encrypted'
+MANIFEST = CACHE_DIR / 'manifest.json'
+TEMPLATE = FAMILY_DIR / 'password-template.html'
+
+FAMILY_PAGES = [
+    'index.html',
+    'stories-mom-told.html',
+    'stories-mom-wrote.html',
+    'family-history.html',
+    'family-tree.html',
+    'memorial-video.html',
+] + sorted(p.name for p in FAMILY_DIR.glob('transcript-*.html'))
+
+STATICRYPT_OPTIONS = [
+    '--remember', '30',
+    '-t', 'family/password-template.html',
+    '--template-title', 'Horn Family',
+    '--template-button', 'Enter',
+    '--template-instructions', 'This area is for family members.',
+    '--template-error', 'Incorrect password. Please try again.',
+    '--template-placeholder', 'Family password',
+    '--short',
+]
+
+# The ciphertext staticrypt embeds in its config object in every page it
+# encrypts; the bare word "staticrypt" also turns up in plaintext pages
+ENCRYPTED_PATTERN = re.compile(rb'"staticryptEncryptedMsgUniqueVariableName"\s*:\s*"[0-9a-f]+"')
+
+KEY_CHECK_ITERATIONS = 200_000
+
+
+def is_encrypted(data):
+    """Whether page bytes are staticrypt output rather than a plaintext page."""
+    return ENCRYPTED_PATTERN.search(data) is not None
+
+
+def read_password():
+    """STATICRYPT_PASSWORD, with surrounding quotes stripped (some shells keep them)."""
+    password = os.environ.get('STATICRYPT_PASSWORD', '')
+    for quote in ("'", '"'):
+        if len(password) >= 2 and password[0] == quote and password[-1] == quote:
+            password = password[1:-1]
+    return password
+
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def options_hash():
+    """Hash of everything besides the page and password that shapes the output."""
+    template = TEMPLATE.read_bytes() if TEMPLATE.exists() else b''
+    return sha256(json.dumps(STATICRYPT_OPTIONS).encode('utf-8') + b'\0' + template)
+
+
+def key_check(password, salt):
+    return hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), bytes.fromhex(salt),
+                               KEY_CHECK_ITERATIONS).hex()
+
+
+def load_manifest():
+    if MANIFEST.exists():
+        with open(MANIFEST, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {'salt': secrets.token_hex(16), 'keyCheck': None, 'options': None, 'pages': {}}
+
+
+def save_manifest(manifest):
+    with open(MANIFEST, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+        f.write('\n')
+
+
+def run_staticrypt(args):
+    """Run staticrypt through npx from the project root. Returns True on success."""
+    result = subprocess.run(['npx', 'staticrypt', *args], cwd=PROJECT_ROOT)
+    return result.returncode == 0
+
+
+def verify(page, password):
+    """Check that a freshly encrypted page decrypts with the password."""
+    with tempfile.TemporaryDirectory() as temp:
+        return run_staticrypt(['--decrypt', str(CACHE_DIR / page), '-p', password, '-d', temp])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Encrypt changed family pages with staticrypt')
+    parser.add_argument('--force', '-f', action='store_true',
+                        help='Re-encrypt every page, even unchanged ones')
+    parser.add_argument('--dry-run', '-n', action='store_true',
+                        help='Report which pages would be encrypted')
+    parser.add_argument('--no-install', action='store_true',
+                        help='Update the cache only; leave the plaintext pages in place')
+    args = parser.parse_args()
+
+    password = read_password()
+    if not password:
+        print("Error: STATICRYPT_PASSWORD environment variable is not set.")
+        print("Usage: STATICRYPT_PASSWORD=your-password python scripts/encrypt_family.py")
+        sys.exit(1)
+
+    manifest = load_manifest()
+    key = key_check(password, manifest['salt'])
+    options = options_hash()
+    inputs_changed = args.force or manifest['keyCheck'] != key or manifest['options'] != options
+
+    sources = {}
+    stale = []
+    for page in FAMILY_PAGES:
+        data = (FAMILY_DIR / page).read_bytes()
+        if is_encrypted(data):
+            print(f"Error: family/{page} is already encrypted - restore the plaintext first:")
+            print("  git checkout -- family/")
+            sys.exit(1)
+        sources[page] = sha256(data)
+        cached = CACHE_DIR / page
+        if inputs_changed or manifest['pages'].get(page) != sources[page] or not cached.exists():
+            stale.append(page)
+
+    print(f"{'DRY RUN - ' if args.dry_run else ''}Family pages: "
+          f"{len(stale)} to encrypt, {len(FAMILY_PAGES) - len(stale)} unchanged")
+    for page in stale:
+        print(f"  encrypt: {page}")
+    if args.dry_run:
+        return
+
+    if stale:
+        CACHE_DIR.mkdir(exist_ok=True)
+        paths = [f'family/{page}' for page in stale]
+        if not run_staticrypt([*paths, '-p', password, *STATICRYPT_OPTIONS, '-d', str(CACHE_DIR)]):
+            print("Error: staticrypt failed")
+            sys.exit(1)
+        if not verify(stale[0], password):
+            print("ERROR: Verification FAILED - encrypted page cannot be decrypted with the given password!")
+            sys.exit(1)
+        print("Verification passed - password decrypts correctly.")
+
+        manifest.update(keyCheck=key, options=options)
+        manifest['pages'].update({page: sources[page] for page in stale})
+        save_manifest(manifest)
+
+    if not args.no_install:
+        for page in FAMILY_PAGES:
+            shutil.copyfile(CACHE_DIR / page, FAMILY_DIR / page)
+        print(f"Installed {len(FAMILY_PAGES)} encrypted pages in family/")
+
+
+if __name__ == '__main__':
+    main()
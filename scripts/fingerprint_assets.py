@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Fingerprint the site's shared assets and write Netlify cache headers.
+
+Every page used to link styles.css, script.js and friends by fixed names,
+so browsers had to revalidate each one on every visit. This gives each
+asset a copy named after its content hash:
+
+    styles.css  ->  styles.3f2a9c1e07.css
+
+and rewrites the references to it in every page (and in the other assets,
+so search-worker.js fetches fingerprinted indexes). A changed asset gets a
+new name, so the copies can be cached forever. The source files keep their
+plain names and remain what you edit; copies from earlier builds are
+removed.
+
+Also written:
+
+- asset-manifest.json - {asset: fingerprinted name}, which the page
+  generators read so new pages link the current copies
+- _headers - Netlify headers: a year and `immutable` for fingerprinted
+  copies, a few minutes (then revalidation) for pages and data
+
+Run after editing an asset or regenerating the search index, and before
+deploying. Only files whose content changes are rewritten.
+
+Usage:
+    python fingerprint_assets.py [--dry-run]
+"""
+
+import re
+import sys
+import json
+import hashlib
+import argparse
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+
+# Assets at the site root, each listed after the assets it references
+ASSETS = [
+    'styles.css',
+    'listing.css',
+    'meditation.css',
+    'script.js',
+    'search-index.json',
+    'search-bm25.json',
+    'search-lsa.json',
+    'search-positions.json',
+    'search-spell.json',
+    'search-suggest.json',
+    'search-worker.js',
+]
+
+PAGE_GLOBS = ['*.html', 'meditations/*.html', 'listings/*.html', 'family/*.html']
+
+MANIFEST_NAME = 'asset-manifest.json'
+HEADERS_NAME = '_headers'
+HASH_LENGTH = 10
+
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+SHORT_CACHE = 'public, max-age=300, must-revalidate'
+
+# Directories of files named by content hash (build_css.py, build_fonts.py)
+HASHED_DIRS = ['css', 'fonts']
+
+# Directories whose files are all pages or per-page data
+SHORT_CACHE_DIRS = ['meditations', 'family', 'listings', 'search-snippets']
+
+
+# ============================================================================
+# NAMES AND REFERENCES
+# ============================================================================
+
+def split_name(asset):
+    stem, ext = asset.rsplit('.', 1)
+    return stem, ext
+
+
+def fingerprinted_name(asset, data):
+    stem, ext = split_name(asset)
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}.{ext}"
+
+
+def reference_pattern(asset):
+    """
+    Matches a reference to the asset by plain or fingerprinted name (any
+    hash): right after a quote or a slash, so mentions in comments and
+    longer names containing it are left alone.
+    """
+    stem, ext = split_name(asset)
+    return re.compile(r'(?<=["\'`/])' + re.escape(stem) + r'(?:\.[0-9a-f]{%d})?\.' % HASH_LENGTH
+                      + re.escape(ext) + r'(?![\w-])')
+
+
+REFERENCE_PATTERNS = {asset: reference_pattern(asset) for asset in ASSETS}
+
+
+def rewrite_references(text, names):
+    """Point every reference to an asset in names at its fingerprinted copy."""
+    for asset, name in names.items():
+        text = REFERENCE_PATTERNS[asset].sub(name, text)
+    return text
+
+
+def asset_names(site_dir=PROJECT_ROOT):
+    """
+    {asset: name to link} from the site's asset-manifest.json - the
+    fingerprinted copy where there is one, the plain name otherwise.
+    """
+    names = {asset: asset for asset in ASSETS}
+    manifest = Path(site_dir) / MANIFEST_NAME
+    if manifest.exists():
+        with open(manifest, 'r', encoding='utf-8') as f:
+            names.update(json.load(f))
+    return names
+
+
+# ============================================================================
+# BUILD
+# ============================================================================
+
+def fingerprint(site_dir):
+    """
+    Fingerprinted content for each asset, in ASSETS order: {asset: (name, bytes)}.
+    Each asset's references to earlier assets are rewritten first, so its
+    hash covers them.
+    """
+    built = {}
+    for asset in ASSETS:
+        data = (site_dir / asset).read_bytes()
+        if built:
+            names = {a: name for a, (name, _) in built.items()}
+            data = rewrite_references(data.decode('utf-8'), names).encode('utf-8')
+        built[asset] = (fingerprinted_name(asset, data), data)
+    return built
+
+
+def stale_copies(site_dir, asset, current):
+    """Fingerprinted copies of an asset other than the current one."""
+    stem, ext = split_name(asset)
+    pattern = re.compile(re.escape(stem) + r'\.[0-9a-f]{%d}\.' % HASH_LENGTH + re.escape(ext) + '$')
+    return [p for p in site_dir.glob(f'{stem}.*.{ext}') if pattern.match(p.name) and p.name != current]
+
+
+def render_headers(site_dir, names):
+    """Netlify _headers: immutable fingerprinted copies, short-lived pages and data."""
+    fingerprinted = sorted(names.values())
+    lines = [
+        '# Generated by scripts/fingerprint_assets.py - do not edit',
+        '',
+        '# Fingerprinted assets: the name changes whenever the content does',
+    ]
+    for name in fingerprinted:
+        lines += [f'/{name}', f'  Cache-Control: {IMMUTABLE_CACHE}']
+    for directory in HASHED_DIRS:
+        if (site_dir / directory).is_dir():
+            lines += [f'/{directory}/*', f'  Cache-Control: {IMMUTABLE_CACHE}']
+
+    # Every other file gets its own rule, so no path matches two rules
+    lines += ['', '# Pages and data: cached briefly, then revalidated', '/', f'  Cache-Control: {SHORT_CACHE}']
+    skip = set(fingerprinted) | {HEADERS_NAME}
+    for path in sorted(site_dir.iterdir()):
+        if path.is_file() and path.suffix in ('.html', '.json', '.css', '.js') and path.name not in skip:
+            lines += [f'/{path.name}', f'  Cache-Control: {SHORT_CACHE}']
+    for directory in SHORT_CACHE_DIRS:
+        lines += [f'/{directory}/*', f'  Cache-Control: {SHORT_CACHE}']
+    return '\n'.join(lines) + '\n'
+
+
+def write_if_changed(path, data, dry_run):
+    """Write bytes to path unless it already holds them. Returns True if it changed."""
+    if path.exists() and path.read_bytes() == data:
+        return False
+    if not dry_run:
+        path.write_bytes(data)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Fingerprint shared assets and write Netlify cache headers')
+    parser.add_argument('--dry-run', '-n', action='store_true',
+                        help='Report what would change without writing files')
+    args = parser.parse_args()
+
+    missing = [asset for asset in ASSETS if not (PROJECT_ROOT / asset).exists()]
+    if missing:
+        print(f"Error: assets not found: {', '.join(missing)}")
+        sys.exit(1)
+
+    print(f"{'DRY RUN - ' if args.dry_run else ''}Fingerprinting {len(ASSETS)} assets...")
+    wrote, removed, updated = (('Would write', 'Would remove', 'Would update') if args.dry_run
+                               else ('Wrote', 'Removed', 'Updated'))
+
+    built = fingerprint(PROJECT_ROOT)
+    names = {asset: name for asset, (name, _) in built.items()}
+    for asset, (name, data) in built.items():
+        if write_if_changed(PROJECT_ROOT / name, data, args.dry_run):
+            print(f"  {wrote} {name}")
+        for stale in stale_copies(PROJECT_ROOT, asset, name):
+            print(f"  {removed} {stale.name}")
+            if not args.dry_run:
+                stale.unlink()
+
+    pages = sorted(p for pattern in PAGE_GLOBS for p in PROJECT_ROOT.glob(pattern))
+    rewritten = 0
+    for page in pages:
+        text = page.read_text(encoding='utf-8')
+        rewritten += write_if_changed(page, rewrite_references(text, names).encode('utf-8'), args.dry_run)
+    print(f"  {updated} references in {rewritten} of {len(pages)} pages")
+
+    # build_fonts.py keeps its own entries in the manifest
+    manifest = (json.dumps({**asset_names(PROJECT_ROOT), **names}, indent=2) + '\n').encode('utf-8')
+    if write_if_changed(PROJECT_ROOT / MANIFEST_NAME, manifest, args.dry_run):
+        print(f"  {updated} {MANIFEST_NAME}")
+    headers = render_headers(PROJECT_ROOT, names).encode('utf-8')
+    if write_if_changed(PROJECT_ROOT / HEADERS_NAME, headers, args.dry_run):
+        print(f"  {updated} {HEADERS_NAME}")
+
+if __name__ == '__main__':
+    main()
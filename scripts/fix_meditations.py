@@ -0,0 +1,471 @@
+#!/usr/bin/env python3
+"""
+One-pass repair engine for meditation HTML files.
+
+Runs every registered fixer over each meditation in a single pass:
+
+1. Each file is read and parsed once into a shared record
+2. Every fixer is a pure transform: it receives the record and returns the
+   fields it wants to change (plus any notes)
+3. Only the elements whose fields changed are patched, in place, so
+   everything the later build stages added to the page (navigation,
+   related meditations, critical CSS) is left as it is. A file is written
+   at most once, and only if a fixer changed it
+4. All writes are staged to temporary files and committed together, so an
+   interrupted run never leaves the meditations half-fixed
+
+Fixers (in the order they run):
+    readings        - fix_meditation_readings.py: put scripture in the readings div
+    title-in-content - fix_meditation_titles.py: move a title found in <p> into the <h1>
+    title-case      - fix_titles.py: smart Title Case and spacing cleanup
+    page-title      - keep <title> in sync with the meditation title
+
+Pages flattened by an earlier BeautifulSoup rewrite are reported for
+reformat_meditations.py, which rebuilds the whole page layout.
+
+Usage:
+    python fix_meditations.py [/path/to/meditations] [--dry-run] [--diff] [--verbose]
+                              [--only readings,title-case] [--report path.csv]
+
+The consolidated report (every change and every issue needing manual review)
+is written to scripts/meditation_issues_report.csv; a dry run leaves it as
+it is.
+"""
+
+import os
+import re
+import csv
+import sys
+import difflib
+import argparse
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+from bs4 import BeautifulSoup
+
+from fix_titles import smart_title_case, check_for_issues
+from fix_meditation_titles import is_valid_title, looks_like_scripture, looks_like_occasion, title_case_smart
+from fix_meditation_readings import contains_scripture, extract_readings_from_title
+from reformat_meditations import escape_html
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+DEFAULT_REPORT = SCRIPT_DIR / 'meditation_issues_report.csv'
+
+SITE_SUFFIX = ' | Threads of Grace'
+
+# Elements holding the record's text fields: (opening tag, text, closing tag)
+FIELD_PATTERNS = {
+    'title': re.compile(r'(<title>)(.*?)(</title>)', re.DOTALL),
+    'meditation_title': re.compile(r'(<h1 class="meditation-title-display">)(.*?)(</h1>)', re.DOTALL),
+    'date': re.compile(r'(<div class="meditation-date-display">)(.*?)(</div>)', re.DOTALL),
+    'occasion': re.compile(r'(<div class="meditation-occasion">)(.*?)(</div>)', re.DOTALL),
+    'readings': re.compile(r'(<div class="meditation-readings">)(.*?)(</div>)', re.DOTALL),
+}
+# The paragraphs come before the author line in the content div
+CONTENT_PATTERN = re.compile(
+    r'<div class="meditation-content">(.*?)(?:<div class="meditation-author">|</div>)', re.DOTALL)
+PARAGRAPH_PATTERN = re.compile(r'[ \t]*<p\b[^>]*>.*?</p>[ \t]*\n?', re.DOTALL)
+
+
+# =============================================================================
+# RECORD
+# =============================================================================
+
+def parse_record(content):
+    """
+    Parse a meditation page once into the shared record.
+
+    Keys match reformat_meditations.extract_data().
+    """
+    soup = BeautifulSoup(content, 'html.parser')
+
+    def text_of(tag, class_=None):
+        elem = soup.find(tag, class_=class_) if class_ else soup.find(tag)
+        return elem.get_text().strip() if elem else ''
+
+    paragraphs = []
+    content_div = soup.find('div', class_='meditation-content')
+    if content_div:
+        for p in content_div.find_all('p'):
+            paragraphs.append(p.get_text().strip())
+
+    prev_link = None
+    next_link = None
+    nav = soup.find('nav', class_='meditation-nav')
+    if nav:
+        for link in nav.find_all('a'):
+            classes = link.get('class', [])
+            entry = {'href': link.get('href', ''), 'text': link.get_text().strip()}
+            if 'prev' in classes:
+                prev_link = entry
+            elif 'next' in classes:
+                next_link = entry
+
+    return {
+        'title': text_of('title'),
+        'meditation_title': text_of('h1', 'meditation-title-display'),
+        'date': text_of('div', 'meditation-date-display'),
+        'occasion': text_of('div', 'meditation-occasion'),
+        'readings': text_of('div', 'meditation-readings'),
+        'paragraphs': tuple(paragraphs),
+        'prev_link': prev_link,
+        'next_link': next_link,
+    }
+
+
+def remove_paragraphs(content, old, new):
+    """
+    Drop the <p> elements of the old paragraphs that new leaves out (new
+    must keep the rest in order). Returns None if they cannot be located.
+    """
+    match = CONTENT_PATTERN.search(content)
+    if not match:
+        return None
+    spans = list(PARAGRAPH_PATTERN.finditer(content, match.start(1), match.end(1)))
+    if len(spans) != len(old):
+        return None
+
+    removed = []
+    kept = 0
+    for span, text in zip(spans, old):
+        if kept < len(new) and new[kept] == text:
+            kept += 1
+        else:
+            removed.append(span)
+    if kept != len(new):
+        return None
+
+    for span in reversed(removed):
+        content = content[:span.start()] + content[span.end():]
+    return content
+
+
+def patch_record(source, original, record):
+    """
+    Write the fields that differ from the original record into the page,
+    replacing just those elements' text. Returns (content, fields that
+    could not be located).
+    """
+    content = source
+    failed = []
+    for field, pattern in FIELD_PATTERNS.items():
+        if record[field] == original[field]:
+            continue
+        text = escape_html(record[field])
+        content, count = pattern.subn(lambda m: m.group(1) + text + m.group(3), content, count=1)
+        if not count:
+            failed.append(field)
+
+    if record['paragraphs'] != original['paragraphs']:
+        patched = remove_paragraphs(content, original['paragraphs'], record['paragraphs'])
+        if patched is None:
+            failed.append('paragraphs')
+        else:
+            content = patched
+    return content, failed
+
+
+def is_flattened(source):
+    """Page was flattened by an earlier BeautifulSoup rewrite."""
+    return '<meta charset="utf-8"/>' in source or '\n<meta charset=' in source
+
+
+# =============================================================================
+# FIXERS
+# =============================================================================
+
+FIXERS = []
+
+
+def register_fixer(name):
+    """
+    Register a fixer. A fixer takes (record, source) and returns
+    (updates, notes): a dict of fields to change and a list of notes.
+    It must not modify the record it is given.
+    """
+    def decorator(func):
+        FIXERS.append((name, func))
+        return func
+    return decorator
+
+
+@register_fixer('readings')
+def fix_readings(record, source):
+    """Readings div shows the occasion instead of scripture."""
+    if contains_scripture(record['readings']):
+        return {}, []
+
+    new_readings = extract_readings_from_title(record['title'])
+
+    # Some meditations carry the readings as their first paragraph
+    if not new_readings and record['paragraphs']:
+        first = record['paragraphs'][0]
+        if (len(first) < 200 and contains_scripture(first)
+                and not re.match(r'^(The|In|When|As|Our|Today|This|It|We|He|She|They)\s', first)):
+            new_readings = first
+
+    if not new_readings or new_readings == record['readings']:
+        return {}, []
+    return {'readings': new_readings}, []
+
+
+@register_fixer('title-in-content')
+def fix_title_in_content(record, source):
+    """Title was left in one of the first paragraphs instead of the <h1>."""
+    if is_valid_title(record['meditation_title']):
+        return {}, []
+
+    paragraphs = record['paragraphs']
+    for i, text in enumerate(paragraphs[:5]):
+        if not text or looks_like_scripture(text) or looks_like_occasion(text):
+            continue
+        if is_valid_title(text):
+            return {
+                'meditation_title': title_case_smart(text),
+                'paragraphs': paragraphs[:i] + paragraphs[i + 1:],
+            }, [f"moved title from <p{i + 1}>"]
+
+    return {}, []
+
+
+@register_fixer('title-case')
+def fix_title_case(record, source):
+    """ALL CAPS titles, stray spaces before punctuation, underscore separators."""
+    title = record['meditation_title']
+    if not title:
+        return {}, []
+    fixed = smart_title_case(title)
+    if fixed == title:
+        return {}, []
+    return {'meditation_title': fixed}, []
+
+
+@register_fixer('page-title')
+def fix_page_title(record, source):
+    """<title> shows readings (or a stale title) instead of the meditation title."""
+    if not record['meditation_title']:
+        return {}, []
+    expected = record['meditation_title'] + SITE_SUFFIX
+    if record['title'] == expected:
+        return {}, []
+    return {'title': expected}, []
+
+
+# =============================================================================
+# ISSUES NEEDING MANUAL REVIEW
+# =============================================================================
+
+def collect_issues(record, source):
+    """Problems no fixer can repair automatically."""
+    issues = []
+    if is_flattened(source):
+        issues.append('FLATTENED_LAYOUT (run reformat_meditations.py)')
+    if not record['meditation_title']:
+        issues.append('MISSING_TITLE')
+    else:
+        issues.extend(check_for_issues(record['meditation_title'], None))
+    if not record['readings']:
+        issues.append('EMPTY_READINGS')
+    elif not contains_scripture(record['readings']):
+        issues.append('OCCASION_IN_READINGS')
+    if not record['paragraphs']:
+        issues.append('EMPTY_CONTENT')
+    return issues
+
+
+# =============================================================================
+# ENGINE
+# =============================================================================
+
+def process_file(args):
+    """Parse, fix and patch one file. Runs in a worker process."""
+    filepath, only = args
+    with open(filepath, 'r', encoding='utf-8') as f:
+        source = f.read()
+
+    original = record = parse_record(source)
+    changes = []
+    notes = []
+
+    for name, fixer in FIXERS:
+        if only and name not in only:
+            continue
+        updates, fixer_notes = fixer(record, source)
+        for field, value in updates.items():
+            changes.append((name, field, record[field], value))
+        notes.extend(f"{name}: {note}" for note in fixer_notes)
+        if updates:
+            record = {**record, **updates}
+
+    issues = collect_issues(record, source)
+    new_content = None
+    if changes:
+        new_content, failed = patch_record(source, original, record)
+        if failed:
+            # Leave the page alone rather than write half the fixes
+            issues.append(f"UNPATCHED ({', '.join(failed)} not found)")
+            changes = []
+            new_content = None
+        elif new_content == source:
+            new_content = None
+
+    return {
+        'filepath': filepath,
+        'source': source,
+        'new_content': new_content,
+        'changes': changes,
+        'notes': notes,
+        'issues': issues,
+    }
+
+
+def commit_changes(results):
+    """
+    Write every changed file atomically: stage all new contents to temp files
+    first, then swap them into place only if every stage succeeded.
+    """
+    staged = []
+    try:
+        for result in results:
+            target = Path(result['filepath'])
+            temp = target.with_name(f'.{target.name}.tmp')
+            with open(temp, 'w', encoding='utf-8') as f:
+                f.write(result['new_content'])
+                f.flush()
+                os.fsync(f.fileno())
+            staged.append((temp, target))
+    except OSError:
+        for temp, _ in staged:
+            temp.unlink(missing_ok=True)
+        raise
+
+    for temp, target in staged:
+        os.replace(temp, target)
+
+    return len(staged)
+
+
+def format_value(value):
+    """Render a field value for the report."""
+    if isinstance(value, (list, tuple)):
+        return f"[{len(value)} paragraphs]"
+    return value
+
+
+def write_report(results, report_path):
+    """Write one consolidated CSV of every change and every open issue."""
+    with open(report_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['date', 'fixer', 'field', 'before', 'after', 'issues'])
+        for result in results:
+            date = Path(result['filepath']).stem
+            issues = '; '.join(result['issues'])
+            if not result['changes'] and not issues:
+                continue
+            for name, field, before, after in result['changes']:
+                writer.writerow([date, name, field, format_value(before), format_value(after), issues])
+            if not result['changes']:
+                writer.writerow([date, '', '', '', '', issues])
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Run every meditation fixer in one pass'
+    )
+    parser.add_argument('meditations_dir', nargs='?',
+                        default=str(SCRIPT_DIR.parent / 'meditations'),
+                        help='Directory of meditation HTML files')
+    parser.add_argument('--dry-run', '-n', action='store_true',
+                        help='Show what would be changed without modifying files')
+    parser.add_argument('--diff', '-d', action='store_true',
+                        help='Print a unified diff of every change')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help='List each change and issue')
+    parser.add_argument('--only', default='',
+                        help='Comma-separated fixers to run (default: all)')
+    parser.add_argument('--report', default=str(DEFAULT_REPORT),
+                        help='Where to write the consolidated CSV report')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: one per core)')
+
+    args = parser.parse_args()
+
+    meditations_dir = Path(args.meditations_dir)
+    if not meditations_dir.exists():
+        print(f"Error: meditations directory not found: {meditations_dir}")
+        return 1
+
+    known = [name for name, _ in FIXERS]
+    only = {name.strip() for name in args.only.split(',') if name.strip()}
+    unknown = only - set(known)
+    if unknown:
+        print(f"Error: unknown fixer(s): {', '.join(sorted(unknown))}")
+        print(f"Available: {', '.join(known)}")
+        return 1
+
+    print(f"{'DRY RUN - ' if args.dry_run else ''}Fixing meditations...")
+    print(f"Scanning: {meditations_dir}")
+    print(f"Fixers:   {', '.join(n for n in known if not only or n in only)}")
+    print()
+
+    html_files = sorted(str(p) for p in meditations_dir.glob('*.html'))
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        results = list(pool.map(process_file, [(f, only) for f in html_files], chunksize=16))
+
+    changed = [r for r in results if r['new_content'] is not None]
+    with_issues = [r for r in results if r['issues']]
+
+    per_fixer = {name: 0 for name in known}
+    for result in changed:
+        for name in {c[0] for c in result['changes']} | {n.split(':')[0] for n in result['notes']}:
+            per_fixer[name] += 1
+
+    for result in changed:
+        name = Path(result['filepath']).name
+        if args.verbose:
+            print(f"{'Would fix' if args.dry_run else 'Fixing'}: {name}")
+            for fixer, field, before, after in result['changes']:
+                print(f"  [{fixer}] {field}: {format_value(before)!r} -> {format_value(after)!r}")
+            for note in result['notes']:
+                print(f"  [{note}]")
+        if args.diff:
+            sys.stdout.writelines(difflib.unified_diff(
+                result['source'].splitlines(keepends=True),
+                result['new_content'].splitlines(keepends=True),
+                fromfile=f'a/meditations/{name}',
+                tofile=f'b/meditations/{name}',
+            ))
+
+    if args.verbose and with_issues:
+        print()
+        print("Needs manual review:")
+        for result in with_issues:
+            print(f"  {Path(result['filepath']).name}: {'; '.join(result['issues'])}")
+
+    if not args.dry_run:
+        write_report(results, args.report)
+
+    if changed and not args.dry_run:
+        written = commit_changes(changed)
+    else:
+        written = 0
+
+    print()
+    print("Summary:")
+    print(f"  Files scanned: {len(results)}")
+    for name in known:
+        if not only or name in only:
+            print(f"  {name:<17} {per_fixer[name]}")
+    print(f"  {'Would write' if args.dry_run else 'Written'}: {len(changed) if args.dry_run else written}")
+    print(f"  Needing manual review: {len(with_issues)}")
+    print(f"  Report: {'not written (dry run)' if args.dry_run else args.report}")
+
+    if args.dry_run and changed:
+        print()
+        print("Run without --dry-run to apply changes.")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
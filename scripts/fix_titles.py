@@ -67,13 +67,13 @@ def smart_title_case(title):
         # Extract any leading punctuation
         leading_punct = ''
         core_word = word
-        while core_word and core_word[0] in '"\'""''(':
+        while core_word and core_word[0] in '"\'\u2018\u201c(':
             leading_punct += core_word[0]
             core_word = core_word[1:]
 
         # Extract any trailing punctuation
         trailing_punct = ''
-        while core_word and core_word[-1] in '"\'""'').,!?;:':
+        while core_word and core_word[-1] in '"\'\u2019\u201d).,!?;:':
             trailing_punct = core_word[-1] + trailing_punct
             core_word = core_word[:-1]
 
@@ -101,12 +101,12 @@ def smart_title_case(title):
         elif not should_capitalize and core_word.lower() in LOWERCASE_WORDS:
             core_word = core_word.lower()
         # Check for contractions and possessives
-        elif "'" in core_word or "'" in core_word:
+        elif "'" in core_word or "\u2019" in core_word:
             # Handle contractions like "God's", "Don't", "It's"
-            parts = re.split(r"(['']\w*)", core_word)
+            parts = re.split(r"(['\u2019]\w*)", core_word)
             core_word = ''
             for j, part in enumerate(parts):
-                if part.startswith("'") or part.startswith("'"):
+                if part.startswith("'") or part.startswith("\u2019"):
                     core_word += part.lower()
                 elif j == 0:
                     core_word += part.capitalize()
@@ -174,7 +174,7 @@ def check_for_issues(title, filename):
         issues.append("Contains Word embedding artifact")
     
     # Check for unusual characters
-    unusual = re.findall(r'[^\w\s\'"".,,!?;:\-–—/()&''"]', title)
+    unusual = re.findall(r'[^\w\s\'"\u2018\u2019\u201c\u201d.,!?;:\-–—/()&]', title)
     if unusual:
         issues.append(f"Contains unusual characters: {set(unusual)}")
     
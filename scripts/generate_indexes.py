@@ -19,14 +19,13 @@ It will create:
     - /path/to/website/appendix-statistics.html
 """
 
-import os
 import sys
 import re
-import hashlib
 from datetime import datetime
 from collections import defaultdict
 from pathlib import Path
-from html.parser import HTMLParser
+
+from meditation_corpus import Corpus
 
 # ============================================================================
 # CONFIGURATION
@@ -50,100 +49,6 @@ BOOK_ORDER = [
     "1 John", "2 John", "3 John", "Jude", "Revelation"
 ]
 
-# ============================================================================
-# HTML PARSER
-# ============================================================================
-
-class MeditationParser(HTMLParser):
-    """Parse a meditation HTML file to extract metadata."""
-    
-    def __init__(self):
-        super().__init__()
-        self.current_tag = None
-        self.current_class = None
-        self.data = {
-            'title': '',
-            'date_display': '',
-            'occasion': '',
-            'readings': '',
-            'content_paragraphs': []
-        }
-        self.in_content = False
-        self.current_content_class = None
-    
-    def handle_starttag(self, tag, attrs):
-        self.current_tag = tag
-        attrs_dict = dict(attrs)
-        self.current_class = attrs_dict.get('class', '')
-        
-        if 'meditation-content' in self.current_class:
-            self.in_content = True
-        if self.in_content and tag == 'p':
-            self.current_content_class = self.current_class
-    
-    def handle_endtag(self, tag):
-        if tag == 'div' and self.in_content:
-            self.in_content = False
-        self.current_tag = None
-        self.current_class = None
-    
-    def handle_data(self, data):
-        data = data.strip()
-        if not data:
-            return
-        
-        if self.current_class == 'meditation-title-display':
-            self.data['title'] = data
-        elif self.current_class == 'meditation-date-display':
-            self.data['date_display'] = data
-        elif self.current_class == 'meditation-occasion':
-            self.data['occasion'] = data
-        elif self.current_class == 'meditation-readings':
-            self.data['readings'] = data
-        elif self.in_content and self.current_tag == 'p' and 'meditation-author' not in (self.current_content_class or ''):
-            self.data['content_paragraphs'].append(data)
-
-
-def parse_meditation_html(filepath):
-    """Parse a meditation HTML file and return metadata."""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except Exception as e:
-        print(f"Error reading {filepath}: {e}")
-        return None
-    
-    # Extract date from filename
-    filename = os.path.basename(filepath)
-    date_match = re.match(r'(\d{4}-\d{2}-\d{2})\.html', filename)
-    if not date_match:
-        return None
-    
-    date_str = date_match.group(1)
-    
-    # Parse HTML
-    parser = MeditationParser()
-    try:
-        parser.feed(content)
-    except Exception as e:
-        print(f"Error parsing {filepath}: {e}")
-        return None
-    
-    # Create content hash for detecting duplicates
-    content_text = '\n'.join(parser.data['content_paragraphs'])
-    content_hash = hashlib.md5(content_text.encode()).hexdigest()
-    
-    return {
-        'date': date_str,
-        'date_display': parser.data['date_display'],
-        'title': parser.data['title'],
-        'occasion': parser.data['occasion'],
-        'readings': parser.data['readings'],
-        'content_hash': content_hash,
-        'filename': filename
-    }
-
-
 # ============================================================================
 # SCRIPTURE PARSING
 # ============================================================================
@@ -555,7 +460,7 @@ def generate_title_index(meditations, output_path):
                 for med in group['meditations']:
                     date_formatted = format_date_short(med['date'])
                     # Get short occasion
-                    occasion = med.get('occasion', '')
+                    occasion = med.get('occasion_full', '')
                     occasion_short = occasion.split('•')[0].strip() if '•' in occasion else occasion
                     # Truncate if too long
                     if len(occasion_short) > 50:
@@ -741,13 +646,13 @@ def generate_statistics_appendix(meditations, output_path):
     # Statistics by season
     by_season = defaultdict(int)
     for med in meditations:
-        season = get_season_from_occasion(med['occasion'])
+        season = get_season_from_occasion(med['occasion_full'])
         by_season[season] += 1
     
     # Statistics by lectionary year
     by_lectionary = defaultdict(int)
     for med in meditations:
-        ly = get_lectionary_year(med['occasion'])
+        ly = get_lectionary_year(med['occasion_full'])
         if ly:
             by_lectionary[ly] += 1
     
@@ -854,7 +759,7 @@ def generate_statistics_appendix(meditations, output_path):
 '''
         for med in meds:
             date_formatted = format_date_short(med['date'])
-            occasion_short = med['occasion'].split('•')[0].strip() if '•' in med['occasion'] else med['occasion']
+            occasion_short = med['occasion_full'].split('•')[0].strip() if '•' in med['occasion_full'] else med['occasion_full']
             content += f'''                    <li>
                         <a href="meditations/{med['filename']}">{date_formatted}</a>
                         <span class="index-occasion">{occasion_short}</span>
@@ -908,12 +813,7 @@ def main():
     
     # Parse all meditation files
     print(f"Scanning {meditations_path}...")
-    meditations = []
-    
-    for filepath in sorted(meditations_path.glob('*.html')):
-        med = parse_meditation_html(filepath)
-        if med:
-            meditations.append(med)
+    meditations = list(Corpus.load(meditations_path))
     
     print(f"Found {len(meditations)} meditations")
     
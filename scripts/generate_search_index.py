@@ -5,19 +5,52 @@ Generate search index for Threads of Grace website.
 This script uses the existing meditations-data.json as a base and enriches it
 with excerpts, keywords, and referenced spiritual teachers from the HTML files.
 
+Ranking uses BM25F, computed here rather than in the browser: per-field IDF,
+average field lengths and per-meditation length norms are folded into a
+precomputed weight for every (term, meditation) pair, so search.html only
+sums postings (search-bm25.json).
+
+It also builds a small latent-semantic (LSA) model - TF-IDF reduced with a
+truncated SVD - so search.html can rank meditations by meaning as well as by
+literal matches ("waiting on God" finds meditations about patience). The
+model is shipped as int8-quantized vectors in search-lsa.json.
+
+Positional postings (search-positions.json) answer quoted phrase and
+NEAR/n proximity queries.
+
+Every sentence of every meditation with its terms, sharded by year
+(search-snippets/YYYY.json), lets result cards show the sentence that best
+matches a query instead of the fixed excerpt.
+
+A typeahead table (search-suggest.json) of titles, teachers, books and
+occasions backs the search box's completions.
+
+A symmetric-delete spelling dictionary (search-spell.json) lets the page
+correct misspelled queries ("Merten", "lectio devina") within two edits.
+
 Usage:
     python generate_search_index.py
 
-The script will create search-index.json in the website root.
+The script will create search-index.json, search-bm25.json,
+search-positions.json, search-lsa.json, search-suggest.json,
+search-spell.json and search-snippets/ in the website root.
 """
 
 import os
 import re
 import json
+import math
+import base64
 from html.parser import HTMLParser
-from collections import Counter
+from collections import Counter, defaultdict
 from datetime import datetime
 
+import numpy as np
+
+from build_related import build_tfidf
+from meditation_corpus import parse_books
+from search_tokenizer import STOP_WORDS, fold, words, index_terms, positional_terms, stem_table
+
 # Get the project root (parent of scripts directory)
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
@@ -35,7 +68,6 @@ KNOWN_TEACHERS = [
     "Henri Nouwen",
     "Brother Lawrence",
     "Thérèse of Lisieux",
-    "Therese of Lisieux",
     "Ignatius of Loyola",
     "Francis de Sales",
     "Evelyn Underhill",
@@ -70,51 +102,114 @@ KNOWN_TEACHERS = [
     "Joyce Rupp",
 ]
 
-# Key contemplative themes/keywords to look for
+# LSA model: latent dimensions, and the minimum number of meditations a term
+# must appear in to be kept in the shipped query vocabulary
+LSA_DIMENSIONS = 48
+LSA_MIN_DF = 3
+
+# Spelling dictionary (symmetric delete): maximum edit distance, length of the
+# word prefix deletes are generated from, hash buckets (a power of two), and
+# how many meditations a corpus word must appear in to be suggested
+SPELL_MAX_DISTANCE = 2
+SPELL_PREFIX_LENGTH = 5
+SPELL_BUCKETS = 1 << 14
+SPELL_MIN_COUNT = 2
+
+# BM25F: searchable fields and their boosts, term-frequency saturation (k1)
+# and per-field length normalization (b)
+BM25_FIELDS = {
+    'title': 10.0,
+    'occasion': 5.0,
+    'scripture': 5.0,
+    'excerpt': 3.0,
+    'keywords': 8.0,
+    'teachers': 7.0,
+}
+BM25_K1 = 1.2
+BM25_B = {
+    'title': 0.5,
+    'occasion': 0.3,
+    'scripture': 0.3,
+    'excerpt': 0.75,
+    'keywords': 0.0,
+    'teachers': 0.0,
+}
+
+# Posting weights are shipped as integers in hundredths
+BM25_WEIGHT_SCALE = 100
+
+# Positional postings: gap left between fields and between list items, so
+# phrases and NEAR/n queries never match across them
+POSITION_GAP = 100
+
+# Snippets: sentence boundaries (after . ! ? and any closing quotes/brackets)
+SENTENCE_END_PATTERN = re.compile(r'(?<=[.!?])[\'"’”)\]]*\s+')
+
+# Snippets: passage length in characters - shorter sentences are joined to
+# the next, longer ones split at word boundaries
+SNIPPET_MIN_LENGTH = 80
+SNIPPET_MAX_LENGTH = 200
+
+# Typeahead: completion kinds, in the order they are listed for equal weight
+SUGGEST_KINDS = ('title', 'teacher', 'book', 'occasion')
+
+# Titles that are really scripture references ("Isaiah 40:1-11, ...") or
+# occasions ("The Day of Pentecost, Year A")
+NON_TITLE_PATTERN = re.compile(r'\d+\s*:\s*\d+|,\s*Year\s+[ABC]\b')
+
+# Key contemplative themes/keywords to look for. Patterns are matched on
+# stemmed words, so one form covers its inflections ("transform" also
+# matches "transformed", "transformation")
 THEME_KEYWORDS = {
     "Centering Prayer": ["centering prayer"],
-    "lectio divina": ["lectio divina", "lectio"],
-    "transformation": ["transformation", "transform", "transformed"],
-    "surrender": ["surrender", "surrendering"],
-    "letting go": ["let go", "letting go"],
+    "lectio divina": ["lectio"],
+    "transformation": ["transform"],
+    "surrender": ["surrender"],
+    "letting go": ["let go"],
     "presence": ["presence", "present moment"],
     "silence": ["silence", "silent"],
-    "stillness": ["stillness", "still point"],
-    "contemplative": ["contemplative", "contemplation"],
-    "healing": ["healing", "heal", "healed"],
-    "grace": ["grace", "graced"],
-    "faith": ["faith", "faithful"],
-    "hope": ["hope", "hoping"],
-    "trust": ["trust", "trusting"],
+    "stillness": ["still point", "be still", "inner stillness", "in stillness"],
+    "contemplative": ["contemplation"],
+    "healing": ["heal", "healer"],
+    "grace": ["grace"],
+    "faith": ["faith", "faithfully"],
+    "hope": ["hope"],
+    "trust": ["trust", "trustworthy"],
     "dark night": ["dark night", "darkness"],
     "light": ["light of Christ", "illumination"],
     "journey": ["spiritual journey", "pilgrimage"],
-    "calling": ["call", "calling", "vocation"],
-    "discernment": ["discern", "discernment"],
+    "calling": ["call", "vocation"],
+    "discernment": ["discern"],
     "examen": ["examen", "examination of conscience"],
-    "forgiveness": ["forgive", "forgiveness", "forgiving"],
+    "forgiveness": ["forgive", "unforgiveness"],
     "compassion": ["compassion", "compassionate"],
     "mercy": ["mercy", "merciful"],
-    "peace": ["peace", "peaceful"],
-    "joy": ["joy", "joyful"],
+    "peace": ["peace", "peaceable", "peacefully"],
+    "joy": ["joy", "joyous", "joyfully"],
     "gratitude": ["gratitude", "grateful", "thanksgiving"],
     "humility": ["humility", "humble"],
-    "obedience": ["obedience", "obedient"],
+    "obedience": ["obedience"],
     "patience": ["patience", "patient"],
     "simplicity": ["simplicity", "simple living"],
     "solitude": ["solitude"],
     "community": ["community", "communion"],
     "Eucharist": ["eucharist", "communion", "lord's supper"],
-    "baptism": ["baptism", "baptized"],
-    "repentance": ["repentance", "repent"],
-    "conversion": ["conversion", "converted"],
+    "baptism": ["baptism", "baptize"],
+    "repentance": ["repent"],
+    "conversion": ["conversion", "convert"],
     "resurrection": ["resurrection", "risen"],
-    "incarnation": ["incarnation", "incarnate"],
+    "incarnation": ["incarnation"],
     "Trinity": ["trinity", "triune"],
     "Holy Spirit": ["holy spirit", "spirit of god"],
     "kingdom of God": ["kingdom of god", "reign of god"],
 }
 
+# Theme patterns as stem sequences (stop words kept, so "let go" stays a phrase)
+THEME_STEMS = {
+    theme: [tuple(index_terms(p, keep_stop_words=True)) for p in patterns]
+    for theme, patterns in THEME_KEYWORDS.items()
+}
+
 
 class MeditationHTMLParser(HTMLParser):
     """Parse meditation HTML to extract content."""
@@ -170,25 +265,35 @@ def extract_meditation_content(html_path):
 
 
 def find_teachers(text):
-    """Find referenced spiritual teachers in the text."""
+    """Find referenced spiritual teachers in the text (accent-insensitive)."""
     found = []
-    text_lower = text.lower()
+    text_folded = fold(text)
 
     for teacher in KNOWN_TEACHERS:
-        if teacher.lower() in text_lower:
+        if fold(teacher) in text_folded:
             found.append(teacher)
 
     return found
 
 
+def contains_phrase(terms, phrase):
+    """True if the stem sequence phrase occurs contiguously in terms."""
+    n = len(phrase)
+    return any(terms[i:i + n] == list(phrase) for i in range(len(terms) - n + 1) if terms[i] == phrase[0])
+
+
 def find_keywords(text):
     """Find contemplative theme keywords in the text."""
     found = []
-    text_lower = text.lower()
+    terms = index_terms(text, keep_stop_words=True)
+    present = set(terms)
 
-    for theme, patterns in THEME_KEYWORDS.items():
-        for pattern in patterns:
-            if pattern in text_lower:
+    for theme, patterns in THEME_STEMS.items():
+        for phrase in patterns:
+            if len(phrase) == 1 and phrase[0] in present:
+                found.append(theme)
+                break
+            if len(phrase) > 1 and set(phrase) <= present and contains_phrase(terms, phrase):
                 found.append(theme)
                 break
 
@@ -223,14 +328,409 @@ def format_display_date(date_str):
         return date_str
 
 
+def field_text(entry, field):
+    value = entry.get(field) or ''
+    return ' '.join(value) if isinstance(value, list) else value
+
+
+def build_bm25_model(index, documents):
+    """
+    Precompute BM25F postings for the search page.
+
+    Terms are stemmed with search_tokenizer; the model carries a stem table
+    covering every word of the corpus so the browser can stem queries to
+    the same terms.
+
+    For each field f: idf_f(t) = ln(1 + (N - df + 0.5) / (df + 0.5)) and
+    norm_f(d) = 1 - b_f + b_f * len_f(d) / avglen_f. A term's weight in a
+    meditation is the boosted sum over fields of
+        idf_f(t) * tf * (k1 + 1) / (tf + k1 * norm_f(d))
+    so a query is scored by adding up the postings of its terms. The
+    per-field IDF and norms are folded into those weights and not shipped.
+    """
+    fields = list(BM25_FIELDS)
+    n_docs = len(index)
+
+    field_counts = [[Counter(index_terms(field_text(entry, f))) for f in fields] for entry in index]
+    lengths = np.array([[sum(c.values()) for c in row] for row in field_counts], dtype=float)
+    avg_lengths = lengths.mean(axis=0) if n_docs else np.zeros(len(fields))
+    avg_lengths[avg_lengths == 0] = 1.0
+
+    b = np.array([BM25_B[f] for f in fields])
+    norms = 1 - b + b * lengths / avg_lengths
+
+    field_df = [Counter() for _ in fields]
+    for row in field_counts:
+        for f, counts in enumerate(row):
+            field_df[f].update(counts.keys())
+
+    terms = sorted(set().union(*field_df))
+    field_idf = [
+        {t: math.log(1 + (n_docs - df + 0.5) / (df + 0.5)) for t, df in field_df[f].items()}
+        for f in range(len(fields))
+    ]
+    boosts = [BM25_FIELDS[f] for f in fields]
+
+    vocabulary = set()
+    for entry in index:
+        vocabulary.update(words(documents.get(entry['date'], '')))
+        for f in fields:
+            vocabulary.update(words(field_text(entry, f)))
+    stems = stem_table(vocabulary)
+
+    weights = defaultdict(dict)
+    for d, row in enumerate(field_counts):
+        for f, counts in enumerate(row):
+            for term, tf in counts.items():
+                score = boosts[f] * field_idf[f][term] * tf * (BM25_K1 + 1) / (tf + BM25_K1 * norms[d, f])
+                weights[term][d] = weights[term].get(d, 0.0) + score
+
+    # Postings: [row, weight, row, weight, ...] with rows delta-encoded
+    postings = []
+    for term in terms:
+        flat = []
+        previous = 0
+        for d in sorted(weights[term]):
+            flat.extend((d - previous, max(1, round(weights[term][d] * BM25_WEIGHT_SCALE))))
+            previous = d
+        postings.append(flat)
+
+    return {
+        'fields': fields,
+        'boosts': boosts,
+        'k1': BM25_K1,
+        'b': b.tolist(),
+        'avgLengths': [round(x, 3) for x in avg_lengths.tolist()],
+        'weightScale': BM25_WEIGHT_SCALE,
+        'stopWords': sorted(STOP_WORDS),
+        'stems': stems,
+        'dates': [entry['date'] for entry in index],
+        'terms': terms,
+        'postings': postings,
+    }
+
+
+def field_positions(entry):
+    """(term, position) for every index term of a meditation's searchable fields."""
+    positions = []
+    offset = 0
+    for field in BM25_FIELDS:
+        value = entry.get(field) or ''
+        for part in (value if isinstance(value, list) else [value]):
+            terms = positional_terms(part)
+            positions.extend((term, offset + pos) for term, pos in terms)
+            offset += len(words(part)) + POSITION_GAP
+    return positions
+
+
+def build_position_model(index, terms):
+    """
+    Positional postings, aligned with the BM25F postings.
+
+    For each term (in the BM25F term order) and each meditation containing
+    it (in posting order), the number of occurrences followed by their
+    delta-encoded positions. Phrase and NEAR/n queries are answered in the
+    browser by intersecting these lists.
+    """
+    by_term = defaultdict(lambda: defaultdict(list))
+    for d, entry in enumerate(index):
+        for term, pos in field_positions(entry):
+            by_term[term][d].append(pos)
+
+    postings = []
+    for term in terms:
+        flat = []
+        for d in sorted(by_term[term]):
+            positions = sorted(by_term[term][d])
+            flat.append(len(positions))
+            previous = 0
+            for pos in positions:
+                flat.append(pos - previous)
+                previous = pos
+        postings.append(flat)
+
+    return {
+        'gap': POSITION_GAP,
+        'positions': postings,
+    }
+
+
+def quantize_rows(matrix):
+    """
+    Quantize each row to int8 with its own scale.
+
+    Returns (int8 array, float scales) so that row ~= int8_row * scale.
+    """
+    peaks = np.abs(matrix).max(axis=1)
+    scales = np.where(peaks > 0, peaks / 127.0, 1.0)
+    quantized = np.clip(np.rint(matrix / scales[:, None]), -127, 127).astype(np.int8)
+    return quantized, scales
+
+
+def encode_int8(array):
+    """Base64 of the raw bytes of an int8 array (decoded into an Int8Array in the browser)."""
+    return base64.b64encode(np.ascontiguousarray(array, dtype=np.int8).tobytes()).decode('ascii')
+
+
+def split_sentences(paragraphs):
+    """
+    Join paragraphs with newlines and find where each sentence starts.
+
+    Returns (text, starts); a sentence runs from its start to the next one.
+    """
+    text = '\n'.join(paragraphs)
+    starts = []
+    offset = 0
+    for para in paragraphs:
+        starts.append(offset)
+        for match in SENTENCE_END_PATTERN.finditer(para):
+            if match.end() < len(para):
+                starts.append(offset + match.end())
+        offset += len(para) + 1
+    return text, starts
+
+
+def split_long(passage):
+    """
+    A passage as pieces of about equal length, none over SNIPPET_MAX_LENGTH
+    characters, split between words and marked with '…'.
+    """
+    pieces = []
+    while len(passage) > SNIPPET_MAX_LENGTH:
+        target = -(-len(passage) // -(-len(passage) // SNIPPET_MAX_LENGTH))
+        cut = passage.rfind(' ', 0, target + 1)
+        if cut <= 0:
+            cut = target
+        pieces.append(passage[:cut].rstrip(',;:') + '…')
+        passage = '…' + passage[cut:].lstrip()
+    pieces.append(passage)
+    return pieces
+
+
+def snippet_passages(paragraphs):
+    """
+    The sentences of a meditation as snippet passages: a very short
+    sentence is joined to the one after it, and a long one is split at word
+    boundaries into pieces of at most SNIPPET_MAX_LENGTH characters, so
+    every word of the meditation is in some passage.
+    """
+    text, starts = split_sentences(paragraphs)
+    ends = starts[1:] + [len(text)]
+    passages = []
+    i = 0
+    while i < len(starts):
+        start = starts[i]
+        if ends[i] - start < SNIPPET_MIN_LENGTH and i + 1 < len(starts):
+            i += 1
+        passage = ' '.join(text[start:ends[i]].split())
+        if passage:
+            passages.extend(split_long(passage))
+        i += 1
+    return passages
+
+
+def build_snippet_shards(index, bodies):
+    """
+    Passages for query-dependent snippets, one shard per year.
+
+    For each meditation the shard holds every passage in reading order and
+    each one's index terms (space-separated stems), so search.html can show
+    the passage sharing the most query terms wherever in the meditation it
+    is, and keep the fixed excerpt if none does. Shards are fetched only for
+    the results in view.
+    """
+    shards = defaultdict(dict)
+    for entry in index:
+        date = entry['date']
+        # Passages without index terms ('Amen.', stray '. .') can never match
+        passages = [(passage, sorted(set(index_terms(passage))))
+                    for passage in snippet_passages(bodies.get(date, []))]
+        passages = [(passage, terms) for passage, terms in passages if terms]
+        shards[date[:4]][date] = {
+            'sentences': [passage for passage, _ in passages],
+            'terms': [' '.join(terms) for _, terms in passages],
+        }
+    return shards
+
+
+def build_suggest_model(index):
+    """
+    Build the typeahead table: completions plus a sorted array of keys.
+
+    Completions are meditation titles, teachers, scripture books and
+    occasions, each weighted by how many meditations it covers. Every
+    completion is keyed by its folded label and by the folded text from each
+    later word on ("norwich" finds "Julian of Norwich"), so the browser
+    finds all completions for a prefix with one binary search over keys.
+    """
+    weights = {kind: Counter() for kind in SUGGEST_KINDS}
+    title_dates = defaultdict(list)
+
+    for entry in index:
+        title = (entry.get('title') or '').strip()
+        if title and not NON_TITLE_PATTERN.search(title) and title != entry.get('occasion'):
+            weights['title'][title] += 1
+            title_dates[title].append(entry['date'])
+        for teacher in entry.get('teachers', []):
+            weights['teacher'][teacher] += 1
+        for book in parse_books(entry.get('scripture', '')):
+            weights['book'][book] += 1
+        if entry.get('occasion'):
+            weights['occasion'][entry['occasion']] += 1
+
+    completions = []
+    for kind_id, kind in enumerate(SUGGEST_KINDS):
+        for label, weight in sorted(weights[kind].items(), key=lambda kv: (-kv[1], kv[0])):
+            completion = {'label': label, 'kind': kind_id, 'weight': weight}
+            # A title unique to one meditation opens it directly
+            if kind == 'title' and len(title_dates[label]) == 1:
+                completion['date'] = title_dates[label][0]
+            completions.append(completion)
+
+    keys = []
+    for i, completion in enumerate(completions):
+        label_words = words(completion['label'])
+        for start in range(len(label_words)):
+            if start and (label_words[start] in STOP_WORDS or len(label_words[start]) < 3):
+                continue
+            # Key 0 is the whole label; later keys are inner-word matches
+            keys.append((' '.join(label_words[start:]), i, 0 if start == 0 else 1))
+
+    keys = sorted(set(keys))
+    return {
+        'kinds': list(SUGGEST_KINDS),
+        'completions': completions,
+        'keys': [k for k, _, _ in keys],
+        'targets': [i if inner == 0 else -1 - i for _, i, inner in keys],
+    }
+
+
+def spelling_deletes(word, max_distance=SPELL_MAX_DISTANCE, prefix_length=SPELL_PREFIX_LENGTH):
+    """The word's prefix and every string reachable from it by up to max_distance deletions."""
+    word = word[:prefix_length]
+    found = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        found |= frontier
+    return found
+
+
+def spelling_bucket(text):
+    """FNV-1a hash of a delete string, reduced to a bucket (mirrored in search.html)."""
+    h = 0x811c9dc5
+    for ch in text:
+        h = ((h ^ ord(ch)) * 0x01000193) & 0xffffffff
+    return h & (SPELL_BUCKETS - 1)
+
+
+def build_spelling_model(index, documents):
+    """
+    Build a SymSpell-style symmetric-delete dictionary for typo correction.
+
+    The dictionary is every corpus word used in at least SPELL_MIN_COUNT
+    meditations, plus the words of teacher names and book names. For each
+    word, every deletion of up to SPELL_MAX_DISTANCE letters from its prefix
+    is hashed to a bucket holding the word's id. In the browser, a misspelled
+    word's own deletes are hashed the same way; the words in those buckets
+    are the only candidates it has to check, whatever the dictionary size.
+
+    Buckets are shipped as a count per bucket (uint8) and the concatenated
+    word ids (uint16, little-endian).
+    """
+    counts = Counter()
+    for entry in index:
+        counts.update(set(words(documents.get(entry['date'], ''))))
+
+    pinned = set()
+    for teacher in KNOWN_TEACHERS:
+        pinned.update(words(teacher))
+    for entry in index:
+        for book in parse_books(entry.get('scripture', '')):
+            pinned.update(words(book))
+
+    vocabulary = sorted(
+        w for w in set(counts) | pinned
+        if len(w) >= 3 and not w.isdigit() and w not in STOP_WORDS
+        and (counts[w] >= SPELL_MIN_COUNT or w in pinned)
+    )
+    # Names and books outrank ordinary words of the same distance
+    frequencies = [counts[w] + (len(index) if w in pinned else 0) for w in vocabulary]
+
+    # Word ids are packed as 16-bit and bucket sizes as 8-bit; check before
+    # packing, since numpy refuses out-of-range values outright
+    if len(vocabulary) > 0xFFFF:
+        raise ValueError(f"Spelling vocabulary too large for 16-bit word ids: {len(vocabulary)} words "
+                         "- raise SPELL_MIN_COUNT")
+
+    buckets = [set() for _ in range(SPELL_BUCKETS)]
+    for word_id, word in enumerate(vocabulary):
+        for delete in spelling_deletes(word):
+            buckets[spelling_bucket(delete)].add(word_id)
+
+    if max(len(b) for b in buckets) > 0xFF:
+        raise ValueError("Spelling bucket overflow - raise SPELL_BUCKETS")
+    bucket_counts = np.array([len(b) for b in buckets], dtype=np.uint8)
+    word_ids = np.array([i for b in buckets for i in sorted(b)], dtype='<u2')
+
+    return {
+        'maxDistance': SPELL_MAX_DISTANCE,
+        'prefixLength': SPELL_PREFIX_LENGTH,
+        'bucketCount': SPELL_BUCKETS,
+        'words': vocabulary,
+        'frequencies': frequencies,
+        'bucketSizes': base64.b64encode(bucket_counts.tobytes()).decode('ascii'),
+        'bucketWords': base64.b64encode(word_ids.tobytes()).decode('ascii'),
+    }
+
+
+def build_lsa_model(index, documents, dimensions=LSA_DIMENSIONS):
+    """
+    Build the latent-semantic model for the search page.
+
+    With the TF-IDF matrix X = U S Vt, a meditation's latent vector is its
+    row of U S and a query's is q V - the sum of the V rows of its terms,
+    weighted by IDF. Both are compared by cosine in the browser.
+    """
+    tokens = [index_terms(documents[entry['date']]) for entry in index]
+    matrix, vocab, idf = build_tfidf(tokens, min_df=LSA_MIN_DF)
+
+    dense = matrix.toarray()
+    u, s, vt = np.linalg.svd(dense, full_matrices=False)
+    k = min(dimensions, len(s))
+
+    doc_vectors = u[:, :k] * s[:k]
+    norms = np.linalg.norm(doc_vectors, axis=1)
+    norms[norms == 0] = 1.0
+    doc_vectors /= norms[:, None]
+
+    term_vectors = vt[:k].T
+    doc_quantized, doc_scales = quantize_rows(doc_vectors)
+    term_quantized, term_scales = quantize_rows(term_vectors)
+
+    terms = sorted(vocab, key=vocab.get)
+    # Fold each term's IDF into its dequantization scale: one multiply per term in the browser
+    term_weights = idf * term_scales
+
+    return {
+        'dimensions': k,
+        'dates': [entry['date'] for entry in index],
+        'docScales': [float(f'{x:.5g}') for x in doc_scales],
+        'docVectors': encode_int8(doc_quantized),
+        'terms': terms,
+        'termWeights': [float(f'{x:.5g}') for x in term_weights],
+        'termVectors': encode_int8(term_quantized),
+    }
+
+
 def generate_search_index():
-    """Generate the complete search index."""
+    """Generate the search index, plus each meditation's full text and paragraphs."""
     # Load existing meditations data
     data_path = os.path.join(PROJECT_ROOT, 'meditations-data.json')
 
     if not os.path.exists(data_path):
         print(f"Meditations data not found: {data_path}")
-        return []
+        return [], {}, {}
 
     with open(data_path, 'r', encoding='utf-8') as f:
         meditations_data = json.load(f)
@@ -239,11 +739,13 @@ def generate_search_index():
 
     if not os.path.exists(meditations_dir):
         print(f"Meditations directory not found: {meditations_dir}")
-        return []
+        return [], {}, {}
 
     print(f"Processing {len(meditations_data)} meditations...")
 
     index = []
+    documents = {}
+    bodies = {}
 
     for i, med in enumerate(meditations_data):
         html_path = os.path.join(meditations_dir, med['filename'])
@@ -262,6 +764,9 @@ def generate_search_index():
         teachers = find_teachers(full_text)
         keywords = find_keywords(full_text)
 
+        documents[med['date']] = full_text
+        bodies[med['date']] = paragraphs
+
         # Create excerpt
         excerpt = create_excerpt(paragraphs)
 
@@ -289,14 +794,14 @@ def generate_search_index():
     # Sort by date descending (newest first)
     index.sort(key=lambda x: x['date'], reverse=True)
 
-    return index
+    return index, documents, bodies
 
 
 def main():
     print("Generating search index for Threads of Grace...")
     print(f"Project root: {PROJECT_ROOT}")
 
-    index = generate_search_index()
+    index, documents, bodies = generate_search_index()
 
     if index:
         output_path = os.path.join(PROJECT_ROOT, 'search-index.json')
@@ -306,6 +811,64 @@ def main():
         print(f"\nCreated search index with {len(index)} meditations")
         print(f"Output: {output_path}")
 
+        bm25 = build_bm25_model(index, documents)
+        bm25_path = os.path.join(PROJECT_ROOT, 'search-bm25.json')
+        with open(bm25_path, 'w', encoding='utf-8') as f:
+            json.dump(bm25, f, ensure_ascii=False, separators=(',', ':'))
+
+        postings = sum(len(p) // 2 for p in bm25['postings'])
+        print(f"\nCreated BM25F model: {len(bm25['terms'])} terms, {postings} postings "
+              f"({os.path.getsize(bm25_path) / 1024:.0f} KB)")
+        print(f"Output: {bm25_path}")
+
+        positions = build_position_model(index, bm25['terms'])
+        positions_path = os.path.join(PROJECT_ROOT, 'search-positions.json')
+        with open(positions_path, 'w', encoding='utf-8') as f:
+            json.dump(positions, f, ensure_ascii=False, separators=(',', ':'))
+
+        print(f"\nCreated positional postings ({os.path.getsize(positions_path) / 1024:.0f} KB)")
+        print(f"Output: {positions_path}")
+
+        model = build_lsa_model(index, documents)
+        lsa_path = os.path.join(PROJECT_ROOT, 'search-lsa.json')
+        with open(lsa_path, 'w', encoding='utf-8') as f:
+            json.dump(model, f, ensure_ascii=False, separators=(',', ':'))
+
+        print(f"\nCreated LSA model: {model['dimensions']} dimensions, "
+              f"{len(model['terms'])} terms ({os.path.getsize(lsa_path) / 1024:.0f} KB)")
+        print(f"Output: {lsa_path}")
+
+        shards = build_snippet_shards(index, bodies)
+        snippets_dir = os.path.join(PROJECT_ROOT, 'search-snippets')
+        os.makedirs(snippets_dir, exist_ok=True)
+        snippet_bytes = 0
+        for year, shard in sorted(shards.items()):
+            shard_path = os.path.join(snippets_dir, f'{year}.json')
+            with open(shard_path, 'w', encoding='utf-8') as f:
+                json.dump(shard, f, ensure_ascii=False, separators=(',', ':'))
+            snippet_bytes += os.path.getsize(shard_path)
+
+        print(f"\nCreated snippet shards: {len(shards)} years ({snippet_bytes / 1024:.0f} KB)")
+        print(f"Output: {snippets_dir}")
+
+        suggest = build_suggest_model(index)
+        suggest_path = os.path.join(PROJECT_ROOT, 'search-suggest.json')
+        with open(suggest_path, 'w', encoding='utf-8') as f:
+            json.dump(suggest, f, ensure_ascii=False, separators=(',', ':'))
+
+        print(f"\nCreated typeahead table: {len(suggest['completions'])} completions, "
+              f"{len(suggest['keys'])} keys ({os.path.getsize(suggest_path) / 1024:.0f} KB)")
+        print(f"Output: {suggest_path}")
+
+        spelling = build_spelling_model(index, documents)
+        spell_path = os.path.join(PROJECT_ROOT, 'search-spell.json')
+        with open(spell_path, 'w', encoding='utf-8') as f:
+            json.dump(spelling, f, ensure_ascii=False, separators=(',', ':'))
+
+        print(f"\nCreated spelling dictionary: {len(spelling['words'])} words "
+              f"({os.path.getsize(spell_path) / 1024:.0f} KB)")
+        print(f"Output: {spell_path}")
+
         # Print some stats
         all_teachers = []
         all_keywords = []
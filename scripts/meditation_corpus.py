@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Shared meditation record and corpus for the Threads of Grace scripts.
+
+Every generator used to re-parse the meditation pages into its own ad-hoc
+dict and re-derive season, lectionary year and readings. This module does
+that once:
+
+- Meditation: a slotted record. Header metadata (title, occasion, season,
+  lectionary year, readings, books) is read eagerly from the top of the page;
+  paragraph text is read lazily the first time it is asked for.
+- Corpus: every meditation, sorted by date, with precomputed indexes by
+  date, calendar year, season, lectionary year, occasion and scripture book.
+
+Meditation also supports dict-style access (entry['title'],
+entry.get('season', '')) so existing generators that expect the old dicts
+work unchanged.
+
+Usage:
+    from meditation_corpus import Corpus
+
+    corpus = Corpus.load(website_dir / 'meditations')
+    for med in corpus.season('Advent'):
+        print(med.date, med.title, med.lect_year)
+
+Run directly to print a summary of the corpus:
+    python meditation_corpus.py [/path/to/meditations]
+"""
+
+import re
+import sys
+import html
+import hashlib
+from pathlib import Path
+from collections import defaultdict
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+# Everything before this marker is header metadata
+CONTENT_MARKER = 'class="meditation-content"'
+
+HEADER_FIELDS = {
+    'meditation-date-display': 'date_display',
+    'meditation-title-display': 'title',
+    'meditation-occasion': 'occasion_full',
+    'meditation-readings': 'readings',
+}
+HEADER_PATTERN = re.compile(
+    r'<(?:div|h1)\s+class="(' + '|'.join(HEADER_FIELDS) + r')"\s*>(.*?)</(?:div|h1)>',
+    re.DOTALL,
+)
+PARAGRAPH_PATTERN = re.compile(r'<p\b[^>]*>(.*?)</p>', re.DOTALL)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+FILENAME_PATTERN = re.compile(r'(\d{4}-\d{2}-\d{2})\.html$')
+LECT_YEAR_PATTERN = re.compile(r'Year\s+([ABC])')
+
+# Labels in the readings line that are not books of the Bible
+NON_BOOK_LABELS = {'liturgy of the', 'proper', 'year', 'col', 'lk', 'ps'}
+
+
+def _text(fragment):
+    """Plain text of an HTML fragment."""
+    return html.unescape(TAG_PATTERN.sub('', fragment)).strip()
+
+
+def normalize_book(book):
+    """Canonical book name: '1 Samuel' for 'I Samuel' / '1Samuel', 'Psalm' for 'Psalms'."""
+    book = re.sub(r'\s+', ' ', book.strip())
+    book = re.sub(r'^III\s+', '3 ', book)
+    book = re.sub(r'^II\s+', '2 ', book)
+    book = re.sub(r'^I\s+', '1 ', book)
+    book = re.sub(r'^(\d)\s*([A-Za-z])', r'\1 \2', book)
+    if book == 'Psalms':
+        book = 'Psalm'
+    return book
+
+
+def parse_books(readings):
+    """Books of the Bible cited in a readings line, in order, without repeats."""
+    books = []
+    for ref in re.split(r',\s*(?=[A-Z1-3I])', readings or ''):
+        match = re.match(r'^([1-3I]*\s*[A-Za-z]+(?:\s+of\s+[A-Za-z]+)?)', ref.strip())
+        if not match:
+            continue
+        book = match.group(1).strip()
+        if book.lower() in NON_BOOK_LABELS or re.match(r'^\d+[a-z]?$', book):
+            continue
+        book = normalize_book(book)
+        if book not in books:
+            books.append(book)
+    return tuple(books)
+
+
+def split_occasion(occasion_full):
+    """'Fourth Sunday in Lent, Year B • Lent' -> ('Fourth Sunday in Lent', 'Lent', 'B')."""
+    occasion = occasion_full
+    season = ''
+    if '•' in occasion_full:
+        parts = occasion_full.split('•')
+        occasion = parts[0].strip()
+        season = parts[1].strip() if len(parts) > 1 else ''
+        occasion = re.sub(r',\s*Year\s+[ABC]$', '', occasion).strip()
+    match = LECT_YEAR_PATTERN.search(occasion_full)
+    return occasion, season, match.group(1) if match else ''
+
+
+class Meditation:
+    """One meditation page. Paragraphs are loaded on first access."""
+
+    __slots__ = (
+        'date', 'filename', 'path', 'title', 'date_display',
+        'occasion', 'occasion_full', 'season', 'lect_year',
+        'readings', 'books', '_paragraphs', '_content_hash',
+    )
+
+    def __init__(self, path, date, title='', date_display='', occasion_full='', readings=''):
+        self.path = path
+        self.filename = path.name
+        self.date = date
+        self.title = title
+        self.date_display = date_display
+        self.occasion_full = occasion_full
+        self.occasion, self.season, self.lect_year = split_occasion(occasion_full)
+        self.readings = readings
+        self.books = parse_books(readings)
+        self._paragraphs = None
+        self._content_hash = None
+
+    @classmethod
+    def from_file(cls, path):
+        """Read header metadata only - the body is left on disk until needed."""
+        path = Path(path)
+        match = FILENAME_PATTERN.search(path.name)
+        date = match.group(1) if match else None
+
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        end = content.find(CONTENT_MARKER)
+        header = content if end == -1 else content[:end]
+
+        fields = {}
+        for css_class, fragment in HEADER_PATTERN.findall(header):
+            fields.setdefault(HEADER_FIELDS[css_class], _text(fragment))
+
+        return cls(path, date, **fields)
+
+    @property
+    def year(self):
+        """Calendar year as a string, e.g. '2024'."""
+        return self.date[:4] if self.date else ''
+
+    @property
+    def paragraphs(self):
+        """Meditation paragraphs as plain text (read from disk on first access)."""
+        if self._paragraphs is None:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            start = content.find(CONTENT_MARKER)
+            body = content[start:] if start != -1 else ''
+            end = body.find('<nav')
+            if end != -1:
+                body = body[:end]
+            self._paragraphs = tuple(
+                text for text in (_text(p) for p in PARAGRAPH_PATTERN.findall(body)) if text
+            )
+        return self._paragraphs
+
+    @property
+    def content_hash(self):
+        """MD5 of the paragraph text, for duplicate detection."""
+        if self._content_hash is None:
+            self._content_hash = hashlib.md5('\n'.join(self.paragraphs).encode()).hexdigest()
+        return self._content_hash
+
+    def unload(self):
+        """Drop cached paragraph text to free memory."""
+        self._paragraphs = None
+
+    # Dict-style access, so generators written against the old dicts keep working
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def __contains__(self, key):
+        return hasattr(self, key)
+
+    def __repr__(self):
+        return f"Meditation({self.date!r}, {self.title!r})"
+
+
+class Corpus:
+    """All meditations, sorted by date, with lookup indexes."""
+
+    def __init__(self, meditations):
+        self.meditations = sorted(meditations, key=lambda m: m.date or '')
+
+        self.by_date = {}
+        # Position of each date in self.meditations, for neighbors()
+        self._positions = {}
+        self.by_year = defaultdict(list)
+        self.by_season = defaultdict(list)
+        self.by_lect_year = defaultdict(list)
+        self.by_occasion = defaultdict(list)
+        self.by_book = defaultdict(list)
+
+        for i, med in enumerate(self.meditations):
+            self.by_date[med.date] = med
+            self._positions[med.date] = i
+            self.by_year[med.year].append(med)
+            self.by_season[med.season.lower()].append(med)
+            if med.lect_year:
+                self.by_lect_year[med.lect_year].append(med)
+            self.by_occasion[med.occasion].append(med)
+            for book in med.books:
+                self.by_book[book].append(med)
+
+        # Freeze the indexes so callers cannot mutate them by accident
+        for name in ('by_year', 'by_season', 'by_lect_year', 'by_occasion', 'by_book'):
+            index = getattr(self, name)
+            setattr(self, name, {key: tuple(value) for key, value in index.items()})
+
+    @classmethod
+    def load(cls, meditations_dir, on_error=None):
+        """Load every YYYY-MM-DD.html in a directory."""
+        meditations = []
+        for path in sorted(Path(meditations_dir).glob('*.html')):
+            if not FILENAME_PATTERN.search(path.name):
+                continue
+            try:
+                meditations.append(Meditation.from_file(path))
+            except (OSError, UnicodeDecodeError) as e:
+                if on_error:
+                    on_error(path, e)
+                else:
+                    print(f"Error reading {path.name}: {e}")
+        return cls(meditations)
+
+    def __iter__(self):
+        return iter(self.meditations)
+
+    def __len__(self):
+        return len(self.meditations)
+
+    def __getitem__(self, date):
+        return self.by_date[date]
+
+    def __contains__(self, date):
+        return date in self.by_date
+
+    def get(self, date, default=None):
+        return self.by_date.get(date, default)
+
+    def season(self, name):
+        """Meditations in a season (case-insensitive), oldest first."""
+        return self.by_season.get(name.lower(), ())
+
+    def year(self, year):
+        """Meditations in a calendar year, oldest first."""
+        return self.by_year.get(str(year), ())
+
+    def lect_year(self, letter):
+        """Meditations in lectionary year A, B or C, oldest first."""
+        return self.by_lect_year.get(letter.upper(), ())
+
+    def occasion(self, name):
+        """Meditations for an occasion (without the ', Year X' suffix)."""
+        return self.by_occasion.get(name, ())
+
+    def book(self, name):
+        """Meditations whose readings cite a book of the Bible."""
+        return self.by_book.get(normalize_book(name), ())
+
+    def neighbors(self, date):
+        """(previous, next) meditation by date, either of which may be None."""
+        i = self._positions.get(date)
+        if i is None:
+            return None, None
+        prev_med = self.meditations[i - 1] if i > 0 else None
+        next_med = self.meditations[i + 1] if i + 1 < len(self.meditations) else None
+        return prev_med, next_med
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith('-')]
+    meditations_dir = Path(args[0]) if args else SCRIPT_DIR.parent / 'meditations'
+
+    if not meditations_dir.exists():
+        print(f"Error: meditations directory not found: {meditations_dir}")
+        sys.exit(1)
+
+    corpus = Corpus.load(meditations_dir)
+    print(f"Loaded {len(corpus)} meditations from {meditations_dir}")
+    if not len(corpus):
+        return
+
+    first, last = corpus.meditations[0], corpus.meditations[-1]
+    print(f"  {first.date} to {last.date}")
+
+    print("\nBy season:")
+    for season, meds in sorted(corpus.by_season.items(), key=lambda kv: -len(kv[1])):
+        print(f"  {season or '(none)':<16} {len(meds)}")
+
+    print("\nBy lectionary year:")
+    for letter in 'ABC':
+        print(f"  Year {letter}: {len(corpus.lect_year(letter))}")
+
+    print(f"\nOccasions: {len(corpus.by_occasion)}")
+    print(f"Books cited: {len(corpus.by_book)}")
+    for book, meds in sorted(corpus.by_book.items(), key=lambda kv: -len(kv[1]))[:5]:
+        print(f"  {book:<16} {len(meds)}")
+
+
+if __name__ == '__main__':
+    main()
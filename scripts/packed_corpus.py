@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Packed, memory-mapped meditation corpus.
+
+A single file holding the plain text of every meditation, plus fixed-width
+offset tables so any meditation - or any paragraph of one - can be sliced
+straight out of an mmap without parsing HTML or loading the whole corpus.
+
+File layout (all integers little-endian):
+
+    header      MAGIC, entry count, paragraph count
+    entries     one fixed-width record per meditation, sorted by date:
+                date (10 bytes ASCII), body offset, body length,
+                first paragraph index, paragraph count
+    paragraphs  one (offset, length) pair per paragraph, relative to
+                the start of its meditation's body
+    bodies      UTF-8 text of each meditation, in the same layout
+                export_meditations_text.py uses (date, occasion,
+                readings, title, then paragraphs separated by blank lines)
+
+Usage:
+    python packed_corpus.py                 # rebuild all_meditations.pack
+    python packed_corpus.py 2024-03-10      # print one meditation from the pack
+
+    from packed_corpus import PackedCorpus
+
+    with PackedCorpus.open(path) as pack:
+        text = pack.text('2024-03-10')
+        first = pack.paragraph('2024-03-10', 0)   # memoryview, no copy
+"""
+
+import sys
+import mmap
+import struct
+from bisect import bisect_left
+from pathlib import Path
+
+from meditation_corpus import Corpus
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+DEFAULT_PACK = PROJECT_ROOT / 'all_meditations.pack'
+
+MAGIC = b'TOGPACK1'
+HEADER = struct.Struct('<8sII')
+ENTRY = struct.Struct('<10s2xQIII')
+PARAGRAPH = struct.Struct('<II')
+
+
+def format_body(med):
+    """
+    Encode one meditation's text and record where each paragraph starts.
+
+    Laid out in the format export_meditations_text.py documents.
+    """
+    header = '\n'.join([med.date_display, med.occasion_full, med.readings, '', med.title, ''])
+    parts = [header.encode('utf-8')]
+    paragraphs = []
+    offset = len(parts[0])
+
+    for i, para in enumerate(med.paragraphs):
+        sep = b'\n' if i == 0 else b'\n\n'
+        encoded = para.encode('utf-8')
+        offset += len(sep)
+        paragraphs.append((offset, len(encoded)))
+        parts.append(sep)
+        parts.append(encoded)
+        offset += len(encoded)
+
+    return b''.join(parts), paragraphs
+
+
+def write_pack(corpus, path):
+    """Write a packed corpus file. Paragraph text is released after each entry."""
+    meditations = [m for m in corpus if m.date]
+
+    entries = []
+    paragraph_table = []
+    bodies = []
+    body_offset = 0
+
+    for med in meditations:
+        body, paragraphs = format_body(med)
+        med.unload()
+        entries.append((med.date.encode('ascii'), body_offset, len(body),
+                        len(paragraph_table), len(paragraphs)))
+        paragraph_table.extend(paragraphs)
+        bodies.append(body)
+        body_offset += len(body)
+
+    data_start = HEADER.size + ENTRY.size * len(entries) + PARAGRAPH.size * len(paragraph_table)
+
+    temp = Path(path).with_suffix('.pack.tmp')
+    with open(temp, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, len(entries), len(paragraph_table)))
+        for date, offset, length, first, count in entries:
+            f.write(ENTRY.pack(date, data_start + offset, length, first, count))
+        for offset, length in paragraph_table:
+            f.write(PARAGRAPH.pack(offset, length))
+        for body in bodies:
+            f.write(body)
+    temp.replace(path)
+
+    return len(entries), data_start + body_offset
+
+
+class PackedCorpus:
+    """Read-only view of a packed corpus file backed by mmap."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+
+        magic, self.count, self.paragraph_count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not a packed corpus file")
+
+        self._entries_at = HEADER.size
+        self._paragraphs_at = self._entries_at + ENTRY.size * self.count
+
+        # Only the 10-byte keys are read up front; everything else stays in the map
+        self.dates = [
+            bytes(self._view[self._entries_at + i * ENTRY.size:
+                             self._entries_at + i * ENTRY.size + 10]).decode('ascii')
+            for i in range(self.count)
+        ]
+
+    @classmethod
+    def open(cls, path=DEFAULT_PACK):
+        return cls(path)
+
+    def close(self):
+        if getattr(self, '_view', None) is not None:
+            self._view.release()
+            self._view = None
+        if getattr(self, '_map', None) is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                # Slices handed out by body()/paragraph() are still alive; the
+                # mapping is released when the last of them is garbage collected
+                pass
+            self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, date):
+        i = bisect_left(self.dates, date)
+        return i < self.count and self.dates[i] == date
+
+    def _entry(self, date):
+        i = bisect_left(self.dates, date)
+        if i == self.count or self.dates[i] != date:
+            raise KeyError(date)
+        return ENTRY.unpack_from(self._map, self._entries_at + i * ENTRY.size)
+
+    def body(self, date):
+        """Full formatted text of a meditation as a zero-copy memoryview of UTF-8 bytes."""
+        _, offset, length, _, _ = self._entry(date)
+        return self._view[offset:offset + length]
+
+    def text(self, date):
+        """Full formatted text of a meditation as a str."""
+        return str(self.body(date), 'utf-8')
+
+    def header(self, date):
+        """Header fields of a meditation: date_display, occasion, readings, title."""
+        _, offset, length, first, count = self._entry(date)
+        if count:
+            para_offset, _ = PARAGRAPH.unpack_from(self._map, self._paragraphs_at + first * PARAGRAPH.size)
+            length = para_offset
+        lines = str(self._view[offset:offset + length], 'utf-8').split('\n')
+        lines += [''] * (5 - len(lines))
+        return {
+            'date_display': lines[0],
+            'occasion': lines[1],
+            'readings': lines[2],
+            'title': lines[4],
+        }
+
+    def paragraph_count_for(self, date):
+        return self._entry(date)[4]
+
+    def paragraph(self, date, index):
+        """One paragraph as a zero-copy memoryview of UTF-8 bytes."""
+        _, offset, _, first, count = self._entry(date)
+        if not -count <= index < count:
+            raise IndexError(f"{date} has {count} paragraphs")
+        index %= count
+        para_offset, para_length = PARAGRAPH.unpack_from(
+            self._map, self._paragraphs_at + (first + index) * PARAGRAPH.size)
+        start = offset + para_offset
+        return self._view[start:start + para_length]
+
+    def paragraphs(self, date):
+        """Yield each paragraph of a meditation as a str."""
+        for i in range(self.paragraph_count_for(date)):
+            yield str(self.paragraph(date, i), 'utf-8')
+
+    def iter_bodies(self):
+        """Yield (date, memoryview) for every meditation, oldest first."""
+        for i, date in enumerate(self.dates):
+            _, offset, length, _, _ = ENTRY.unpack_from(self._map, self._entries_at + i * ENTRY.size)
+            yield date, self._view[offset:offset + length]
+
+
+def build_pack(website_dir, pack_path=DEFAULT_PACK):
+    """Load the meditations and (re)write the packed corpus file."""
+    corpus = Corpus.load(Path(website_dir) / 'meditations')
+    return write_pack(corpus, pack_path)
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith('-')]
+
+    if args:
+        if not DEFAULT_PACK.exists():
+            print(f"Error: {DEFAULT_PACK.name} not found - run without arguments to build it")
+            sys.exit(1)
+        with PackedCorpus.open() as pack:
+            for date in args:
+                if date not in pack:
+                    print(f"Not in pack: {date}")
+                    continue
+                print(pack.text(date))
+                print()
+        return
+
+    count, size = build_pack(PROJECT_ROOT)
+    print(f"Packed {count} meditations into {DEFAULT_PACK.name} ({size:,} bytes)")
+
+
+if __name__ == '__main__':
+    main()
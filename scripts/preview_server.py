@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Local preview server for the Threads of Grace website.
+
+Serves the site root the way the production host does, so page weight and
+caching behaviour can be checked locally before publishing:
+
+- Serves precompressed .br / .gz siblings when the browser accepts them
+- Sends ETag and Last-Modified headers and answers conditional requests
+  with 304 Not Modified
+- Pushes a live-reload event over Server-Sent Events when a build finishes
+  (i.e. when the generated files stop changing)
+- Logs latency and bytes sent for every request
+
+Usage:
+    python preview_server.py [--port 8000] [--root /path/to/website] [--no-reload]
+
+Then open http://localhost:8000 in a browser.
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+import mimetypes
+from pathlib import Path
+from email.utils import formatdate, parsedate_to_datetime
+from urllib.parse import unquote, urlsplit
+
+# Get the project root (parent of scripts directory)
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+
+# Endpoint the live-reload snippet listens on
+RELOAD_PATH = '/__livereload'
+
+# Injected before </body> in HTML responses when live reload is on
+RELOAD_SNIPPET = (
+    '<script>(function(){var s=new EventSource("' + RELOAD_PATH + '");'
+    's.addEventListener("reload",function(){location.reload();});})();</script>'
+).encode('utf-8')
+
+# File types the build writes; changes to these trigger a reload
+WATCHED_SUFFIXES = {'.html', '.css', '.js', '.json', '.txt'}
+
+# Directories the build never writes to
+SKIPPED_DIRS = {'.git', 'node_modules', 'backups', 'scripts', 'Text', '__pycache__'}
+
+# Precompressed variants, in order of preference
+ENCODINGS = [('br', '.br'), ('gzip', '.gz')]
+
+STATUS_TEXT = {
+    200: 'OK',
+    304: 'Not Modified',
+    400: 'Bad Request',
+    403: 'Forbidden',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    500: 'Internal Server Error',
+}
+
+mimetypes.add_type('application/json', '.json')
+mimetypes.add_type('font/woff2', '.woff2')
+mimetypes.add_type('application/manifest+json', '.webmanifest')
+
+
+# =============================================================================
+# FILE RESOLUTION
+# =============================================================================
+
+def resolve_path(root, url_path):
+    """
+    Map a URL path onto a file under root, or None if it is not servable.
+    Raises ValueError for a path no file can have (an embedded NUL).
+    """
+    rel = unquote(url_path).lstrip('/')
+    if '\0' in rel:
+        raise ValueError(f'NUL in path: {url_path!r}')
+    target = (root / rel).resolve()
+
+    # Refuse anything that escapes the site root
+    if target != root and root not in target.parents:
+        return None
+
+    if target.is_dir():
+        target = target / 'index.html'
+
+    return target if target.is_file() else None
+
+
+def error_response(status):
+    """(status, headers, body, note) for a plain-text error page."""
+    return status, {'Content-Type': 'text/plain; charset=utf-8'}, STATUS_TEXT[status].encode('utf-8'), ''
+
+
+def choose_variant(path, accept_encoding):
+    """Pick the best precompressed sibling the client accepts."""
+    accepted = {token.split(';')[0].strip() for token in accept_encoding.split(',')}
+    for encoding, suffix in ENCODINGS:
+        if encoding in accepted:
+            candidate = path.with_name(path.name + suffix)
+            if candidate.is_file():
+                return candidate, encoding
+    return path, None
+
+
+def make_etag(stat, encoding, injected):
+    """Build a validator from size, mtime and the representation served."""
+    tag = f'{stat.st_size:x}-{stat.st_mtime_ns:x}'
+    if encoding:
+        tag += f'-{encoding}'
+    if injected:
+        tag += '-lr'
+    return f'"{tag}"'
+
+
+def is_not_modified(headers, etag, mtime):
+    """Evaluate If-None-Match / If-Modified-Since per RFC 9110."""
+    if_none_match = headers.get('if-none-match')
+    if if_none_match is not None:
+        candidates = [t.strip() for t in if_none_match.split(',')]
+        return '*' in candidates or etag in candidates or f'W/{etag}' in candidates
+
+    if_modified_since = headers.get('if-modified-since')
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(mtime) <= int(since)
+
+    return False
+
+
+# =============================================================================
+# LIVE RELOAD
+# =============================================================================
+
+def site_signature(root):
+    """Cheap fingerprint of every generated file: (count, newest mtime, total size)."""
+    count = 0
+    newest = 0
+    total = 0
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = list(os.scandir(current))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIPPED_DIRS and not entry.name.startswith('.'):
+                    stack.append(entry.path)
+            elif os.path.splitext(entry.name)[1] in WATCHED_SUFFIXES:
+                try:
+                    st = entry.stat()
+                except OSError:
+                    # Removed since the scan (fingerprint_assets.py drops stale copies)
+                    continue
+                count += 1
+                total += st.st_size
+                newest = max(newest, st.st_mtime_ns)
+    return count, newest, total
+
+
+class LiveReload:
+    """Tracks SSE subscribers and notifies them once a build settles."""
+
+    def __init__(self, root, interval=0.5):
+        self.root = root
+        self.interval = interval
+        self.subscribers = set()
+
+    async def watch(self):
+        loop = asyncio.get_running_loop()
+        last = await loop.run_in_executor(None, site_signature, self.root)
+        pending = False
+
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                current = await loop.run_in_executor(None, site_signature, self.root)
+            except Exception as e:
+                # Keep watching: a failed scan must not end live reload for the session
+                print(f"[reload] scan failed: {e}")
+                continue
+            if current != last:
+                # Still changing - wait for the build to finish writing
+                last = current
+                pending = True
+            elif pending:
+                pending = False
+                print(f"[reload] build finished, notifying {len(self.subscribers)} client(s)")
+                for queue in list(self.subscribers):
+                    queue.put_nowait('reload')
+
+    async def stream(self, writer):
+        queue = asyncio.Queue()
+        self.subscribers.add(queue)
+        try:
+            writer.write(
+                b'HTTP/1.1 200 OK\r\n'
+                b'Content-Type: text/event-stream\r\n'
+                b'Cache-Control: no-store\r\n'
+                b'Connection: keep-alive\r\n\r\n'
+                b'retry: 1000\n\n'
+            )
+            await writer.drain()
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=15)
+                    writer.write(f'event: {event}\ndata: {time.time():.0f}\n\n'.encode())
+                except asyncio.TimeoutError:
+                    # Comment line keeps proxies from closing an idle stream
+                    writer.write(b': ping\n\n')
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self.subscribers.discard(queue)
+
+
+# =============================================================================
+# HTTP HANDLING
+# =============================================================================
+
+class BadRequest(Exception):
+    """A request line that is not METHOD TARGET VERSION."""
+
+
+class PreviewServer:
+    """Minimal HTTP/1.1 static file server built on asyncio streams."""
+
+    def __init__(self, root, live_reload=None):
+        self.root = root
+        self.live_reload = live_reload
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await self.read_request(reader)
+                except BadRequest as e:
+                    await self.send(writer, '-', str(e), False, error_response(400), time.perf_counter())
+                    break
+                if request is None:
+                    break
+                method, target, version, headers = request
+
+                if self.live_reload and urlsplit(target).path == RELOAD_PATH:
+                    await self.live_reload.stream(writer)
+                    break
+
+                keep_alive = await self.respond(writer, method, target, version, headers)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def read_request(self, reader):
+        try:
+            request_line = await reader.readline()
+        except ValueError:
+            raise BadRequest('(request line too long)')
+        if not request_line:
+            return None
+
+        parts = request_line.decode('latin-1').split()
+        if len(parts) != 3:
+            raise BadRequest(repr(request_line.decode('latin-1').strip())[:50])
+        method, target, version = parts
+
+        headers = {}
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError:
+                raise BadRequest('(header line too long)')
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        return method, target, version, headers
+
+    async def respond(self, writer, method, target, version, headers):
+        start = time.perf_counter()
+        keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+        await self.send(writer, method, target, keep_alive, self.build_response(method, target, headers), start)
+        return keep_alive
+
+    async def send(self, writer, method, target, keep_alive, response, start):
+        status, response_headers, body, note = response
+        if status != 304:
+            response_headers['Content-Length'] = str(len(body))
+        response_headers['Connection'] = 'keep-alive' if keep_alive else 'close'
+
+        head = [f'HTTP/1.1 {status} {STATUS_TEXT[status]}']
+        head.extend(f'{name}: {value}' for name, value in response_headers.items())
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1'))
+        if method != 'HEAD':
+            writer.write(body)
+        await writer.drain()
+
+        elapsed = (time.perf_counter() - start) * 1000
+        sent = 0 if method == 'HEAD' else len(body)
+        print(f"{method:4} {status} {target:<50} {sent:>9,} B {elapsed:7.2f} ms {note}")
+
+    def build_response(self, method, target, headers):
+        if method not in ('GET', 'HEAD'):
+            return 405, {'Allow': 'GET, HEAD'}, b'', ''
+
+        try:
+            path = resolve_path(self.root, urlsplit(target).path)
+            if path is None:
+                return error_response(404)
+            return self.file_response(path, headers)
+        except ValueError:
+            return error_response(400)
+        except PermissionError:
+            return error_response(403)
+        except OSError as e:
+            print(f"[error] {target}: {e}")
+            return error_response(500)
+
+    def file_response(self, path, headers):
+        content_type, _ = mimetypes.guess_type(path.name)
+        content_type = content_type or 'application/octet-stream'
+        if content_type.startswith('text/') or content_type.endswith(('json', 'javascript')):
+            content_type += '; charset=utf-8'
+
+        is_html = path.suffix == '.html'
+        inject = bool(self.live_reload) and is_html
+
+        # The reload snippet has to be spliced into plain HTML, so injected
+        # pages are always served identity-encoded
+        if inject:
+            served, encoding = path, None
+        else:
+            served, encoding = choose_variant(path, headers.get('accept-encoding', ''))
+
+        stat = served.stat()
+        etag = make_etag(stat, encoding, inject)
+        response_headers = {
+            'Content-Type': content_type,
+            'ETag': etag,
+            'Last-Modified': formatdate(stat.st_mtime, usegmt=True),
+            'Cache-Control': 'no-cache',
+            'Vary': 'Accept-Encoding',
+        }
+        if encoding:
+            response_headers['Content-Encoding'] = encoding
+
+        if is_not_modified(headers, etag, stat.st_mtime):
+            return 304, response_headers, b'', encoding or ''
+
+        body = served.read_bytes()
+        if inject:
+            marker = body.rfind(b'</body>')
+            if marker != -1:
+                body = body[:marker] + RELOAD_SNIPPET + body[marker:]
+
+        return 200, response_headers, body, encoding or ''
+
+
+async def serve(root, host, port, reload_enabled):
+    live_reload = LiveReload(root) if reload_enabled else None
+    server = PreviewServer(root, live_reload)
+
+    srv = await asyncio.start_server(server.handle, host, port)
+    print(f"Serving {root}")
+    print(f"  http://{host}:{port}/")
+    print(f"  Live reload: {'on' if live_reload else 'off'}")
+    print()
+
+    async with srv:
+        # The event loop only keeps a weak reference to tasks
+        watcher = asyncio.create_task(live_reload.watch()) if live_reload else None
+        try:
+            await srv.serve_forever()
+        finally:
+            if watcher:
+                watcher.cancel()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Serve the Threads of Grace website locally with live reload'
+    )
+    parser.add_argument('--root', '-r', default=str(PROJECT_ROOT),
+                        help='Website directory to serve (default: project root)')
+    parser.add_argument('--host', default='127.0.0.1',
+                        help='Interface to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', '-p', type=int, default=8000,
+                        help='Port to listen on (default: 8000)')
+    parser.add_argument('--no-reload', action='store_true',
+                        help='Disable live reload (HTML is then served precompressed too)')
+
+    args = parser.parse_args()
+
+    root = Path(args.root).resolve()
+    if not root.is_dir():
+        print(f"Error: website directory not found: {root}")
+        return 1
+
+    try:
+        asyncio.run(serve(root, args.host, args.port, not args.no_reload))
+    except KeyboardInterrupt:
+        print("\nStopped.")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
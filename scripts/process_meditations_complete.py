@@ -27,6 +27,12 @@ import argparse
 from datetime import datetime
 from pathlib import Path
 
+from build_fonts import font_links
+
+# Shared stylesheets and scripts; load_asset_names() swaps in the
+# fingerprinted names from the website's asset-manifest.json
+ASSETS = {name: name for name in ('styles.css', 'listing.css', 'meditation.css', 'script.js')}
+
 
 # =============================================================================
 # TEXT CLEANING FUNCTIONS
@@ -271,11 +277,9 @@ def generate_meditation_html(meditation_data, date_str, liturgical_info):
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{escape_html(title_display)} | Threads of Grace</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Crimson+Pro:ital,wght@0,300;0,400;0,600;1,300;1,400&family=Cormorant+Garamond:ital,wght@0,300;0,400;0,600;1,300;1,400&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="../styles.css">
-    <link rel="stylesheet" href="../meditation.css">
+    {font_links(ASSETS, '../')}
+    <link rel="stylesheet" href="../{ASSETS['styles.css']}">
+    <link rel="stylesheet" href="../{ASSETS['meditation.css']}">
 </head>
 <body>
     <div class="grain-overlay"></div>
@@ -317,7 +321,7 @@ def generate_meditation_html(meditation_data, date_str, liturgical_info):
         </div>
     </footer>
 
-    <script src="../script.js"></script>
+    <script src="../{ASSETS['script.js']}"></script>
 </body>
 </html>'''
     
@@ -356,10 +360,8 @@ def generate_chronological_html(all_data):
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>All Meditations | Threads of Grace</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Crimson+Pro:ital,wght@0,300;0,400;0,600;1,300;1,400&family=Cormorant+Garamond:ital,wght@0,300;0,400;0,600;1,300;1,400&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="styles.css">
+    {font_links(ASSETS)}
+    <link rel="stylesheet" href="{ASSETS['styles.css']}">
     <style>
         .year-section {{
             margin-bottom: 3rem;
@@ -463,7 +465,7 @@ def generate_chronological_html(all_data):
 
 ''')
     
-    html_parts.append('''    </main>
+    html_parts.append(f'''    </main>
 
     <footer class="site-footer">
         <div class="container">
@@ -472,7 +474,7 @@ def generate_chronological_html(all_data):
         </div>
     </footer>
 
-    <script src="script.js"></script>
+    <script src="{ASSETS['script.js']}"></script>
 </body>
 </html>''')
     
@@ -496,11 +498,9 @@ def generate_season_html(all_data, season, title):
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{title} | Threads of Grace</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Crimson+Pro:ital,wght@0,300;0,400;0,600;1,300;1,400&family=Cormorant+Garamond:ital,wght@0,300;0,400;0,600;1,300;1,400&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="styles.css">
-    <link rel="stylesheet" href="listing.css">
+    {font_links(ASSETS)}
+    <link rel="stylesheet" href="{ASSETS['styles.css']}">
+    <link rel="stylesheet" href="{ASSETS['listing.css']}">
 </head>
 <body>
     <div class="grain-overlay"></div>
@@ -541,7 +541,7 @@ def generate_season_html(all_data, season, title):
             </article>
 ''')
     
-    html_parts.append('''        </div>
+    html_parts.append(f'''        </div>
     </main>
 
     <footer class="site-footer">
@@ -552,7 +552,7 @@ def generate_season_html(all_data, season, title):
         </div>
     </footer>
 
-    <script src="script.js"></script>
+    <script src="{ASSETS['script.js']}"></script>
 </body>
 </html>''')
     
@@ -590,6 +590,15 @@ def save_meditations_data(website_dir, data):
         json.dump(sorted_data, f, indent=2)
 
 
+def load_asset_names(website_dir):
+    """Use the fingerprinted asset and font names from asset-manifest.json, if any."""
+    manifest_path = Path(website_dir) / 'asset-manifest.json'
+    if manifest_path.exists():
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+        ASSETS.update(manifest)
+
+
 def process_files(input_dir, website_dir, liturgical_db):
     """Process all meditation files and update the website."""
     
@@ -700,6 +709,8 @@ def main():
     print(f"Liturgical DB: {args.liturgical_db or '(not specified)'}")
     print()
     
+    load_asset_names(args.website_dir)
+
     # Load liturgical database
     liturgical_db = load_liturgical_db(args.liturgical_db) if args.liturgical_db else {}
     if liturgical_db:
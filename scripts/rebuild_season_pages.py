@@ -11,6 +11,13 @@ import re
 from datetime import datetime
 from bs4 import BeautifulSoup
 
+from fingerprint_assets import asset_names
+from build_fonts import font_links
+
+# Shared stylesheets and scripts, under their fingerprinted names
+ASSETS = asset_names()
+FONT_LINKS = font_links(ASSETS)
+
 def extract_title_from_meditation(filepath):
     """Extract the title from a meditation HTML file."""
     try:
@@ -107,11 +114,9 @@ def generate_season_html(season_name, meditations, season_slug):
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{season_name} Meditations | Threads of Grace</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Crimson+Pro:ital,wght@0,300;0,400;0,600;1,300;1,400&family=Cormorant+Garamond:ital,wght@0,300;0,400;0,600;1,300;1,400&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="styles.css">
-    <link rel="stylesheet" href="listing.css">
+    {FONT_LINKS}
+    <link rel="stylesheet" href="{ASSETS['styles.css']}">
+    <link rel="stylesheet" href="{ASSETS['listing.css']}">
 </head>
 <body>
     <div class="grain-overlay"></div>
@@ -151,7 +156,7 @@ def generate_season_html(season_name, meditations, season_slug):
             </article>
 '''
     
-    html += '''        </div>
+    html += f'''        </div>
     </main>
 
     <footer class="site-footer">
@@ -162,7 +167,7 @@ def generate_season_html(season_name, meditations, season_slug):
         </div>
     </footer>
 
-    <script src="script.js"></script>
+    <script src="{ASSETS['script.js']}"></script>
 </body>
 </html>'''
     
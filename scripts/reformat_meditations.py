@@ -11,6 +11,13 @@ import re
 from pathlib import Path
 from bs4 import BeautifulSoup
 
+from fingerprint_assets import asset_names
+from build_fonts import font_links
+
+# Shared stylesheets and scripts, under their fingerprinted names
+ASSETS = asset_names()
+FONT_LINKS = font_links(ASSETS, '../')
+
 
 def needs_reformatting(filepath):
     """Check if a file needs reformatting (has BeautifulSoup minified format)."""
@@ -104,11 +111,9 @@ def generate_html(data):
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{data['title']}</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Crimson+Pro:ital,wght@0,300;0,400;0,600;1,300;1,400&family=Cormorant+Garamond:ital,wght@0,300;0,400;0,600;1,300;1,400&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="../styles.css">
-    <link rel="stylesheet" href="../meditation.css">
+    {FONT_LINKS}
+    <link rel="stylesheet" href="../{ASSETS['styles.css']}">
+    <link rel="stylesheet" href="../{ASSETS['meditation.css']}">
 </head>
 <body>
     <div class="grain-overlay"></div>
@@ -150,7 +155,7 @@ def generate_html(data):
         </div>
     </footer>
 
-    <script src="../script.js"></script>
+    <script src="../{ASSETS['script.js']}"></script>
 </body>
 </html>
 '''
@@ -7,8 +7,12 @@ This script reads data from the meditation files and regenerates:
 - Season pages: advent.html, christmas.html, easter.html, epiphany.html, lent.html, ordinary-time.html, special.html
 - by-year.html (meditations organized by year)
 - by-season.html (navigation page to season pages)
+- listings/YYYY.html (a page for each earlier year, whose list
+  chronological.html and by-year.html load on demand)
+- the previous/next navigation on each meditation page (build_navigation.py)
 
-It extracts data from the meditation files' HTML structure:
+It loads the meditations through meditation_corpus.Corpus, which reads the
+meditation files' HTML structure:
 - meditation-title-display: The meditation title
 - meditation-date-display: The display date
 - meditation-occasion: The liturgical occasion
@@ -16,74 +20,23 @@ It extracts data from the meditation files' HTML structure:
 """
 
 import re
-import hashlib
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
-from bs4 import BeautifulSoup
+
+from meditation_corpus import Corpus, Meditation
+from fingerprint_assets import asset_names
+from build_fonts import font_links
+from build_navigation import update_navigation
+
+# Shared stylesheets and scripts, under their fingerprinted names
+ASSETS = asset_names()
+FONT_LINKS = font_links(ASSETS)
 
 
 def extract_meditation_data(filepath):
     """Extract metadata from a meditation HTML file."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        soup = BeautifulSoup(f.read(), 'html.parser')
-
-    # Get filename for the link
-    filename = filepath.name
-
-    # Extract date from filename (YYYY-MM-DD.html)
-    date_match = re.match(r'(\d{4}-\d{2}-\d{2})\.html', filename)
-    date = date_match.group(1) if date_match else None
-
-    # Extract title
-    title_elem = soup.find('h1', class_='meditation-title-display')
-    title = title_elem.get_text().strip() if title_elem else ''
-
-    # Extract date display
-    date_elem = soup.find('div', class_='meditation-date-display')
-    date_display = date_elem.get_text().strip() if date_elem else ''
-
-    # Extract occasion
-    occasion_elem = soup.find('div', class_='meditation-occasion')
-    occasion_full = occasion_elem.get_text().strip() if occasion_elem else ''
-
-    # Parse occasion to get the name and season
-    # Format: "Occasion Name, Year X • Season" or "Occasion Name • Season"
-    occasion = occasion_full
-    season = ''
-    if '•' in occasion_full:
-        parts = occasion_full.split('•')
-        occasion = parts[0].strip()
-        season = parts[1].strip() if len(parts) > 1 else ''
-        # Remove ", Year X" from occasion for cleaner display
-        occasion = re.sub(r',\s*Year\s+[ABC]$', '', occasion).strip()
-
-    # Extract readings
-    readings_elem = soup.find('div', class_='meditation-readings')
-    readings = readings_elem.get_text().strip() if readings_elem else ''
-
-    # Extract meditation content and compute hash for duplicate detection
-    content_div = soup.find('div', class_='meditation-content')
-    content_paragraphs = []
-    if content_div:
-        for p in content_div.find_all('p'):
-            text = p.get_text().strip()
-            if text:
-                content_paragraphs.append(text)
-    content_text = '\n'.join(content_paragraphs)
-    content_hash = hashlib.md5(content_text.encode()).hexdigest()
-
-    return {
-        'filename': filename,
-        'date': date,
-        'title': title,
-        'date_display': date_display,
-        'occasion': occasion,
-        'occasion_full': occasion_full,
-        'season': season,
-        'readings': readings,
-        'content_hash': content_hash,
-    }
+    return Meditation.from_file(filepath)
 
 
 def escape_html(text):
@@ -95,20 +48,130 @@ def escape_html(text):
         .replace('"', '&quot;'))
 
 
-def generate_chronological_html(all_data):
-    """Generate chronological.html with scripture readings."""
+# chronological.html and by-year.html carry only the newest year's list;
+# each earlier year's is a page of its own (listings/YYYY.html), whose list
+# script.js fetches as the year scrolls near or is picked in the year
+# navigation. Without JavaScript the placeholder links to the page instead
+LISTINGS_DIR = 'listings'
 
-    # Sort by date descending
-    sorted_data = sorted(all_data, key=lambda x: x['date'] or '', reverse=True)
 
-    # Group by year
+def group_by_year(all_data):
+    """{year: entries newest first}, newest year first."""
     by_year = defaultdict(list)
-    for entry in sorted_data:
+    for entry in sorted(all_data, key=lambda x: x['date'] or '', reverse=True):
         if entry['date']:
-            year = entry['date'][:4]
-            by_year[year].append(entry)
+            by_year[entry['date'][:4]].append(entry)
+    return dict(sorted(by_year.items(), reverse=True))
+
+
+def render_meditation_list(entries, prefix=''):
+    """
+    A year's <ul class="meditation-list">, shared by the year listings.
+    prefix leads back to the site root ('../').
+    """
+    html = '''            <ul class="meditation-list">
+'''
+    for entry in entries:
+        title = escape_html(entry['title'])
+        occasion = escape_html(entry['occasion'])
+        readings = escape_html(entry['readings'])
+        date_display = entry['date_display']
+
+        html += f'''                <li>
+                    <a href="{prefix}meditations/{entry['filename']}" class="meditation-link">{title}</a>
+                    <div class="meditation-meta">
+                        <span class="meditation-date">{date_display}</span> •
+                        <span class="meditation-occasion">{occasion}</span>
+                    </div>
+                    <div class="meditation-scripture">{readings}</div>
+                </li>
+'''
+    html += '''            </ul>
+'''
+    return html
+
+
+def render_year_list(year, entries, newest):
+    """The newest year's list itself; a placeholder for script.js to fill for the others."""
+    if year == newest:
+        return render_meditation_list(entries)
+    return f'''            <div class="year-shard" data-shard="{LISTINGS_DIR}/{year}.html">
+                <p class="year-shard-status"><a href="{LISTINGS_DIR}/{year}.html">All {len(entries)} meditations from {year}</a></p>
+            </div>
+'''
+
+
+def render_year_nav(years):
+    """Links to each year's section, plus a note for readers without JavaScript."""
+    links = '\n'.join(f'            <a href="#{year}">{year}</a>' for year in years)
+    return f'''        <nav class="year-nav">
+{links}
+        </nav>
+        <noscript>
+            <p class="year-shard-status">Each earlier year opens on a page of its own. Every meditation is also listed in the <a href="title-index.html">Title Index</a>.</p>
+        </noscript>
+
+'''
+
+
+def generate_year_listing_html(year, entries):
+    """Generate listings/YYYY.html: one year's meditations, newest first."""
+    return f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Meditations from {year} | Threads of Grace</title>
+    {font_links(ASSETS, '../')}
+    <link rel="stylesheet" href="../{ASSETS['styles.css']}">
+    <link rel="stylesheet" href="../{ASSETS['listing.css']}">
+</head>
+<body>
+    <div class="grain-overlay"></div>
+
+    <header class="site-header">
+        <div class="container">
+            <h1 class="site-title"><a href="../index.html">Threads of Grace</a></h1>
+            <p class="site-subtitle">Meditations on Scripture and the Spiritual Life</p>
+        </div>
+    </header>
+
+    <main class="container">
+        <div class="page-intro">
+            <h2 class="page-title">Meditations from {year}</h2>
+            <p class="meditation-count">{len(entries)} meditations</p>
+        </div>
+
+{render_meditation_list(entries, '../')}    </main>
+
+    <footer class="site-footer">
+        <div class="container">
+            <p><a href="../index.html">Return to Home</a></p>
+            <p><a href="../by-year.html#{year}">Browse by Year</a></p>
+            <p class="copyright">© 2007–2025 Pat Horn. All rights reserved.</p>
+        </div>
+    </footer>
+
+    <script src="../{ASSETS['script.js']}"></script>
+</body>
+</html>'''
+
+
+def generate_year_listings(all_data):
+    """{filename: page} of each year's list but the newest, for LISTINGS_DIR."""
+    by_year = group_by_year(all_data)
+    return {f'{year}.html': generate_year_listing_html(year, entries)
+            for year, entries in list(by_year.items())[1:]}
 
-    years = sorted(by_year.keys(), reverse=True)
+
+def generate_chronological_html(all_data):
+    """Generate chronological.html with scripture readings (newest year inline)."""
+
+    # Sort by date descending
+    sorted_data = sorted(all_data, key=lambda x: x['date'] or '', reverse=True)
+
+    by_year = group_by_year(all_data)
+    years = list(by_year)
     total = len(sorted_data)
 
     # Get date range
@@ -127,10 +190,8 @@ def generate_chronological_html(all_data):
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>All Meditations | Threads of Grace</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Crimson+Pro:ital,wght@0,300;0,400;0,600;1,300;1,400&family=Cormorant+Garamond:ital,wght@0,300;0,400;0,600;1,300;1,400&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="styles.css">
+    {FONT_LINKS}
+    <link rel="stylesheet" href="{ASSETS['styles.css']}">
     <style>
         .year-section {{
             margin-bottom: 3rem;
@@ -192,6 +253,35 @@ def generate_chronological_html(all_data):
             font-style: italic;
             margin-top: 0.25rem;
         }}
+        .year-nav {{
+            display: flex;
+            flex-wrap: wrap;
+            justify-content: center;
+            gap: 0.5rem 1.25rem;
+            margin-bottom: 3rem;
+            font-family: 'Cormorant Garamond', serif;
+            font-size: 1.15rem;
+        }}
+        .year-nav a {{
+            color: var(--accent-sage);
+            text-decoration: none;
+        }}
+        .year-nav a:hover {{
+            color: var(--accent-gold);
+        }}
+        .year-shard-status {{
+            font-style: italic;
+            color: var(--medium-gray);
+        }}
+        .year-shard-retry {{
+            font: inherit;
+            color: var(--accent-sage);
+            background: none;
+            border: none;
+            padding: 0;
+            text-decoration: underline;
+            cursor: pointer;
+        }}
     </style>
 </head>
 <body>
@@ -213,36 +303,18 @@ def generate_chronological_html(all_data):
 
 '''
 
-    for year in years:
-        entries = sorted(by_year[year], key=lambda x: x['date'], reverse=True)
+    html += render_year_nav(years)
 
+    for year in years:
         html += f'''        <section class="year-section" id="{year}">
             <h3 class="year-heading">{year}</h3>
-            <ul class="meditation-list">
 '''
-
-        for entry in entries:
-            title = escape_html(entry['title'])
-            occasion = escape_html(entry['occasion'])
-            readings = escape_html(entry['readings'])
-            date_display = entry['date_display']
-
-            html += f'''                <li>
-                    <a href="meditations/{entry['filename']}" class="meditation-link">{title}</a>
-                    <div class="meditation-meta">
-                        <span class="meditation-date">{date_display}</span> •
-                        <span class="meditation-occasion">{occasion}</span>
-                    </div>
-                    <div class="meditation-scripture">{readings}</div>
-                </li>
-'''
-
-        html += '''            </ul>
-        </section>
+        html += render_year_list(year, by_year[year], years[0])
+        html += '''        </section>
 
 '''
 
-    html += '''    </main>
+    html += f'''    </main>
 
     <footer class="site-footer">
         <div class="container">
@@ -252,7 +324,7 @@ def generate_chronological_html(all_data):
         </div>
     </footer>
 
-    <script src="script.js"></script>
+    <script src="{ASSETS['script.js']}"></script>
 </body>
 </html>'''
 
@@ -264,8 +336,7 @@ def generate_season_html(all_data, season, page_title):
     import json
 
     # Filter by season (case-insensitive)
-    season_lower = season.lower()
-    season_entries = [e for e in all_data if e.get('season', '').lower() == season_lower]
+    season_entries = all_data.season(season)
 
     total = len(season_entries)
 
@@ -409,10 +480,8 @@ def generate_season_html(all_data, season, page_title):
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{page_title} | Threads of Grace</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Crimson+Pro:ital,wght@0,300;0,400;0,600;1,300;1,400&family=Cormorant+Garamond:ital,wght@0,300;0,400;0,600;1,300;1,400&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="styles.css">
+    {FONT_LINKS}
+    <link rel="stylesheet" href="{ASSETS['styles.css']}">
     <style>
         main.container {{
             padding-top: 2rem;
@@ -609,7 +678,7 @@ def generate_season_html(all_data, season, page_title):
 
 '''
 
-    html += '''    </main>
+    html += f'''    </main>
 
     <footer class="site-footer">
         <div class="container">
@@ -619,7 +688,7 @@ def generate_season_html(all_data, season, page_title):
         </div>
     </footer>
 
-    <script src="script.js"></script>
+    <script src="{ASSETS['script.js']}"></script>
 </body>
 </html>'''
 
@@ -630,7 +699,7 @@ def generate_special_html(all_data):
     """Generate special.html organized by lectionary year, occasion, and date."""
 
     # Filter by Special season
-    special_entries = [e for e in all_data if e.get('season', '').lower() == 'special']
+    special_entries = all_data.season('Special')
 
     total = len(special_entries)
 
@@ -691,10 +760,8 @@ def generate_special_html(all_data):
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Special Meditations | Threads of Grace</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Crimson+Pro:ital,wght@0,300;0,400;0,600;1,300;1,400&family=Cormorant+Garamond:ital,wght@0,300;0,400;0,600;1,300;1,400&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="styles.css">
+    {FONT_LINKS}
+    <link rel="stylesheet" href="{ASSETS['styles.css']}">
     <style>
         main.container {{
             padding-top: 2rem;
@@ -866,7 +933,7 @@ def generate_special_html(all_data):
 
 '''
 
-    html += '''    </main>
+    html += f'''    </main>
 
     <footer class="site-footer">
         <div class="container">
@@ -876,7 +943,7 @@ def generate_special_html(all_data):
         </div>
     </footer>
 
-    <script src="script.js"></script>
+    <script src="{ASSETS['script.js']}"></script>
 </body>
 </html>'''
 
@@ -884,19 +951,13 @@ def generate_special_html(all_data):
 
 
 def generate_by_year_html(all_data):
-    """Generate by-year.html with meditations organized by year, with full details."""
+    """Generate by-year.html with meditations organized by year, with full details (newest year inline)."""
 
     # Sort by date descending
     sorted_data = sorted(all_data, key=lambda x: x['date'] or '', reverse=True)
 
-    # Group by year
-    by_year = defaultdict(list)
-    for entry in sorted_data:
-        if entry['date']:
-            year = entry['date'][:4]
-            by_year[year].append(entry)
-
-    years = sorted(by_year.keys(), reverse=True)
+    by_year = group_by_year(all_data)
+    years = list(by_year)
     total = len(sorted_data)
 
     html = f'''<!DOCTYPE html>
@@ -905,10 +966,8 @@ def generate_by_year_html(all_data):
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Meditations by Year | Threads of Grace</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Crimson+Pro:ital,wght@0,300;0,400;0,600;1,300;1,400&family=Cormorant+Garamond:ital,wght@0,300;0,400;0,600;1,300;1,400&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="styles.css">
+    {FONT_LINKS}
+    <link rel="stylesheet" href="{ASSETS['styles.css']}">
     <style>
         .year-section {{
             margin-bottom: 3rem;
@@ -970,6 +1029,35 @@ def generate_by_year_html(all_data):
             font-style: italic;
             margin-top: 0.25rem;
         }}
+        .year-nav {{
+            display: flex;
+            flex-wrap: wrap;
+            justify-content: center;
+            gap: 0.5rem 1.25rem;
+            margin-bottom: 3rem;
+            font-family: 'Cormorant Garamond', serif;
+            font-size: 1.15rem;
+        }}
+        .year-nav a {{
+            color: var(--accent-sage);
+            text-decoration: none;
+        }}
+        .year-nav a:hover {{
+            color: var(--accent-gold);
+        }}
+        .year-shard-status {{
+            font-style: italic;
+            color: var(--medium-gray);
+        }}
+        .year-shard-retry {{
+            font: inherit;
+            color: var(--accent-sage);
+            background: none;
+            border: none;
+            padding: 0;
+            text-decoration: underline;
+            cursor: pointer;
+        }}
     </style>
 </head>
 <body>
@@ -990,37 +1078,20 @@ def generate_by_year_html(all_data):
 
 '''
 
+    html += render_year_nav(years)
+
     for year in years:
-        entries = sorted(by_year[year], key=lambda x: x['date'], reverse=True)
-        count = len(entries)
+        count = len(by_year[year])
 
-        html += f'''        <section class="year-section">
+        html += f'''        <section class="year-section" id="{year}">
             <h3 class="year-heading">{year} ({count} meditations)</h3>
-            <ul class="meditation-list">
 '''
-
-        for entry in entries:
-            title = escape_html(entry['title'])
-            occasion = escape_html(entry['occasion'])
-            readings = escape_html(entry['readings'])
-            date_display = entry['date_display']
-
-            html += f'''                <li>
-                    <a href="meditations/{entry['filename']}" class="meditation-link">{title}</a>
-                    <div class="meditation-meta">
-                        <span class="meditation-date">{date_display}</span> •
-                        <span class="meditation-occasion">{occasion}</span>
-                    </div>
-                    <div class="meditation-scripture">{readings}</div>
-                </li>
-'''
-
-        html += '''            </ul>
-        </section>
+        html += render_year_list(year, by_year[year], years[0])
+        html += '''        </section>
 
 '''
 
-    html += '''    </main>
+    html += f'''    </main>
 
     <footer class="site-footer">
         <div class="container">
@@ -1030,7 +1101,7 @@ def generate_by_year_html(all_data):
         </div>
     </footer>
 
-    <script src="script.js"></script>
+    <script src="{ASSETS['script.js']}"></script>
 </body>
 </html>'''
 
@@ -1204,10 +1275,8 @@ def generate_lectionary_year_html(all_data):
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Lectionary Year Index | Threads of Grace</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Crimson+Pro:ital,wght@0,300;0,400;0,600;1,300;1,400&family=Cormorant+Garamond:ital,wght@0,300;0,400;0,600;1,300;1,400&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="styles.css">
+    {FONT_LINKS}
+    <link rel="stylesheet" href="{ASSETS['styles.css']}">
     <style>
         main.container {{
             padding-top: 2rem;
@@ -1490,10 +1559,8 @@ def generate_title_index_html(all_data):
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Index by Title | Threads of Grace</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Crimson+Pro:ital,wght@0,300;0,400;0,600;1,300;1,400&family=Cormorant+Garamond:ital,wght@0,300;0,400;0,600;1,300;1,400&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="styles.css">
+    {FONT_LINKS}
+    <link rel="stylesheet" href="{ASSETS['styles.css']}">
     <style>
         .letter-nav {{
             display: flex;
@@ -1660,7 +1727,7 @@ def generate_title_index_html(all_data):
 
 '''
 
-    html += '''    </main>
+    html += f'''    </main>
 
     <footer class="site-footer">
         <div class="container">
@@ -1670,7 +1737,7 @@ def generate_title_index_html(all_data):
         </div>
     </footer>
 
-    <script src="script.js"></script>
+    <script src="{ASSETS['script.js']}"></script>
 </body>
 </html>'''
 
@@ -1776,10 +1843,8 @@ def generate_scripture_index_html(all_data):
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Index by Scripture | Threads of Grace</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Crimson+Pro:ital,wght@0,300;0,400;0,600;1,300;1,400&family=Cormorant+Garamond:ital,wght@0,300;0,400;0,600;1,300;1,400&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="styles.css">
+    {FONT_LINKS}
+    <link rel="stylesheet" href="{ASSETS['styles.css']}">
     <style>
         .book-nav {{
             display: flex;
@@ -1951,7 +2016,7 @@ def generate_scripture_index_html(all_data):
 
 '''
 
-    html += '''    </main>
+    html += f'''    </main>
 
     <footer class="site-footer">
         <div class="container">
@@ -1961,7 +2026,7 @@ def generate_scripture_index_html(all_data):
         </div>
     </footer>
 
-    <script src="script.js"></script>
+    <script src="{ASSETS['script.js']}"></script>
 </body>
 </html>'''
 
@@ -2031,10 +2096,8 @@ def generate_appendix_statistics_html(all_data):
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Collection Statistics | Threads of Grace</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Crimson+Pro:ital,wght@0,300;0,400;0,600;1,300;1,400&family=Cormorant+Garamond:ital,wght@0,300;0,400;0,600;1,300;1,400&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="styles.css">
+    {FONT_LINKS}
+    <link rel="stylesheet" href="{ASSETS['styles.css']}">
     <style>
         .index-container {{
             max-width: 900px;
@@ -2297,7 +2360,7 @@ def generate_appendix_statistics_html(all_data):
             </div>
 '''
 
-    html += '''        </section>
+    html += f'''        </section>
     </main>
 
     <footer class="site-footer">
@@ -2307,7 +2370,7 @@ def generate_appendix_statistics_html(all_data):
         </div>
     </footer>
 
-    <script src="script.js"></script>
+    <script src="{ASSETS['script.js']}"></script>
 </body>
 </html>'''
 
@@ -2343,11 +2406,9 @@ def generate_by_season_html(all_data):
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Browse by Season | Threads of Grace</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Crimson+Pro:ital,wght@0,300;0,400;0,600;1,300;1,400&family=Cormorant+Garamond:ital,wght@0,300;0,400;0,600;1,300;1,400&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="styles.css">
-    <link rel="stylesheet" href="listing.css">
+    {FONT_LINKS}
+    <link rel="stylesheet" href="{ASSETS['styles.css']}">
+    <link rel="stylesheet" href="{ASSETS['listing.css']}">
 </head>
 <body>
     <div class="grain-overlay"></div>
@@ -2376,7 +2437,7 @@ def generate_by_season_html(all_data):
             </a>
 '''
 
-    html += '''        </div>
+    html += f'''        </div>
     </main>
 
     <footer class="site-footer">
@@ -2387,7 +2448,7 @@ def generate_by_season_html(all_data):
         </div>
     </footer>
 
-    <script src="script.js"></script>
+    <script src="{ASSETS['script.js']}"></script>
 </body>
 </html>'''
 
@@ -2413,15 +2474,7 @@ def main():
     print()
 
     # Read all meditation files
-    html_files = sorted(meditations_dir.glob('*.html'))
-    all_data = []
-
-    for filepath in html_files:
-        try:
-            data = extract_meditation_data(filepath)
-            all_data.append(data)
-        except Exception as e:
-            print(f"Error reading {filepath.name}: {e}")
+    all_data = Corpus.load(meditations_dir)
 
     print(f"Read {len(all_data)} meditation files")
     print()
@@ -2453,6 +2506,26 @@ def main():
                 f.write(content)
             print(f"Wrote: {filename} ({len(content)} bytes)")
 
+    # Year pages for chronological.html and by-year.html
+    listings_dir = website_dir / LISTINGS_DIR
+    listings = generate_year_listings(all_data)
+    if dry_run:
+        print(f"Would write: {len(listings)} year lists to {LISTINGS_DIR}/")
+    else:
+        listings_dir.mkdir(exist_ok=True)
+        for filename, content in listings.items():
+            with open(listings_dir / filename, 'w', encoding='utf-8') as f:
+                f.write(content)
+        # Years now shown inline, or no longer in the archive
+        for path in listings_dir.glob('*.html'):
+            if path.name not in listings:
+                path.unlink()
+        print(f"Wrote: {len(listings)} year lists to {LISTINGS_DIR}/")
+
+    # Previous/next links on the meditation pages
+    updated = update_navigation(all_data, dry_run)
+    print(f"{'Would update' if dry_run else 'Updated'}: navigation in {updated} meditation pages")
+
     print()
     print("Done!")
 
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Shared text normalization for the search and related-meditation builds.
+
+Every indexed word goes through the same pipeline:
+
+1. Unicode folding - accents removed ("Thérèse" -> "therese"), curly quotes
+   and apostrophes straightened, lower-cased
+2. Tokenizing - words and numbers; possessive 's dropped, other
+   apostrophes removed ("don't" -> "dont")
+3. Stop-word removal
+4. Stemming - the Porter algorithm, after mapping common irregular forms
+   to their base word ("forgave" -> "forgive" -> "forgiv")
+
+The browser cannot stem, so the build also emits a stem table (see
+stem_table()) mapping every corpus word to its stem; search.html normalizes
+queries through it and gets exactly the terms the index was built with.
+
+Usage:
+    from search_tokenizer import index_terms
+    index_terms("Forgiving, they forgave")   # ['forgiv', 'forgiv']
+
+Run directly to show how text is normalized:
+    python search_tokenizer.py "The transformed heart"
+"""
+
+import re
+import sys
+import unicodedata
+from functools import lru_cache
+
+# Characters folded before tokenizing
+FOLD_TABLE = str.maketrans({
+    '‘': "'", '’': "'", '‛': "'", '′': "'",
+    '“': '"', '”': '"',
+    '–': '-', '—': '-',
+    'æ': 'ae', 'œ': 'oe', 'ß': 'ss',
+})
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+STOP_WORDS = frozenset({
+    'a', 'about', 'after', 'again', 'all', 'also', 'am', 'an', 'and', 'any', 'are', 'as',
+    'at', 'be', 'because', 'been', 'before', 'being', 'but', 'by', 'can', 'cant', 'could',
+    'did', 'do', 'does', 'doing', 'dont', 'down', 'each', 'even', 'every', 'for', 'from',
+    'had', 'has', 'have', 'he', 'her', 'here', 'him', 'his', 'how', 'i', 'if', 'im', 'in',
+    'into', 'is', 'isnt', 'it', 'its', 'ive', 'just', 'let', 'lets', 'like', 'may', 'me',
+    'more', 'most', 'much', 'must', 'my', 'no', 'not', 'now', 'of', 'off', 'on', 'one',
+    'only', 'or', 'other', 'our', 'ours', 'out', 'over', 'own', 'pat', 'horn', 'same',
+    'she', 'should', 'so', 'some', 'such', 'than', 'that', 'thats', 'the', 'their', 'them',
+    'then', 'there', 'these', 'they', 'this', 'those', 'through', 'to', 'too', 'up', 'us',
+    'very', 'was', 'we', 'were', 'what', 'when', 'where', 'which', 'while', 'who', 'whom',
+    'why', 'will', 'with', 'wont', 'would', 'you', 'youre', 'your',
+})
+
+# Irregular forms the Porter rules cannot relate to their base word
+IRREGULAR_FORMS = {
+    'forgave': 'forgive', 'forgiven': 'forgive',
+    'gave': 'give', 'given': 'give',
+    'rose': 'rise', 'risen': 'rise', 'arose': 'arise', 'arisen': 'arise',
+    'fell': 'fall', 'fallen': 'fall',
+    'knew': 'know', 'known': 'know',
+    'saw': 'see', 'seen': 'see',
+    'spoke': 'speak', 'spoken': 'speak',
+    'took': 'take', 'taken': 'take',
+    'wept': 'weep', 'slept': 'sleep', 'kept': 'keep',
+    'sought': 'seek', 'taught': 'teach', 'brought': 'bring', 'thought': 'think',
+    'found': 'find', 'bore': 'bear', 'born': 'bear', 'borne': 'bear',
+    'chose': 'choose', 'chosen': 'choose',
+    'came': 'come', 'began': 'begin', 'begun': 'begin',
+    'drew': 'draw', 'drawn': 'draw', 'grew': 'grow', 'grown': 'grow',
+    'heard': 'hear', 'led': 'lead', 'left': 'leave', 'lost': 'lose',
+    'made': 'make', 'met': 'meet', 'paid': 'pay', 'said': 'say', 'sent': 'send',
+    'sang': 'sing', 'sung': 'sing', 'stood': 'stand', 'told': 'tell', 'understood': 'understand',
+    'went': 'go', 'gone': 'go', 'wrote': 'write', 'written': 'write',
+    'children': 'child', 'men': 'man', 'women': 'woman', 'feet': 'foot',
+}
+
+
+def fold(text):
+    """Lower-case, straighten quotes and dashes, and strip accents."""
+    text = unicodedata.normalize('NFKD', text.translate(FOLD_TABLE))
+    return ''.join(c for c in text if not unicodedata.combining(c)).lower()
+
+
+def words(text):
+    """Folded words of a text, stop words included."""
+    result = []
+    for word in WORD_PATTERN.findall(fold(text)):
+        if word.endswith("'s"):
+            word = word[:-2]
+        result.append(word.replace("'", ''))
+    return result
+
+
+# ============================================================================
+# PORTER STEMMER
+# ============================================================================
+
+VOWELS = frozenset('aeiou')
+
+
+def _is_consonant(word, i):
+    if word[i] in VOWELS:
+        return False
+    if word[i] == 'y':
+        return i == 0 or not _is_consonant(word, i - 1)
+    return True
+
+
+def _measure(stem):
+    """Number of vowel-consonant sequences (m in [C](VC){m}[V])."""
+    m = 0
+    previous_vowel = False
+    for i in range(len(stem)):
+        consonant = _is_consonant(stem, i)
+        if consonant and previous_vowel:
+            m += 1
+        previous_vowel = not consonant
+    return m
+
+
+def _has_vowel(stem):
+    return any(not _is_consonant(stem, i) for i in range(len(stem)))
+
+
+def _ends_double_consonant(word):
+    return len(word) > 1 and word[-1] == word[-2] and _is_consonant(word, len(word) - 1)
+
+
+def _ends_cvc(word):
+    """consonant-vowel-consonant, where the last consonant is not w, x or y."""
+    return (len(word) > 2
+            and _is_consonant(word, len(word) - 3)
+            and not _is_consonant(word, len(word) - 2)
+            and _is_consonant(word, len(word) - 1)
+            and word[-1] not in 'wxy')
+
+
+def _replace(word, rules, min_measure):
+    """Apply the first rule whose suffix matches; returns (word, matched)."""
+    for suffix, replacement in rules:
+        if word.endswith(suffix):
+            stem = word[:len(word) - len(suffix)]
+            if _measure(stem) > min_measure:
+                return stem + replacement, True
+            return word, True
+    return word, False
+
+
+STEP2_RULES = (
+    ('ational', 'ate'), ('tional', 'tion'), ('enci', 'ence'), ('anci', 'ance'),
+    ('izer', 'ize'), ('bli', 'ble'), ('alli', 'al'), ('entli', 'ent'), ('eli', 'e'),
+    ('ousli', 'ous'), ('ization', 'ize'), ('ation', 'ate'), ('ator', 'ate'),
+    ('alism', 'al'), ('iveness', 'ive'), ('fulness', 'ful'), ('ousness', 'ous'),
+    ('aliti', 'al'), ('iviti', 'ive'), ('biliti', 'ble'), ('logi', 'log'),
+)
+STEP3_RULES = (
+    ('icate', 'ic'), ('ative', ''), ('alize', 'al'), ('iciti', 'ic'),
+    ('ical', 'ic'), ('ful', ''), ('ness', ''),
+)
+STEP4_SUFFIXES = (
+    'al', 'ance', 'ence', 'er', 'ic', 'able', 'ible', 'ant', 'ement', 'ment',
+    'ent', 'ion', 'ou', 'ism', 'ate', 'iti', 'ous', 'ive', 'ize',
+)
+
+
+def porter_stem(word):
+    """Stem a lower-case word with the Porter (1980) algorithm."""
+    if len(word) <= 2:
+        return word
+
+    # Step 1a: plurals
+    if word.endswith('sses'):
+        word = word[:-2]
+    elif word.endswith('ies'):
+        word = word[:-2]
+    elif word.endswith('s') and not word.endswith('ss'):
+        word = word[:-1]
+
+    # Step 1b: -eed, -ed, -ing
+    if word.endswith('eed'):
+        if _measure(word[:-3]) > 0:
+            word = word[:-1]
+    else:
+        for suffix in ('ed', 'ing'):
+            if word.endswith(suffix) and _has_vowel(word[:-len(suffix)]):
+                word = word[:-len(suffix)]
+                if word.endswith(('at', 'bl', 'iz')):
+                    word += 'e'
+                elif _ends_double_consonant(word) and word[-1] not in 'lsz':
+                    word = word[:-1]
+                elif _measure(word) == 1 and _ends_cvc(word):
+                    word += 'e'
+                break
+
+    # Step 1c: y -> i
+    if word.endswith('y') and _has_vowel(word[:-1]):
+        word = word[:-1] + 'i'
+
+    # Steps 2 and 3: double and single suffixes
+    word, _ = _replace(word, STEP2_RULES, 0)
+    word, _ = _replace(word, STEP3_RULES, 0)
+
+    # Step 4: strip suffixes from long stems
+    for suffix in sorted(STEP4_SUFFIXES, key=len, reverse=True):
+        if word.endswith(suffix):
+            stem = word[:-len(suffix)]
+            if _measure(stem) > 1 and (suffix != 'ion' or stem.endswith(('s', 't'))):
+                word = stem
+            break
+
+    # Step 5: final -e and -ll
+    if word.endswith('e'):
+        stem = word[:-1]
+        m = _measure(stem)
+        if m > 1 or (m == 1 and not _ends_cvc(stem)):
+            word = stem
+    if word.endswith('ll') and _measure(word) > 1:
+        word = word[:-1]
+
+    return word
+
+
+@lru_cache(maxsize=None)
+def stem(word):
+    """Stem of a folded word, mapping irregular forms first."""
+    if word.isdigit():
+        return word
+    return porter_stem(IRREGULAR_FORMS.get(word, word))
+
+
+def index_terms(text, keep_stop_words=False):
+    """Stemmed index terms of a text, without stop words and single letters."""
+    return [
+        stem(w) for w in words(text)
+        if (len(w) > 1 or w.isdigit()) and (keep_stop_words or w not in STOP_WORDS)
+    ]
+
+
+def positional_terms(text):
+    """
+    (term, position) for each index term of a text.
+
+    Positions count every word, stop words included, so "dark night of the
+    soul" puts "soul" three places after "night".
+    """
+    return [
+        (stem(w), i) for i, w in enumerate(words(text))
+        if (len(w) > 1 or w.isdigit()) and w not in STOP_WORDS
+    ]
+
+
+def stem_table(vocabulary):
+    """
+    Compact word -> stem table for the browser.
+
+    {stem: "suffix suffix =fullform"}: each word that begins with its stem is
+    stored as the remaining suffix; any other (irregular) word is stored
+    whole after '='. Words that are their own stem are omitted. The
+    irregular forms are always included, so a query for "forgave" matches
+    "forgiving" even when the corpus never uses "forgave".
+    """
+    table = {}
+    for word in sorted(set(vocabulary) | set(IRREGULAR_FORMS)):
+        if word in STOP_WORDS or word.isdigit():
+            continue
+        s = stem(word)
+        if s == word:
+            continue
+        entry = word[len(s):] if word.startswith(s) else '=' + word
+        table.setdefault(s, []).append(entry)
+    return {s: ' '.join(entries) for s, entries in sorted(table.items())}
+
+
+def main():
+    text = ' '.join(a for a in sys.argv[1:] if not a.startswith('-'))
+    if not text:
+        print('Usage: python search_tokenizer.py "text to normalize"')
+        sys.exit(1)
+
+    for word in words(text):
+        marker = ' (stop word)' if word in STOP_WORDS else ''
+        print(f"  {word:<20} -> {stem(word)}{marker}")
+
+
+if __name__ == '__main__':
+    main()
@@ -28,6 +28,8 @@ except ImportError:
     print("  pip install beautifulsoup4")
     sys.exit(1)
 
+from meditation_corpus import Corpus
+
 
 def looks_like_scripture(text):
     """
@@ -182,77 +184,46 @@ def title_case_smart(text):
     return ' '.join(result)
 
 
-def extract_title_from_meditation(filepath):
+def extract_title_from_meditation(med):
     """
-    Extract the title from meditation HTML file.
+    Extract the title from a meditation.
     
     Strategy:
     1. First check <h1 class="meditation-title-display"> - if it's a valid title, use it
-    2. If h1 is scripture/occasion, check <p> tags in meditation-content div
+    2. If h1 is scripture/occasion, check the paragraphs of the meditation-content div
        - Skip scripture readings and occasion labels
        - Title is typically ALL CAPS and short (< 100 chars)
     """
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            soup = BeautifulSoup(f.read(), 'html.parser')
-        
-        # Source 1: Check the h1 title display element
-        title_h1 = soup.find('h1', class_='meditation-title-display')
-        if title_h1:
-            h1_text = title_h1.get_text(strip=True)
-            if is_valid_title(h1_text):
-                return h1_text, 'h1'
+    # Source 1: Check the h1 title display element
+    if is_valid_title(med.title):
+        return med.title, 'h1'
+    
+    # Source 2: Check the content paragraphs
+    # The title may be in the 2nd, 3rd, or 4th <p> if earlier ones are scripture
+    for i, p_text in enumerate(med.paragraphs[:5]):  # Check first 5 paragraphs
+        # Skip scripture readings
+        if looks_like_scripture(p_text):
+            continue
         
-        # Source 2: Check <p> tags in meditation-content div
-        # The title may be in the 2nd, 3rd, or 4th <p> if earlier ones are scripture
-        content_div = soup.find('div', class_='meditation-content')
-        if content_div:
-            paragraphs = content_div.find_all('p')
-            for i, p in enumerate(paragraphs[:5]):  # Check first 5 paragraphs
-                p_text = p.get_text(strip=True)
-                
-                # Skip empty paragraphs
-                if not p_text:
-                    continue
-                
-                # Skip scripture readings
-                if looks_like_scripture(p_text):
-                    continue
-                
-                # Skip occasion labels (like "Liturgy of the Word")
-                if looks_like_occasion(p_text):
-                    continue
-                
-                # Valid title candidate - typically ALL CAPS and short
-                if is_valid_title(p_text):
-                    return p_text, f'p{i+1}'
+        # Skip occasion labels (like "Liturgy of the Word")
+        if looks_like_occasion(p_text):
+            continue
         
-        return None, None
-    except Exception as e:
-        return None, None
+        # Valid title candidate - typically ALL CAPS and short
+        if is_valid_title(p_text):
+            return p_text, f'p{i+1}'
+    
+    return None, None
 
 
-def extract_scripture_from_meditation(filepath):
+def extract_scripture_from_meditation(med):
     """Extract scripture readings - check h1 first, then readings div."""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            soup = BeautifulSoup(f.read(), 'html.parser')
-        
-        # Check h1 - if it looks like scripture, that's our source
-        title_h1 = soup.find('h1', class_='meditation-title-display')
-        if title_h1:
-            h1_text = title_h1.get_text(strip=True)
-            if looks_like_scripture(h1_text):
-                return h1_text
-        
-        # Otherwise check the readings div
-        readings_div = soup.find('div', class_='meditation-readings')
-        if readings_div:
-            return readings_div.get_text(strip=True)
-        
-        return None
-    except:
-        return None
+    # Check h1 - if it looks like scripture, that's our source
+    if looks_like_scripture(med.title):
+        return med.title
+    
+    # Otherwise use the readings div
+    return med.readings or None
 
 
 def build_meditation_data(meditations_dir):
@@ -263,17 +234,18 @@ def build_meditation_data(meditations_dir):
     title_sources = defaultdict(int)
     missing_titles = []
     
-    for html_file in sorted(Path(meditations_dir).glob('*.html')):
-        date_str = html_file.stem  # e.g., "2024-03-31"
+    for med in Corpus.load(meditations_dir):
+        date_str = med.date  # e.g., "2024-03-31"
         
-        title, source = extract_title_from_meditation(html_file)
-        scripture = extract_scripture_from_meditation(html_file)
+        title, source = extract_title_from_meditation(med)
+        scripture = extract_scripture_from_meditation(med)
+        med.unload()
         
         data[date_str] = {
             'title': title,
             'title_source': source,
             'scripture': scripture,
-            'file': html_file.name
+            'file': med.filename
         }
         
         if title:
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Validate every link and anchor across the generated Threads of Grace site.
+
+Each page is scanned once with a single-pass regex tokenizer to build an
+in-memory table of files and the anchor ids they define. Every href/src and
+every fetch() target in inline scripts is then resolved against that table.
+
+Reports:
+- Dangling links (missing files or missing #anchors)
+- Orphan meditations (meditation pages no listing page links to)
+- Duplicate ids within a page
+
+Usage:
+    python validate_site.py [/path/to/website] [--quiet]
+
+Exits with status 1 when any problem is found, so it can run on every build.
+"""
+
+import os
+import re
+import html
+import sys
+import time
+import fnmatch
+from pathlib import Path
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import unquote, urlsplit
+
+# Get the project root (parent of scripts directory)
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+
+# Directories that are not part of the published site
+SKIPPED_DIRS = {'.git', 'node_modules', 'backups', 'scripts', 'Text', 'dist',
+                'threads-of-grace-website', '__pycache__'}
+
+# Attributes that point at another resource
+LINK_ATTRS = {
+    'a': 'href',
+    'link': 'href',
+    'area': 'href',
+    'script': 'src',
+    'img': 'src',
+    'source': 'src',
+    'audio': 'src',
+    'video': 'src',
+    'iframe': 'src',
+    # Year-list placeholders that script.js fills in (regenerate_all_indexes.py)
+    'div': 'data-shard',
+}
+
+# Schemes and prefixes that are never checked
+EXTERNAL_PREFIXES = ('http:', 'https:', 'mailto:', 'tel:', 'javascript:', 'data:', '//')
+
+# fetch('...'), fetch("...") and fetch(`...`) in inline scripts
+FETCH_PATTERN = re.compile(r'''fetch\(\s*(['"`])([^'"`]+)\1''')
+
+MEDITATION_PATTERN = re.compile(r'^meditations/\d{4}-\d{2}-\d{2}\.html$')
+
+
+# Tokenizer: comments, raw <script> bodies, and start/end tags
+TOKEN_PATTERN = re.compile(
+    r'<!--.*?-->'
+    r'|<script\b(?P<script_attrs>[^>]*)>(?P<script_body>.*?)</script\s*>'
+    r'|<(?P<tag>[a-zA-Z][\w-]*)(?P<attrs>(?:[^>"\']|"[^"]*"|\'[^\']*\')*)>',
+    re.DOTALL | re.IGNORECASE,
+)
+ATTR_PATTERN = re.compile(r'([^\s=/>]+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+)))?')
+
+
+def parse_attrs(text):
+    """Parse an attribute string into a dict (lower-cased names, unescaped values)."""
+    attrs = {}
+    for match in ATTR_PATTERN.finditer(text):
+        value = match.group(2)
+        if value is None:
+            value = match.group(3) if match.group(3) is not None else match.group(4) or ''
+        attrs[match.group(1).lower()] = html.unescape(value)
+    return attrs
+
+
+def scan_page(args):
+    """Tokenize one page in a single pass. Runs in a worker process."""
+    root, rel = args
+    with open(os.path.join(root, rel), 'r', encoding='utf-8', errors='replace') as f:
+        text = f.read()
+
+    ids = []
+    links = []
+    line = 1
+    last = 0
+
+    for match in TOKEN_PATTERN.finditer(text):
+        tag = match.group('tag')
+        script_body = match.group('script_body')
+        if tag is None and script_body is None:
+            continue  # comment
+
+        line += text.count('\n', last, match.start())
+        last = match.start()
+
+        if script_body is not None:
+            attrs = parse_attrs(match.group('script_attrs'))
+            if attrs.get('src'):
+                links.append((attrs['src'], line))
+            for fetch in FETCH_PATTERN.finditer(script_body):
+                links.append((fetch.group(2), line + script_body.count('\n', 0, fetch.start())))
+            continue
+
+        tag = tag.lower()
+        attr_name = LINK_ATTRS.get(tag)
+        attr_text = match.group('attrs')
+        # Most tags carry neither a link nor an id - skip parsing their attributes
+        if attr_name is None and 'id' not in attr_text and 'name' not in attr_text:
+            continue
+
+        attrs = parse_attrs(attr_text)
+        if attrs.get('id'):
+            ids.append(attrs['id'])
+        if tag == 'a' and attrs.get('name'):
+            ids.append(attrs['name'])
+        if attr_name and attrs.get(attr_name):
+            links.append((attrs[attr_name], line))
+
+    return rel, ids, links
+
+
+def collect_files(root):
+    """Return every published file, relative to root with forward slashes."""
+    files = set()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIPPED_DIRS and not d.startswith('.')]
+        rel_dir = os.path.relpath(dirpath, root)
+        for filename in filenames:
+            rel = filename if rel_dir == '.' else f'{rel_dir}/{filename}'
+            files.add(rel.replace(os.sep, '/'))
+    return files
+
+
+def resolve_reference(page, ref):
+    """Resolve a reference from a page into (target file, fragment)."""
+    parts = urlsplit(ref)
+    path = unquote(parts.path)
+    fragment = unquote(parts.fragment)
+
+    if not path:
+        return page, fragment
+
+    if path.startswith('/'):
+        target = path.lstrip('/')
+    else:
+        target = os.path.normpath(os.path.join(os.path.dirname(page), path))
+    target = target.replace(os.sep, '/')
+
+    # Directory links serve their index page
+    if path.endswith('/') or target in ('', '.'):
+        target = 'index.html' if target in ('', '.') else f'{target}/index.html'
+
+    return target, fragment
+
+
+def validate(root, workers=None):
+    """Scan the site and return (problems, stats)."""
+    files = collect_files(root)
+    pages = sorted(f for f in files if f.endswith('.html'))
+
+    # Build the anchor table in parallel - tokenizing is the expensive part
+    anchors = {}
+    references = {}
+    duplicates = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for rel, ids, links in pool.map(scan_page, [(str(root), p) for p in pages], chunksize=32):
+            anchors[rel] = set(ids)
+            references[rel] = links
+            for anchor_id, count in Counter(ids).items():
+                if count > 1:
+                    duplicates.append((rel, anchor_id, count))
+
+    dangling = []
+    inbound = defaultdict(set)
+    checked = 0
+
+    for page, links in references.items():
+        for ref, line in links:
+            if ref.startswith(EXTERNAL_PREFIXES):
+                continue
+            checked += 1
+
+            # Template literals in inline scripts, e.g. meditations/${date}.html
+            if '${' in ref:
+                pattern = re.sub(r'\$\{[^}]*\}', '*', ref.split('#')[0])
+                target, _ = resolve_reference(page, pattern)
+                if not fnmatch.filter(files, target):
+                    dangling.append((page, line, ref, 'no file matches template'))
+                continue
+
+            target, fragment = resolve_reference(page, ref)
+            if target not in files:
+                dangling.append((page, line, ref, 'missing file'))
+                continue
+
+            inbound[target].add(page)
+
+            if fragment and target in anchors and fragment not in anchors[target]:
+                dangling.append((page, line, ref, f'missing anchor #{fragment}'))
+
+    # A meditation is an orphan if no page outside meditations/ links to it
+    orphans = sorted(
+        page for page in pages
+        if MEDITATION_PATTERN.match(page)
+        and not any(not src.startswith('meditations/') for src in inbound.get(page, ()))
+    )
+
+    stats = {
+        'files': len(files),
+        'pages': len(pages),
+        'anchors': sum(len(ids) for ids in anchors.values()),
+        'links': checked,
+    }
+    return {'dangling': dangling, 'orphans': orphans, 'duplicates': duplicates}, stats
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith('-')]
+    quiet = '--quiet' in sys.argv or '-q' in sys.argv
+
+    root = Path(args[0]).resolve() if args else PROJECT_ROOT
+    if not root.is_dir():
+        print(f"Error: website directory not found: {root}")
+        return 1
+
+    start = time.perf_counter()
+    problems, stats = validate(root)
+    elapsed = time.perf_counter() - start
+
+    print(f"Checked {stats['links']:,} links across {stats['pages']} pages "
+          f"({stats['anchors']:,} anchors, {stats['files']:,} files) in {elapsed:.2f}s")
+
+    dangling = problems['dangling']
+    orphans = problems['orphans']
+    duplicates = problems['duplicates']
+
+    print(f"\nDangling links:      {len(dangling)}")
+    print(f"Orphan meditations:  {len(orphans)}")
+    print(f"Duplicate ids:       {len(duplicates)}")
+
+    if not quiet:
+        if dangling:
+            print("\n" + "=" * 60)
+            print("DANGLING LINKS:")
+            print("=" * 60)
+            for page, line, ref, reason in sorted(dangling):
+                print(f"  {page}:{line}: {ref}  ({reason})")
+
+        if orphans:
+            print("\n" + "=" * 60)
+            print("ORPHAN MEDITATIONS (not linked from any listing page):")
+            print("=" * 60)
+            for page in orphans:
+                print(f"  {page}")
+
+        if duplicates:
+            print("\n" + "=" * 60)
+            print("DUPLICATE IDS:")
+            print("=" * 60)
+            for page, anchor_id, count in sorted(duplicates):
+                print(f"  {page}: id=\"{anchor_id}\" appears {count} times")
+
+    return 1 if (dangling or orphans or duplicates) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
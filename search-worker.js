@@ -0,0 +1,665 @@
+// Search worker for search.html
+//
+// Loads the search index and ranking models off the UI thread and answers
+// queries. Every query carries an id; a newer id supersedes the query in
+// flight, which stops at its next yield point. Results stream back in
+// ranked batches so the first screenful renders before the rest is sent.
+//
+// Page -> worker:
+//   { type: 'search', id, query, season, year, exact }
+//   { type: 'more-like-this', id, date }
+//   { type: 'snippets', id, dates }         // result cards that came into view
+//   { type: 'cancel', id }
+//
+// Worker -> page:
+//   { type: 'ready', count, years }
+//   { type: 'semantic-ready', dates }
+//   { type: 'results', id, start, total, items, done, correction }
+//   { type: 'snippets', id, snippets }      // date -> highlighted sentence HTML
+//   { type: 'error', message }
+
+let searchIndex = [];
+let currentId = 0;
+
+// Meditations shown per query, and how many go in each message
+const MAX_RESULTS = 100;
+const RESULT_BATCH_SIZE = 20;
+
+// Meditations scored between checks for a newer query
+const SCORE_BLOCK_SIZE = 256;
+
+// BM25F postings (search-bm25.json), loaded with the index
+let bm25Model = null;
+const PREFIX_MATCH_FACTOR = 0.5;
+const PREFIX_EXPANSION_LIMIT = 30;
+
+// Latent-semantic model (search-lsa.json), loaded after the index
+let lsaModel = null;
+const SEMANTIC_THRESHOLD = 0.35;
+const SEMANTIC_WEIGHT = 10;
+
+// Load the search index and postings, then the optional models
+async function loadSearchIndex() {
+    const [indexResponse, bm25Response] = await Promise.all([
+        fetch('search-index.json'),
+        fetch('search-bm25.json')
+    ]);
+    searchIndex = await indexResponse.json();
+    bm25Model = decodeBm25Model(await bm25Response.json());
+
+    const years = [...new Set(searchIndex.map(m => m.year))].sort((a, b) => b - a);
+    postMessage({ type: 'ready', count: searchIndex.length, years });
+
+    loadLsaModel();
+    loadSpellingModel();
+}
+
+const indexLoaded = loadSearchIndex().catch(error => {
+    postMessage({ type: 'error', message: String(error) });
+    throw error;
+});
+
+// Let queued messages (a newer query) run before continuing
+function nextTurn() {
+    return new Promise(resolve => setTimeout(resolve, 0));
+}
+
+// Expand delta-encoded postings into typed arrays, one pair per term
+function decodeBm25Model(model) {
+    const postings = model.postings.map(flat => {
+        const rows = new Uint32Array(flat.length / 2);
+        const weights = new Float32Array(flat.length / 2);
+        for (let i = 0, row = 0; i < rows.length; i++) {
+            row += flat[2 * i];
+            rows[i] = row;
+            weights[i] = flat[2 * i + 1] / model.weightScale;
+        }
+        return { rows, weights };
+    });
+    return {
+        rows: new Map(model.dates.map((date, i) => [date, i])),
+        size: model.dates.length,
+        terms: model.terms,
+        termIds: new Map(model.terms.map((term, i) => [term, i])),
+        stopWords: new Set(model.stopWords),
+        stems: decodeStemTable(model.stems),
+        postings
+    };
+}
+
+// Expand the build's stem table ({stem: "suffix suffix =word"}) into word -> stem
+function decodeStemTable(table) {
+    const stems = new Map();
+    Object.entries(table).forEach(([stem, entries]) => {
+        entries.split(' ').forEach(entry => {
+            stems.set(entry.startsWith('=') ? entry.slice(1) : stem + entry, stem);
+        });
+    });
+    return stems;
+}
+
+// Fold text the way search_tokenizer.fold does: straight quotes, no accents, lower case
+function foldText(text) {
+    return text
+        .replace(/[‘’‛′]/g, "'").replace(/[“”]/g, '"').replace(/[–—]/g, '-')
+        .replace(/æ/g, 'ae').replace(/œ/g, 'oe').replace(/ß/g, 'ss')
+        .normalize('NFKD').replace(/[\u0300-\u036f]/g, '')
+        .toLowerCase();
+}
+
+// Folded words, possessive 's dropped and other apostrophes removed
+function foldedWords(text) {
+    return (foldText(text).match(/[a-z0-9]+(?:'[a-z]+)?/g) || [])
+        .map(word => word.replace(/'s$/, '').replace(/'/g, ''));
+}
+
+function stemWord(word) {
+    return bm25Model.stems.get(word) || word;
+}
+
+// Split a query into stemmed index terms, the same way the build does
+function queryIndexTerms(query) {
+    return foldedWords(query)
+        .filter(w => (w.length > 1 || /\d/.test(w)) && !bm25Model.stopWords.has(w))
+        .map(stemWord);
+}
+
+// Postings for a query term: the exact term, or else the index terms it begins
+function termPostings(term) {
+    const exact = bm25Model.termIds.get(term);
+    if (exact !== undefined) return [[exact, 1]];
+
+    const terms = bm25Model.terms;
+    let lo = 0, hi = terms.length;
+    while (lo < hi) {
+        const mid = (lo + hi) >> 1;
+        if (terms[mid] < term) lo = mid + 1; else hi = mid;
+    }
+    const matches = [];
+    for (let i = lo; i < terms.length && terms[i].startsWith(term) && matches.length < PREFIX_EXPANSION_LIMIT; i++) {
+        matches.push([i, PREFIX_MATCH_FACTOR]);
+    }
+    return matches;
+}
+
+// BM25F score of every meditation: sum of precomputed posting weights
+function bm25Scores(terms) {
+    const scores = new Float32Array(bm25Model.size);
+    terms.forEach(term => {
+        termPostings(term).forEach(([id, factor]) => {
+            const { rows, weights } = bm25Model.postings[id];
+            for (let i = 0; i < rows.length; i++) scores[rows[i]] += weights[i] * factor;
+        });
+    });
+    return scores;
+}
+
+
+// Symmetric-delete spelling dictionary (search-spell.json)
+let spellModel = null;
+
+async function loadSpellingModel() {
+    try {
+        const response = await fetch('search-spell.json');
+        const model = await response.json();
+        const sizes = Uint8Array.from(atob(model.bucketSizes), c => c.charCodeAt(0));
+        const offsets = new Uint32Array(sizes.length + 1);
+        for (let i = 0; i < sizes.length; i++) offsets[i + 1] = offsets[i] + sizes[i];
+        const idBytes = Uint8Array.from(atob(model.bucketWords), c => c.charCodeAt(0));
+        spellModel = {
+            maxDistance: model.maxDistance,
+            prefixLength: model.prefixLength,
+            mask: model.bucketCount - 1,
+            words: model.words,
+            known: new Set(model.words),
+            frequencies: model.frequencies,
+            offsets,
+            ids: new Uint16Array(idBytes.buffer)
+        };
+    } catch (error) {
+        console.error('Error loading spelling dictionary:', error);
+    }
+}
+
+// FNV-1a, reduced to a bucket - must match spelling_bucket() in the build
+function spellingBucket(text) {
+    let h = 0x811c9dc5;
+    for (let i = 0; i < text.length; i++) {
+        h = Math.imul(h ^ text.charCodeAt(i), 0x01000193) >>> 0;
+    }
+    return h & spellModel.mask;
+}
+
+// Optimal string alignment distance, giving up once it exceeds max
+function editDistance(a, b, max) {
+    if (Math.abs(a.length - b.length) > max) return max + 1;
+    let prev2 = null;
+    let prev = Array.from({ length: b.length + 1 }, (_, j) => j);
+    for (let i = 1; i <= a.length; i++) {
+        const row = [i];
+        let best = i;
+        for (let j = 1; j <= b.length; j++) {
+            const cost = a[i - 1] === b[j - 1] ? 0 : 1;
+            let d = Math.min(prev[j] + 1, row[j - 1] + 1, prev[j - 1] + cost);
+            if (prev2 && i > 1 && j > 1 && a[i - 1] === b[j - 2] && a[i - 2] === b[j - 1]) {
+                d = Math.min(d, prev2[j - 2] + 1);
+            }
+            row.push(d);
+            best = Math.min(best, d);
+        }
+        if (best > max) return max + 1;
+        prev2 = prev;
+        prev = row;
+    }
+    return prev[b.length];
+}
+
+// Closest dictionary word (fewest edits, then most frequent), or null
+function correctWord(word) {
+    const { maxDistance, prefixLength, offsets, ids, words, frequencies } = spellModel;
+
+    const deletes = new Set([word.slice(0, prefixLength)]);
+    let frontier = [...deletes];
+    for (let d = 0; d < maxDistance; d++) {
+        const next = [];
+        frontier.forEach(w => {
+            for (let i = 0; i < w.length; i++) {
+                const del = w.slice(0, i) + w.slice(i + 1);
+                if (!deletes.has(del)) { deletes.add(del); next.push(del); }
+            }
+        });
+        frontier = next;
+    }
+
+    const seen = new Set();
+    let best = null, bestDistance = maxDistance + 1, bestFrequency = -1;
+    deletes.forEach(del => {
+        const bucket = spellingBucket(del);
+        for (let k = offsets[bucket]; k < offsets[bucket + 1]; k++) {
+            const id = ids[k];
+            if (seen.has(id)) continue;
+            seen.add(id);
+            const distance = editDistance(word, words[id], bestDistance);
+            if (distance < bestDistance || (distance === bestDistance && frequencies[id] > bestFrequency)) {
+                best = words[id];
+                bestDistance = distance;
+                bestFrequency = frequencies[id];
+            }
+        }
+    });
+    return bestDistance <= maxDistance ? best : null;
+}
+
+// Replace words the index has never seen with their closest correction
+function correctQuery(query) {
+    return query.replace(/[^\s"]+/g, token => {
+        const words = foldedWords(token);
+        if (words.length !== 1) return token;
+        const word = words[0];
+        if (word.length < 3 || /\d/.test(word) || bm25Model.stopWords.has(word)
+            || spellModel.known.has(word) || bm25Model.termIds.has(stemWord(word))) {
+            return token;
+        }
+        return correctWord(word) || token;
+    });
+}
+
+// Positional postings (search-positions.json), loaded the first time a phrase or NEAR query runs
+let positionModel = null;
+let positionModelLoading = null;
+
+function loadPositionModel() {
+    if (!positionModelLoading) {
+        positionModelLoading = fetch('search-positions.json')
+            .then(response => response.json())
+            .then(model => { positionModel = { positions: model.positions, decoded: new Map() }; })
+            .catch(error => console.error('Error loading positional postings:', error));
+    }
+    return positionModelLoading;
+}
+
+// Row -> sorted positions for one index term, decoded on first use
+function termPositions(termId) {
+    let decoded = positionModel.decoded.get(termId);
+    if (decoded) return decoded;
+
+    decoded = new Map();
+    const flat = positionModel.positions[termId];
+    const rows = bm25Model.postings[termId].rows;
+    for (let i = 0, k = 0; k < rows.length; k++) {
+        const count = flat[i++];
+        const list = new Array(count);
+        for (let j = 0, pos = 0; j < count; j++) {
+            pos += flat[i++];
+            list[j] = pos;
+        }
+        decoded.set(rows[k], list);
+    }
+    positionModel.decoded.set(termId, decoded);
+    return decoded;
+}
+
+// Index terms of a query fragment with their word offsets (stop words counted, not kept)
+function termsWithOffsets(text) {
+    const result = [];
+    foldedWords(text).forEach((word, offset) => {
+        if ((word.length > 1 || /\d/.test(word)) && !bm25Model.stopWords.has(word)) {
+            result.push({ term: stemWord(word), offset });
+        }
+    });
+    return result;
+}
+
+// Split a query into "quoted phrases", NEAR/n pairs and free words
+function parseQuery(query) {
+    const items = [];
+    const pattern = /"([^"]*)"?|(\S+)/g;
+    let match;
+    while ((match = pattern.exec(query.replace(/[“”]/g, '"'))) !== null) {
+        if (match[1] !== undefined) {
+            items.push({ type: 'phrase', terms: termsWithOffsets(match[1]) });
+        } else if (/^near\/\d+$/i.test(match[2])) {
+            items.push({ type: 'near', distance: parseInt(match[2].slice(5), 10) });
+        } else {
+            items.push({ type: 'word', terms: termsWithOffsets(match[2]) });
+        }
+    }
+
+    const phrases = items
+        .filter(item => item.type === 'phrase' && item.terms.length > 1)
+        .map(item => item.terms);
+    const near = [];
+    items.forEach((item, i) => {
+        if (item.type !== 'near') return;
+        const left = items[i - 1], right = items[i + 1];
+        if (left && right && left.terms && right.terms && left.terms.length && right.terms.length) {
+            near.push({
+                a: left.terms[left.terms.length - 1].term,
+                b: right.terms[0].term,
+                distance: item.distance
+            });
+        }
+    });
+    const terms = items.filter(item => item.terms).flatMap(item => item.terms.map(t => t.term));
+    return { terms, phrases, near };
+}
+
+// True if the phrase's terms occur at their relative offsets in a meditation
+function matchesPhrase(row, phrase) {
+    const lists = [];
+    for (const { term } of phrase) {
+        const id = bm25Model.termIds.get(term);
+        const positions = id === undefined ? null : termPositions(id).get(row);
+        if (!positions) return false;
+        lists.push(positions);
+    }
+    return lists[0].some(pos => {
+        const start = pos - phrase[0].offset;
+        return phrase.every(({ offset }, i) => i === 0 || lists[i].includes(start + offset));
+    });
+}
+
+// True if two terms occur within distance words of each other, in either order
+function matchesNear(row, { a, b, distance }) {
+    const idA = bm25Model.termIds.get(a), idB = bm25Model.termIds.get(b);
+    if (idA === undefined || idB === undefined) return false;
+    const listA = termPositions(idA).get(row), listB = termPositions(idB).get(row);
+    if (!listA || !listB) return false;
+    for (let i = 0, j = 0; i < listA.length && j < listB.length;) {
+        if (Math.abs(listA[i] - listB[j]) <= distance) return true;
+        if (listA[i] < listB[j]) i++; else j++;
+    }
+    return false;
+}
+
+// Rows satisfying every phrase and NEAR clause, starting from the first clause's postings
+function clauseRows(parsed) {
+    const clauses = [
+        ...parsed.phrases.map(phrase => row => matchesPhrase(row, phrase)),
+        ...parsed.near.map(pair => row => matchesNear(row, pair))
+    ];
+    const firstTerm = parsed.phrases.length ? parsed.phrases[0][0].term : parsed.near[0].a;
+    const id = bm25Model.termIds.get(firstTerm);
+    const rows = new Set();
+    if (id === undefined) return rows;
+    termPositions(id).forEach((_, row) => {
+        if (clauses.every(clause => clause(row))) rows.add(row);
+    });
+    return rows;
+}
+
+
+// Every sentence of each meditation, with its terms, for snippets
+// (search-snippets/YYYY.json), loaded per year on demand - only for the
+// result cards the page reports in view
+const snippetShards = new Map();
+
+// The query whose result cards may ask for snippets
+let snippetQuery = { id: 0, terms: [] };
+
+function loadSnippetShard(year) {
+    if (!snippetShards.has(year)) {
+        snippetShards.set(year, fetch(`search-snippets/${year}.json`)
+            .then(response => response.json())
+            .catch(error => {
+                console.error(`Error loading snippets for ${year}:`, error);
+                snippetShards.delete(year);
+                return {};
+            }));
+    }
+    return snippetShards.get(year);
+}
+
+// The sentence sharing the most query terms (prefix matches count), or null
+function bestSentence(entry, queryTerms) {
+    let best = -1, bestScore = 0;
+    entry.terms.forEach((terms, i) => {
+        const sentenceTerms = terms.split(' ');
+        const score = queryTerms.filter(q => sentenceTerms.some(t => t.startsWith(q))).length;
+        if (score > bestScore) {
+            best = i;
+            bestScore = score;
+        }
+    });
+    return best < 0 ? null : entry.sentences[best];
+}
+
+// Post the best-matching sentence of each listed result, one message per year as its shard arrives
+function sendSnippets(id, dates, queryTerms) {
+    if (!queryTerms.length) return;
+    const years = [...new Set(dates.map(date => date.slice(0, 4)))];
+    years.forEach(year => loadSnippetShard(year).then(shard => {
+        if (id !== currentId) return;
+        const snippets = {};
+        dates.forEach(date => {
+            if (!date.startsWith(year) || !shard[date]) return;
+            const sentence = bestSentence(shard[date], queryTerms);
+            if (sentence) snippets[date] = highlightTerms(escapeHtml(sentence), queryTerms);
+        });
+        postMessage({ type: 'snippets', id, snippets });
+    }));
+}
+
+function escapeHtml(text) {
+    return text.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;').replace(/"/g, '&quot;');
+}
+
+// Decode a base64 string into an Int8Array
+function decodeInt8(base64) {
+    const binary = atob(base64);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+    return new Int8Array(bytes.buffer);
+}
+
+// Load the semantic model; literal search keeps working without it
+async function loadLsaModel() {
+    try {
+        const response = await fetch('search-lsa.json');
+        const model = await response.json();
+        lsaModel = {
+            dimensions: model.dimensions,
+            rows: new Map(model.dates.map((date, i) => [date, i])),
+            docScales: Float32Array.from(model.docScales),
+            docVectors: decodeInt8(model.docVectors),
+            terms: new Map(model.terms.map((term, i) => [term, i])),
+            termWeights: Float32Array.from(model.termWeights),
+            termVectors: decodeInt8(model.termVectors)
+        };
+        postMessage({ type: 'semantic-ready', dates: model.dates });
+    } catch (error) {
+        console.error('Error loading semantic model:', error);
+    }
+}
+
+// Project a query into the latent space: IDF-weighted sum of its term vectors
+function queryVector(query) {
+    const k = lsaModel.dimensions;
+    const vector = new Float32Array(k);
+    let matched = 0;
+    for (const word of queryIndexTerms(query)) {
+        const t = lsaModel.terms.get(word);
+        if (t === undefined) continue;
+        const weight = lsaModel.termWeights[t];
+        const offset = t * k;
+        for (let j = 0; j < k; j++) vector[j] += weight * lsaModel.termVectors[offset + j];
+        matched++;
+    }
+    return matched ? vector : null;
+}
+
+// Latent vector of an indexed meditation
+function documentVector(date) {
+    const row = lsaModel.rows.get(date);
+    if (row === undefined) return null;
+    const k = lsaModel.dimensions;
+    const scale = lsaModel.docScales[row];
+    const vector = new Float32Array(k);
+    for (let j = 0; j < k; j++) vector[j] = scale * lsaModel.docVectors[row * k + j];
+    return vector;
+}
+
+// Cosine similarity of every meditation to a latent vector (document rows are unit length)
+function semanticScores(vector) {
+    const k = lsaModel.dimensions;
+    const { docVectors, docScales } = lsaModel;
+    let norm = 0;
+    for (let j = 0; j < k; j++) norm += vector[j] * vector[j];
+    norm = Math.sqrt(norm) || 1;
+
+    const scores = new Float32Array(docScales.length);
+    for (let i = 0, offset = 0; i < scores.length; i++, offset += k) {
+        let dot = 0;
+        for (let j = 0; j < k; j++) dot += docVectors[offset + j] * vector[j];
+        scores[i] = dot * docScales[i] / norm;
+    }
+    return scores;
+}
+
+// Highlight words whose stem matches (or begins with) a query term
+function highlightTerms(text, terms) {
+    if (!terms.length) return text;
+
+    return text.replace(/[\p{L}\p{N}'’]+/gu, word => {
+        const stem = stemWord(foldedWords(word)[0] || '');
+        return stem && terms.some(term => stem.startsWith(term)) ? `<mark>${word}</mark>` : word;
+    });
+}
+
+
+// Rank meditations for a query, then stream them back
+async function search({ id, query, season, year, exact }) {
+    if (id !== currentId) return;
+    let correction = null;
+
+    // Auto-correct misspelled words unless the reader asked for the exact query
+    if (query && spellModel && !exact) {
+        const corrected = correctQuery(query);
+        if (corrected !== query) {
+            correction = { original: query, corrected };
+            query = corrected;
+        }
+    }
+
+    let candidates = searchIndex;
+
+    // Apply filters
+    if (season) {
+        candidates = candidates.filter(m => m.season === season);
+    }
+
+    if (year) {
+        candidates = candidates.filter(m => m.year === parseInt(year));
+    }
+
+    if (!query) {
+        await sendResults(id, candidates, [], correction);
+        return;
+    }
+
+    // Apply text search
+    const parsed = parseQuery(query);
+    const lexical = bm25Scores(parsed.terms);
+
+    // Quoted phrases and NEAR/n restrict results to meditations that satisfy them
+    let required = null;
+    if (parsed.phrases.length || parsed.near.length) {
+        await loadPositionModel();
+        if (id !== currentId) return;
+        if (positionModel) required = clauseRows(parsed);
+    }
+
+    const latentQuery = lsaModel ? queryVector(query) : null;
+    const semantic = latentQuery ? semanticScores(latentQuery) : null;
+
+    const scored = [];
+    for (let start = 0; start < candidates.length; start += SCORE_BLOCK_SIZE) {
+        if (start) {
+            await nextTurn();
+            if (id !== currentId) return;
+        }
+        candidates.slice(start, start + SCORE_BLOCK_SIZE).forEach(meditation => {
+            const bm25Row = bm25Model.rows.get(meditation.date);
+            if (required && !required.has(bm25Row)) return;
+            let score = bm25Row === undefined ? 0 : lexical[bm25Row];
+
+            // Meditations close in meaning rank even without a literal match
+            if (semantic) {
+                const row = lsaModel.rows.get(meditation.date);
+                const similarity = row === undefined ? 0 : semantic[row];
+                if (similarity >= SEMANTIC_THRESHOLD) score += similarity * SEMANTIC_WEIGHT;
+            }
+
+            if (score > 0) scored.push({ meditation, score });
+        });
+    }
+    scored.sort((a, b) => b.score - a.score);
+
+    await sendResults(id, scored.map(s => s.meditation), [...new Set(queryIndexTerms(query))], correction);
+}
+
+// The meditations closest in meaning to one being read
+async function moreLikeThis({ id, date }) {
+    if (id !== currentId) return;
+    const vector = lsaModel && documentVector(date);
+    if (!vector) {
+        await sendResults(id, [], [], null);
+        return;
+    }
+
+    const scores = semanticScores(vector);
+    const results = searchIndex
+        .filter(m => m.date !== date && lsaModel.rows.has(m.date))
+        .map(m => ({ meditation: m, score: scores[lsaModel.rows.get(m.date)] }))
+        .sort((a, b) => b.score - a.score)
+        .slice(0, 20)
+        .map(s => s.meditation);
+
+    await sendResults(id, results, [], null);
+}
+
+// What the page needs to draw one result card
+function resultItem(meditation, queryTerms) {
+    return {
+        date: meditation.date,
+        displayDate: meditation.displayDate,
+        title: meditation.title,
+        occasion: meditation.occasion,
+        excerpt: highlightTerms(meditation.excerpt || '', queryTerms),
+        keywords: meditation.keywords,
+        teachers: meditation.teachers
+    };
+}
+
+// Post ranked results in batches (always at least one); snippets follow as
+// the page asks for them
+async function sendResults(id, ranked, queryTerms, correction) {
+    const shown = ranked.slice(0, MAX_RESULTS);
+    snippetQuery = { id, terms: queryTerms };
+    for (let start = 0; start === 0 || start < shown.length; start += RESULT_BATCH_SIZE) {
+        if (start) {
+            await nextTurn();
+            if (id !== currentId) return;
+        }
+        postMessage({
+            type: 'results',
+            id,
+            start,
+            total: ranked.length,
+            items: shown.slice(start, start + RESULT_BATCH_SIZE).map(m => resultItem(m, queryTerms)),
+            done: start + RESULT_BATCH_SIZE >= shown.length,
+            correction: start === 0 ? correction : null
+        });
+    }
+}
+
+self.onmessage = ({ data }) => {
+    currentId = data.id;
+    if (data.type === 'search') {
+        indexLoaded.then(() => search(data));
+    } else if (data.type === 'more-like-this') {
+        indexLoaded.then(() => moreLikeThis(data));
+    } else if (data.type === 'snippets' && data.id === snippetQuery.id) {
+        sendSnippets(data.id, data.dates, snippetQuery.terms);
+    }
+};
@@ -0,0 +1,212 @@
+// Generated by scripts/build_service_worker.py - do not edit
+// Hash of the precache manifest
+const VERSION = '105bb8942f';
+const PRECACHE = {
+    "index.html": "7424e340f7",
+    "search.html": "6567a347b1",
+    "chronological.html": "3ea7f8028f",
+    "by-year.html": "9f4cd45161",
+    "by-season.html": "1a5ebb13c5",
+    "title-index.html": "8e4c651077",
+    "script.45e5d4cc1d.js": "45e5d4cc1d",
+    "search-index.88b6d79efb.json": "88b6d79efb",
+    "search-bm25.ec89b0bc20.json": "ec89b0bc20",
+    "search-spell.30cb34fa9f.json": "30cb34fa9f",
+    "search-suggest.c115243284.json": "c115243284",
+    "search-worker.3ff5a3cd2e.js": "3ff5a3cd2e",
+    "css/base-page.2ec4897aff.css": "2ec4897aff",
+    "css/listing-page.14f738f3e9.css": "14f738f3e9",
+    "css/meditation-page.84bb322d98.css": "84bb322d98",
+    "css/search-page.17405c4982.css": "17405c4982",
+    "fonts/fonts.6e0e3acf44.css": "6e0e3acf44",
+    "fonts/cormorant-garamond-300.2e7b0b6c40.woff2": "2e7b0b6c40",
+    "fonts/cormorant-garamond-300i.b3f3b8d01f.woff2": "b3f3b8d01f",
+    "fonts/cormorant-garamond-400.7056c1c97c.woff2": "7056c1c97c",
+    "fonts/cormorant-garamond-400i.1b35173b1e.woff2": "1b35173b1e",
+    "fonts/cormorant-garamond-600.d13f53accd.woff2": "d13f53accd",
+    "fonts/crimson-pro-300.f2e260e413.woff2": "f2e260e413",
+    "fonts/crimson-pro-300i.bb430358d5.woff2": "bb430358d5",
+    "fonts/crimson-pro-400.f820d0dfeb.woff2": "f820d0dfeb",
+    "fonts/crimson-pro-400i.b2eb060052.woff2": "b2eb060052",
+    "fonts/crimson-pro-600.0b395169d0.woff2": "0b395169d0",
+    "listings/2007.html": "59ae28599a",
+    "listings/2008.html": "79f5e24168",
+    "listings/2009.html": "7746e88a26",
+    "listings/2010.html": "580a876826",
+    "listings/2011.html": "0bf725774d",
+    "listings/2012.html": "4f5e8cedf6",
+    "listings/2013.html": "8f587b8a17",
+    "listings/2014.html": "95f050f20b",
+    "listings/2015.html": "db1f60bc75",
+    "listings/2016.html": "5e7c59cc17",
+    "listings/2017.html": "5b65afe3ea",
+    "listings/2018.html": "bb6cf43e35",
+    "listings/2019.html": "fa107fb6e9",
+    "listings/2020.html": "073a0da84c",
+    "listings/2021.html": "22154f9045",
+    "listings/2022.html": "44575d016d",
+    "listings/2023.html": "74dea0fec6",
+    "ordinary-time.html": "0a3bc6cca7",
+    "meditations/2023-11-19.html": "8434750dc7",
+    "meditations/2023-11-12.html": "3f38745a45",
+    "meditations/2023-11-05.html": "3e0c7375cc",
+    "meditations/2023-10-29.html": "163f1eee99",
+    "meditations/2023-10-22.html": "77a15b3fde",
+    "meditations/2023-10-15.html": "76beb1a881",
+    "meditations/2023-10-08.html": "eceffc789d",
+    "meditations/2023-10-01.html": "2d58b7946c",
+    "meditations/2023-09-24.html": "54c71907db",
+    "meditations/2023-09-17.html": "0e06afeae2",
+    "meditations/2023-09-10.html": "7c5fa6c21a",
+    "meditations/2023-09-03.html": "07498c1608",
+    "meditations/2023-08-27.html": "f14806fb8a",
+    "meditations/2023-08-20.html": "6857ae4879",
+    "meditations/2023-08-13.html": "90ae866407",
+    "meditations/2023-07-30.html": "7f8de1b7e2",
+    "meditations/2023-07-23.html": "9e4f190fbc",
+    "meditations/2023-07-16.html": "3a81e21c98",
+    "meditations/2023-07-09.html": "f63aa41648",
+    "meditations/2023-07-02.html": "97b3423bbc",
+    "meditations/2023-06-25.html": "da92241e9c",
+    "meditations/2023-06-18.html": "48a678317e",
+    "meditations/2023-06-11.html": "7e2bc9bbf4",
+    "meditations/2023-06-04.html": "d3ca32497a",
+    "meditations/2023-05-28.html": "a5da08a399",
+    "meditations/2022-11-20.html": "3104a50a62",
+    "meditations/2022-11-13.html": "8f4b8a7f00",
+    "meditations/2022-11-06.html": "08b168623c",
+    "meditations/2022-10-30.html": "d6e6242b75",
+    "meditations/2022-10-23.html": "a4043fd843",
+    "meditations/2022-10-02.html": "efe00064c8",
+    "meditations/2022-09-25.html": "e196e274d7",
+    "meditations/2022-09-18.html": "786d07fd39",
+    "meditations/2022-09-11.html": "b765e4c4d9",
+    "meditations/2022-09-04.html": "9fdd530743",
+    "meditations/2022-08-28.html": "f861a7dc75",
+    "meditations/2022-08-21.html": "5dfdbf067b",
+    "meditations/2022-08-14.html": "fd93ced49f",
+    "meditations/2022-08-07.html": "cc3aa302b6",
+    "meditations/2022-07-31.html": "cbb980bc3e",
+    "meditations/2022-07-24.html": "7e12bcd208",
+    "meditations/2022-07-17.html": "c3cb38482e",
+    "meditations/2022-07-10.html": "356e2e762b",
+    "meditations/2022-07-03.html": "64c00b96f3",
+    "meditations/2022-06-26.html": "530e080e26",
+    "meditations/2022-06-19.html": "82121da310",
+    "meditations/2022-06-12.html": "c5e380c2d9",
+    "meditations/2022-06-05.html": "4f67f1c324",
+    "meditations/2021-11-14.html": "db24e50f43",
+    "meditations/2021-11-07.html": "56e5337539",
+    "meditations/2021-10-31.html": "3ebfb6f8ba",
+    "meditations/2021-10-24.html": "5669abe730",
+    "meditations/2021-10-17.html": "ca54021c0f",
+    "meditations/2021-10-10.html": "e00b92cb7c",
+    "meditations/2021-10-03.html": "9298a69048",
+    "meditations/2021-09-26.html": "775fe1e8c6",
+    "meditations/2021-09-19.html": "056102adba",
+    "meditations/2021-09-12.html": "59b46a4254",
+    "meditations/2021-09-05.html": "4830f7a306",
+    "meditations/2021-08-29.html": "6be1b1d0ae"
+};
+const PRECACHE_NAME = 'threads-of-grace-precache';
+const RUNTIME_NAME = 'threads-of-grace-runtime';
+const MAX_RUNTIME_ENTRIES = 300;
+
+// Content-hashed names (styles.2f4bf8cbc6.css, css/, fonts/) never change
+const HASHED = /\.[0-9a-f]{10}\.\w+$/;
+
+const scope = new URL(self.registration.scope);
+
+// Each precached file is stored under its hash, so a new manifest only
+// fetches the files that changed
+function cacheKey(path, revision) {
+    return new URL(`${path}?rev=${revision}`, scope).href;
+}
+
+self.addEventListener('install', event => {
+    event.waitUntil(caches.open(PRECACHE_NAME).then(cache =>
+        Promise.all(Object.entries(PRECACHE).map(([path, revision]) => {
+            const key = cacheKey(path, revision);
+            return cache.match(key).then(hit => hit || fetch(new URL(path, scope), { cache: 'reload' })
+                .then(response => {
+                    if (!response.ok) throw new Error(`${path}: ${response.status}`);
+                    return cache.put(key, response);
+                }));
+        }))
+    ).then(() => self.skipWaiting()));
+});
+
+self.addEventListener('activate', event => {
+    const current = new Set(Object.entries(PRECACHE).map(([path, revision]) => cacheKey(path, revision)));
+    event.waitUntil(caches.open(PRECACHE_NAME)
+        .then(cache => cache.keys().then(requests => Promise.all(
+            requests.filter(request => !current.has(request.url)).map(request => cache.delete(request))
+        )))
+        .then(() => self.clients.claim()));
+});
+
+function trimRuntime(cache) {
+    return cache.keys().then(requests => Promise.all(
+        requests.slice(0, Math.max(requests.length - MAX_RUNTIME_ENTRIES, 0)).map(request => cache.delete(request))
+    ));
+}
+
+function storeRuntime(request, response) {
+    // Partial (range) and error responses cannot be replayed
+    if (response.status !== 200) return;
+    const copy = response.clone();
+    caches.open(RUNTIME_NAME).then(cache => cache.put(request, copy).then(() => trimRuntime(cache)));
+}
+
+function offlineResponse(request) {
+    if (request.mode !== 'navigate') return Response.error();
+    return new Response(
+        '<!DOCTYPE html><meta charset="utf-8"><meta name="viewport" content="width=device-width, initial-scale=1">' +
+        '<title>Offline | Threads of Grace</title>' +
+        '<p style="font-family: serif; text-align: center; margin: 4rem 1rem">' +
+        'This page has not been saved for offline reading. ' +
+        `<a href="${new URL('index.html', scope).href}">Return to Home</a></p>`,
+        { status: 503, headers: { 'Content-Type': 'text/html; charset=utf-8' } }
+    );
+}
+
+function cacheFirst(request) {
+    return caches.open(RUNTIME_NAME).then(cache => cache.match(request)).then(hit => hit || fetch(request)
+        .then(response => {
+            storeRuntime(request, response);
+            return response;
+        })
+        .catch(() => offlineResponse(request)));
+}
+
+function networkFirst(request) {
+    return fetch(request)
+        .then(response => {
+            storeRuntime(request, response);
+            return response;
+        })
+        .catch(() => caches.open(RUNTIME_NAME)
+            .then(cache => cache.match(request))
+            .then(hit => hit || offlineResponse(request)));
+}
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    const url = new URL(request.url);
+    if (request.method !== 'GET' || url.origin !== scope.origin || !url.pathname.startsWith(scope.pathname)) return;
+    if (request.headers.has('range')) return;
+
+    let path = decodeURIComponent(url.pathname.slice(scope.pathname.length));
+    if (path === '' || path.endsWith('/')) path += 'index.html';
+
+    const revision = PRECACHE[path];
+    if (revision) {
+        event.respondWith(caches.open(PRECACHE_NAME)
+            .then(cache => cache.match(cacheKey(path, revision)))
+            .then(hit => hit || networkFirst(request)));
+    } else if (HASHED.test(path)) {
+        event.respondWith(cacheFirst(request));
+    } else {
+        event.respondWith(networkFirst(request));
+    }
+});